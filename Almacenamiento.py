@@ -0,0 +1,305 @@
+import numpy as np
+
+# ==== ALMACENAMIENTO DE CLIENTES ====
+
+class AlmacenClientes:
+    """_summary_
+    Clase que representa el almacenamiento de los clientes del gimnasio, un array de NumPy que crece duplicando su capacidad
+    cuando se llena y que reutiliza las posiciones liberadas al eliminar clientes.
+
+    Atributos:
+        __capacidad (int): Numero de posiciones reservadas en el array.
+        __clientes (np.ndarray): Array que almacena los objetos Cliente, las posiciones libres contienen None.
+        __usadas (int): Numero de posiciones que han sido ocupadas alguna vez (las siguientes nunca se han usado).
+        __libres (list): Pila de posiciones liberadas disponibles para reutilizar.
+        __total (int): Numero de clientes almacenados.
+    """
+    def __init__(self, capacidad_inicial: int = 50):
+        self.__capacidad = max(1, capacidad_inicial)
+        self.__clientes = np.full(self.__capacidad, None, dtype=object)
+        self.__usadas = 0
+        self.__libres = []
+        self.__total = 0
+
+    # Métodos de acceso
+
+    def get_capacidad(self):
+        return self.__capacidad
+
+    def get_total(self):
+        return self.__total
+
+    def __len__(self):
+        return self.__total
+
+    def __getitem__(self, posicion: int):
+        return self.__clientes[posicion]
+
+    def __iter__(self):
+        """Recorre los clientes almacenados en orden de posicion, omitiendo las posiciones libres."""
+        for posicion in range(self.__usadas):
+            cliente = self.__clientes[posicion]
+            if cliente is not None:
+                yield cliente
+
+    # Métodos
+
+    def __crecer(self, minimo: int = 0):
+        """Duplica la capacidad del array (o la amplia hasta el minimo dado) copiando los clientes a uno nuevo."""
+        nueva_capacidad = max(self.__capacidad * 2, minimo)
+        nuevos_clientes = np.full(nueva_capacidad, None, dtype=object)
+        nuevos_clientes[:self.__capacidad] = self.__clientes
+        self.__clientes = nuevos_clientes
+        self.__capacidad = nueva_capacidad
+
+    def agregar(self, cliente):
+        """_summary_
+            Guarda un cliente en una posicion libre en O(1) amortizado.
+            Primero se reutilizan las posiciones liberadas, luego las nunca usadas y si no hay espacio se duplica la capacidad.
+        Args:
+            cliente (Cliente): Objeto Cliente a guardar.
+        Returns:
+            int: Posicion en la que se guardo el cliente.
+        """
+        if self.__libres:
+            posicion = self.__libres.pop()
+        else:
+            if self.__usadas >= self.__capacidad:
+                self.__crecer()
+            posicion = self.__usadas
+            self.__usadas += 1
+
+        self.__clientes[posicion] = cliente
+        self.__total += 1
+        return posicion
+
+    def agregar_lote(self, clientes: list):
+        """_summary_
+            Guarda varios clientes de una vez: ocupa primero las posiciones liberadas y el resto en un solo bloque
+            de posiciones nunca usadas, ampliando la capacidad una sola vez si hace falta.
+        Args:
+            clientes (list): Lista de objetos Cliente a guardar.
+        Returns:
+            list: Posiciones en las que se guardo cada cliente, en el mismo orden.
+        """
+        reusadas = min(len(self.__libres), len(clientes))
+        posiciones = [self.__libres.pop() for _ in range(reusadas)]
+        for posicion, cliente in zip(posiciones, clientes):
+            self.__clientes[posicion] = cliente
+        
+        restantes = len(clientes) - reusadas
+        if restantes:
+            inicio = self.__usadas
+            if inicio + restantes > self.__capacidad:
+                self.__crecer(inicio + restantes)
+            bloque = np.empty(restantes, dtype=object) # Array intermedio para que NumPy no intente desempacar los objetos
+            bloque[:] = clientes[reusadas:]
+            self.__clientes[inicio:inicio + restantes] = bloque
+            self.__usadas += restantes
+            posiciones.extend(range(inicio, inicio + restantes))
+        
+        self.__total += len(clientes)
+        return posiciones
+
+    def eliminar(self, posicion: int):
+        """_summary_
+            Libera la posicion dada para que pueda ser reutilizada.
+        Args:
+            posicion (int): Posicion del cliente a eliminar.
+        Returns:
+            Cliente: Objeto Cliente eliminado o None si la posicion ya estaba libre.
+        """
+        cliente = self.__clientes[posicion]
+        if cliente is None:
+            return None
+        self.__clientes[posicion] = None
+        self.__libres.append(posicion)
+        self.__total -= 1
+        return cliente
+
+
+# ==== TABLA COLUMNAR DE CLIENTES Y MEMBRESIAS ====
+
+class TablaClientes:
+    """_summary_
+    Clase que representa los datos de clientes y membresías en columnas de NumPy, una fila por cada posicion del AlmacenClientes.
+    Permite responder preguntas sobre todos los clientes con una sola expresion vectorizada en lugar de recorrer los objetos.
+    Las fechas se guardan como datetime64[D] y las membresías inexistentes tienen fechas NaT.
+
+    Atributos:
+        __capacidad (int): Numero de filas reservadas.
+        __usadas (int): Numero de filas que han sido ocupadas alguna vez.
+        __activos (np.ndarray): bool, True si la fila tiene un cliente registrado.
+        __ids (np.ndarray): int64, ID del cliente.
+        __documentos (np.ndarray): object, Documento del cliente.
+        __fechas_registro (np.ndarray): datetime64[D], Fecha de registro del cliente.
+        __tiene_membresia (np.ndarray): bool, True si el cliente tiene membresía.
+        __pagos (np.ndarray): bool, Estado de pago de la membresía.
+        __fechas_inicio (np.ndarray): datetime64[D], Fecha de inicio de la membresía.
+        __fechas_fin (np.ndarray): datetime64[D], Fecha de fin de la membresía.
+    """
+    def __init__(self, capacidad_inicial: int = 50):
+        self.__capacidad = 0
+        self.__usadas = 0
+        self.__activos = np.zeros(0, dtype=bool)
+        self.__ids = np.zeros(0, dtype=np.int64)
+        self.__documentos = np.full(0, None, dtype=object)
+        self.__fechas_registro = np.full(0, np.datetime64("NaT"), dtype="datetime64[D]")
+        self.__tiene_membresia = np.zeros(0, dtype=bool)
+        self.__pagos = np.zeros(0, dtype=bool)
+        self.__fechas_inicio = np.full(0, np.datetime64("NaT"), dtype="datetime64[D]")
+        self.__fechas_fin = np.full(0, np.datetime64("NaT"), dtype="datetime64[D]")
+        self.asegurar_capacidad(max(1, capacidad_inicial))
+
+    # Métodos de acceso, retornan vistas de las filas usadas
+
+    def get_activos(self):
+        return self.__activos[:self.__usadas]
+
+    def get_ids(self):
+        return self.__ids[:self.__usadas]
+
+    def get_documentos(self):
+        return self.__documentos[:self.__usadas]
+
+    def get_fechas_registro(self):
+        return self.__fechas_registro[:self.__usadas]
+
+    def get_tiene_membresia(self):
+        return self.__tiene_membresia[:self.__usadas]
+
+    def get_pagos(self):
+        return self.__pagos[:self.__usadas]
+
+    def get_fechas_inicio(self):
+        return self.__fechas_inicio[:self.__usadas]
+
+    def get_fechas_fin(self):
+        return self.__fechas_fin[:self.__usadas]
+
+    # Métodos
+
+    def asegurar_capacidad(self, capacidad: int):
+        """Amplia todas las columnas (duplicando) hasta tener al menos la capacidad dada."""
+        if capacidad <= self.__capacidad:
+            return
+        nueva_capacidad = max(capacidad, self.__capacidad * 2)
+
+        def ampliar(columna, relleno):
+            nueva = np.full(nueva_capacidad, relleno, dtype=columna.dtype)
+            nueva[:self.__capacidad] = columna
+            return nueva
+
+        sin_fecha = np.datetime64("NaT")
+        self.__activos = ampliar(self.__activos, False)
+        self.__ids = ampliar(self.__ids, 0)
+        self.__documentos = ampliar(self.__documentos, None)
+        self.__fechas_registro = ampliar(self.__fechas_registro, sin_fecha)
+        self.__tiene_membresia = ampliar(self.__tiene_membresia, False)
+        self.__pagos = ampliar(self.__pagos, False)
+        self.__fechas_inicio = ampliar(self.__fechas_inicio, sin_fecha)
+        self.__fechas_fin = ampliar(self.__fechas_fin, sin_fecha)
+        self.__capacidad = nueva_capacidad
+
+    def guardar_cliente(self, posicion: int, cliente):
+        """Copia los datos del Cliente y de su membresía a la fila de la posicion dada."""
+        self.asegurar_capacidad(posicion + 1)
+        self.__usadas = max(self.__usadas, posicion + 1)
+        self.__activos[posicion] = True
+        self.__ids[posicion] = cliente.get_id_cliente()
+        self.__documentos[posicion] = cliente.get_documento()
+        self.__fechas_registro[posicion] = np.datetime64(cliente.get_fecha_registro(), "D")
+        self.guardar_membresia(posicion, cliente.get_membresia())
+
+    def guardar_clientes(self, posiciones: list, clientes: list):
+        """Copia los datos de varios Clientes (sin membresía) a sus filas con una asignacion por columna."""
+        if not posiciones:
+            return
+        filas = np.asarray(posiciones, dtype=np.int64)
+        self.asegurar_capacidad(int(filas.max()) + 1)
+        self.__usadas = max(self.__usadas, int(filas.max()) + 1)
+        self.__activos[filas] = True
+        self.__ids[filas] = [cliente.get_id_cliente() for cliente in clientes]
+        documentos = np.empty(len(clientes), dtype=object)
+        documentos[:] = [cliente.get_documento() for cliente in clientes]
+        self.__documentos[filas] = documentos
+        self.__fechas_registro[filas] = np.array([cliente.get_fecha_registro() for cliente in clientes], dtype="datetime64[D]")
+        self.__tiene_membresia[filas] = False
+        self.__pagos[filas] = False
+        self.__fechas_inicio[filas] = np.datetime64("NaT")
+        self.__fechas_fin[filas] = np.datetime64("NaT")
+
+    def guardar_membresia(self, posicion: int, membresia=None):
+        """Copia los datos de la Membresia a la fila de la posicion dada, o la deja sin membresía si es None."""
+        if membresia is None:
+            self.__tiene_membresia[posicion] = False
+            self.__pagos[posicion] = False
+            self.__fechas_inicio[posicion] = np.datetime64("NaT")
+            self.__fechas_fin[posicion] = np.datetime64("NaT")
+        else:
+            self.__tiene_membresia[posicion] = True
+            self.__pagos[posicion] = membresia.get_pago()
+            self.__fechas_inicio[posicion] = membresia.get_fecha_inicio_obj()
+            self.__fechas_fin[posicion] = membresia.get_fecha_fin_obj()
+
+    def guardar_membresias(self, posiciones: list, pagos: list, fechas_inicio: list, fechas_fin: list):
+        """Copia los datos de varias membresías (fechas como str 'YYYY-MM-DD') a sus filas con una asignacion por columna."""
+        if not posiciones:
+            return
+        filas = np.asarray(posiciones, dtype=np.int64)
+        self.__tiene_membresia[filas] = True
+        self.__pagos[filas] = pagos
+        self.__fechas_inicio[filas] = np.array(fechas_inicio, dtype="datetime64[D]")
+        self.__fechas_fin[filas] = np.array(fechas_fin, dtype="datetime64[D]")
+
+    def eliminar(self, posicion: int):
+        """Marca la fila como libre y borra sus datos."""
+        self.__activos[posicion] = False
+        self.__ids[posicion] = 0
+        self.__documentos[posicion] = None
+        self.__fechas_registro[posicion] = np.datetime64("NaT")
+        self.guardar_membresia(posicion, None)
+
+    def vencen_entre(self, desde, hasta, solo_pagas: bool = False):
+        """_summary_
+            Mascara de las membresías cuya fecha de fin está entre desde y hasta (incluidas).
+        Args:
+            desde (date | str | np.datetime64): Fecha inicial.
+            hasta (date | str | np.datetime64): Fecha final.
+            solo_pagas (bool, optional): Si es True solo se incluyen las membresías pagadas. Defaults to False.
+        Returns:
+            np.ndarray: Mascara booleana sobre las filas usadas.
+        """
+        fechas_fin = self.get_fechas_fin()
+        mascara = self.get_tiene_membresia() & (fechas_fin >= np.datetime64(desde, "D")) & (fechas_fin <= np.datetime64(hasta, "D"))
+        if solo_pagas:
+            mascara &= self.get_pagos()
+        return mascara
+
+    def clasificar_membresias(self, hoy):
+        """_summary_
+            Clasifica todas las filas segun el estado de su membresía en una sola pasada vectorizada.
+            Usa las mismas reglas que el seguimiento de membresías: vencidas (< 0 días), por vencer (≤ 7 días)
+            y en deuda (sin pagar con más de 7 días restantes).
+        Args:
+            hoy (date | str | np.datetime64): Fecha con la que se calculan los días restantes.
+        Returns:
+            dict: Arrays de posiciones 'sin_membresia', 'en_deuda', 'por_vencer' y 'vencidas',
+                y 'dias_restantes' con los días restantes de cada fila usada (0 en filas sin membresía).
+        """
+        activos = self.get_activos()
+        con_membresia = activos & self.get_tiene_membresia()
+        # NaT - fecha da NaT, por eso se rellenan con 0 las filas sin membresía
+        dias_restantes = np.where(con_membresia, (self.get_fechas_fin() - np.datetime64(hoy, "D")).astype(np.int64), 0)
+
+        vencidas = con_membresia & (dias_restantes < 0)
+        por_vencer = con_membresia & (dias_restantes >= 0) & (dias_restantes <= 7)
+        en_deuda = con_membresia & (dias_restantes > 7) & ~self.get_pagos()
+
+        return {
+            "sin_membresia": np.flatnonzero(activos & ~con_membresia),
+            "en_deuda": np.flatnonzero(en_deuda),
+            "por_vencer": np.flatnonzero(por_vencer),
+            "vencidas": np.flatnonzero(vencidas),
+            "dias_restantes": dias_restantes,
+        }
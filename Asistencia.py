@@ -0,0 +1,297 @@
+import json
+import os
+from datetime import date, timedelta
+
+import numpy as np
+
+from Caja import DIAS_SEMANA
+from Lectores import TAMANO_BUFFER, _fecha_hora
+from Registros import SUFIJO_RESUMEN, interpretar_resumen
+
+# ==== ASISTENCIA POR DÍA DE LA SEMANA Y HORA ====
+# Un rango de fechas se resume con un np.bincount sobre la clave día de la semana * 24 + hora de cada grupo de entradas.
+# El día de la semana sale del calendario: el ordinal 1 (0001-01-01) fue lunes.
+
+
+def contar_entradas(ruta: str, desde: int = 0):
+    """_summary_
+        Cuenta las lineas completas de un archivo de entradas a partir del byte dado, agrupadas por fecha, hora y tipo.
+        Acepta las mismas lineas que Lectores.interpretar_entrada cuya fecha existe en el calendario (no 2025-02-30),
+        pero cada fecha y cada hora distinta se interpreta una sola vez.
+    Args:
+        ruta (str): Ruta del archivo de entradas.
+        desde (int, optional): Byte donde empieza una linea. Defaults to 0.
+    Returns:
+        tuple: (grupos {(fecha 'YYYY-MM-DD', hora, tipo): cantidad}, byte donde termina la ultima linea completa, lineas malformadas).
+    """
+    grupos = {}
+    malformadas = 0
+    fechas_validas = {} # 'YYYY-MM-DD' -> True si la fecha existe
+    horas_del_dia = {} # 'HH:MM:SS' -> hora
+    with open(ruta, "rb", buffering=TAMANO_BUFFER) as archivo:
+        archivo.seek(desde)
+        for linea in archivo:
+            if not linea.endswith(b"\n"):
+                break # Linea incompleta, se cuenta cuando termine de escribirse
+            desde += len(linea)
+            linea = linea.decode("utf-8", "replace")
+            fecha, hora = linea[:10], linea[11:19]
+            if fecha not in fechas_validas or hora not in horas_del_dia or linea[10:11] != ";" or linea[19:20] != ";":
+                try:
+                    año, mes, dia, segundos = _fecha_hora(linea)
+                except ValueError:
+                    malformadas += 1
+                    continue
+                try:
+                    date(año, mes, dia)
+                    fechas_validas[fecha] = True
+                except ValueError:
+                    fechas_validas[fecha] = False
+                horas_del_dia[hora] = segundos // 3600
+            campos = linea[20:].rstrip("\r\n").split(";")
+            if len(campos) < 5 or not fechas_validas[fecha]:
+                malformadas += 1
+                continue
+            clave = (fecha, horas_del_dia[hora], campos[4])
+            grupos[clave] = grupos.get(clave, 0) + 1
+    return grupos, desde, malformadas
+
+
+def histograma_semanal(ordinales, horas, cantidades):
+    """_summary_
+        Cuenta entradas por día de la semana del calendario y hora con un solo np.bincount.
+    Args:
+        ordinales (list | np.ndarray): Ordinal de la fecha de cada grupo de entradas.
+        horas (list | np.ndarray): Hora de cada grupo (0 a 23).
+        cantidades (list | np.ndarray): Numero de entradas de cada grupo.
+    Returns:
+        np.ndarray: Matriz de 7 x 24 enteros, filas de lunes a domingo y columnas de las 0 a las 23 horas.
+    """
+    claves = (np.asarray(ordinales, dtype=np.int64) - 1) % 7 * 24 + np.asarray(horas, dtype=np.int64)
+    return np.bincount(claves, weights=np.asarray(cantidades, dtype=np.int64), minlength=7 * 24).astype(np.int64).reshape(7, 24)
+
+
+def resumen_histograma(histograma):
+    """_summary_
+        Resume una matriz de histograma() en totales.
+    Returns:
+        dict: 'total', 'por_dia_semana' (nombre del día -> entradas, los 7 días) y
+            'por_hora' ('HH' -> entradas, solo las horas con entradas y en orden de hora).
+    """
+    por_hora = histograma.sum(axis=0)
+    return {
+        "total": int(histograma.sum()),
+        "por_dia_semana": dict(zip(DIAS_SEMANA, histograma.sum(axis=1).tolist())),
+        "por_hora": {f"{hora:02d}": int(por_hora[hora]) for hora in np.flatnonzero(por_hora).tolist()},
+    }
+
+
+# ==== CUBO DE ASISTENCIA ====
+
+class CuboAsistencia:
+    """_summary_
+    Clase que representa el cubo de asistencia: el numero de entradas por fecha, hora y tipo (General, IngresoUnico).
+    Se actualiza con cada entrada registrada, asi los reportes de un día o un mes leen unas pocas celdas
+    en lugar de recorrer 'registros/Entradas.txt'. Se guarda en un archivo JSON ('registros/Entradas.cubo.json')
+    con el tamaño en bytes de cada archivo de entradas que ya incluye (como Caja.AgregadosCaja): si un archivo creció
+    desde entonces solo se leen sus bytes nuevos, si el archivo del cubo no existe, está dañado o algun archivo de entradas
+    es más pequeño o desapareció, se reconstruye desde el registro original y los resumenes de los meses compactados.
+
+    Atributos:
+        __ruta (str): Ruta del archivo JSON del cubo.
+        __bytes_registros (dict): Ruta de cada archivo de entradas -> bytes ya incluidos en el cubo.
+        __dias (dict): 'YYYY-MM-DD' -> {hora: {tipo: cantidad}}.
+        __malformadas (int): Lineas omitidas por no tener el formato de Entradas.txt desde que se cargó.
+        __cargado (bool): True despues de cargar el cubo, antes las entradas agregadas se ignoran.
+    """
+    def __init__(self, ruta: str):
+        self.__ruta = ruta
+        self.__bytes_registros = {}
+        self.__dias = {}
+        self.__malformadas = 0
+        self.__cargado = False
+
+    # Métodos de acceso
+
+    def get_ruta(self):
+        return self.__ruta
+
+    def get_cargado(self):
+        return self.__cargado
+
+    def get_malformadas(self):
+        return self.__malformadas
+
+    def __len__(self):
+        return sum(cantidad for horas in self.__dias.values() for tipos in horas.values() for cantidad in tipos.values())
+
+    # Métodos
+
+    def agregar(self, fecha: str, hora: int, tipo: str, cantidad: int = 1):
+        """_summary_
+            Suma una entrada (o un grupo de cantidad entradas) a su celda en O(1). Si el cubo no está cargado no hace nada,
+            la entrada se lee del archivo de entradas al cargarlo.
+        Args:
+            fecha (str): Fecha 'YYYY-MM-DD' de la entrada.
+            hora (int): Hora de la entrada (0 a 23).
+            tipo (str): Tipo de la entrada ('General', 'IngresoUnico').
+            cantidad (int, optional): Numero de entradas. Defaults to 1.
+        """
+        if not self.__cargado:
+            return
+        tipos = self.__dias.setdefault(fecha, {}).setdefault(hora, {})
+        tipos[tipo] = tipos.get(tipo, 0) + cantidad
+
+    def __leer_registro(self, ruta_registro: str, desde: int):
+        # Suma las lineas del archivo a partir del byte dado y retorna el tamaño leido,
+        # los resumenes de meses compactados ('.resumen.txt') suman cada grupo con su cantidad
+        if not ruta_registro.endswith(SUFIJO_RESUMEN):
+            grupos, desde, malformadas = contar_entradas(ruta_registro, desde)
+            self.__malformadas += malformadas
+            for (fecha, hora, tipo), cantidad in grupos.items():
+                self.agregar(fecha, hora, tipo, cantidad)
+            return desde
+        with open(ruta_registro, "rb") as archivo:
+            archivo.seek(desde)
+            for linea in archivo:
+                if not linea.endswith(b"\n"):
+                    break # Linea incompleta, se vuelve a leer cuando termine de escribirse
+                grupo = interpretar_resumen(linea.decode("utf-8"))
+                if grupo is None:
+                    self.__malformadas += 1
+                else:
+                    self.agregar(grupo[0], grupo[1], grupo[2], grupo[3])
+                desde += len(linea)
+        return desde
+
+    def __poner_al_dia(self, rutas_registros: list):
+        for ruta_registro in rutas_registros:
+            if os.path.exists(ruta_registro):
+                leidos = self.__bytes_registros.get(ruta_registro, 0)
+                if leidos < os.path.getsize(ruta_registro):
+                    self.__bytes_registros[ruta_registro] = self.__leer_registro(ruta_registro, leidos)
+
+    def cargar(self, rutas_registros):
+        """_summary_
+            Carga el cubo desde su archivo y lo pone al día con los archivos de entradas.
+            Quien escriba en los archivos de entradas debe llevar sus lineas pendientes al disco antes.
+        Args:
+            rutas_registros (list): Rutas de los resumenes de los meses compactados y del archivo de entradas.
+        Returns:
+            str: 'cargado' si estaba al día, 'actualizado' si se leyeron lineas nuevas o 'reconstruido'.
+        """
+        tamanos = {ruta: os.path.getsize(ruta) for ruta in rutas_registros if os.path.exists(ruta)}
+        estado = "reconstruido"
+        self.__cargado = True
+        self.__malformadas = 0
+        try:
+            with open(self.__ruta, "r", encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+            bytes_registros = datos["bytes_registros"]
+            if all(ruta in tamanos and leidos <= tamanos[ruta] for ruta, leidos in bytes_registros.items()):
+                self.__bytes_registros = bytes_registros
+                self.__dias = {fecha: {int(hora): tipos for hora, tipos in horas.items()} for fecha, horas in datos["dias"].items()}
+                al_dia = all(self.__bytes_registros.get(ruta, 0) == tamano for ruta, tamano in tamanos.items())
+                estado = "cargado" if al_dia else "actualizado"
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass # Archivo inexistente o dañado, se reconstruye
+
+        if estado == "reconstruido":
+            self.__bytes_registros = {}
+            self.__dias = {}
+        self.__poner_al_dia(list(rutas_registros))
+        if estado != "cargado":
+            self.guardar()
+        return estado
+
+    def reconstruir(self, rutas_registros):
+        """Descarta el cubo y lo calcula de nuevo leyendo todos los archivos de entradas, retorna el numero de entradas."""
+        self.__cargado = True
+        self.__malformadas = 0
+        self.__bytes_registros = {}
+        self.__dias = {}
+        self.__poner_al_dia(list(rutas_registros))
+        self.guardar()
+        return len(self)
+
+    def guardar(self, rutas_registros=None):
+        """_summary_
+            Guarda el cubo en su archivo, reemplazandolo de forma atomica.
+        Args:
+            rutas_registros (list, optional): Archivos de entradas cuyo tamaño actual ya está incluido en el cubo,
+                se dan despues de escribir al disco las entradas agregadas con agregar(). Defaults to None (los ultimos tamaños conocidos).
+        """
+        if not self.__cargado:
+            return # Sin cargar no tiene las entradas del archivo, guardarlo las perdería
+        for ruta_registro in rutas_registros or ():
+            if os.path.exists(ruta_registro):
+                self.__bytes_registros[ruta_registro] = os.path.getsize(ruta_registro)
+        carpeta = os.path.dirname(self.__ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        temporal = self.__ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump({"bytes_registros": self.__bytes_registros, "dias": self.__dias}, archivo)
+        os.replace(temporal, self.__ruta)
+
+    def meses(self):
+        """Retorna la lista ordenada de tuplas (año, mes) que tienen entradas."""
+        return sorted({(int(fecha[:4]), int(fecha[5:7])) for fecha in self.__dias})
+
+    def resumen_dia(self, fecha: str):
+        """_summary_
+            Resume las entradas de un día leyendo solo sus celdas.
+        Args:
+            fecha (str): Fecha 'YYYY-MM-DD'.
+        Returns:
+            dict: 'total', 'por_tipo' (tipo -> entradas) y 'por_hora' ('HH' -> entradas, en orden de hora).
+        """
+        por_tipo = {}
+        por_hora = {}
+        for hora, tipos in sorted(self.__dias.get(fecha, {}).items()):
+            por_hora[f"{hora:02d}"] = sum(tipos.values())
+            for tipo, cantidad in tipos.items():
+                por_tipo[tipo] = por_tipo.get(tipo, 0) + cantidad
+        return {"total": sum(por_hora.values()), "por_tipo": por_tipo, "por_hora": por_hora}
+
+    def histograma(self, desde: date = None, hasta: date = None, tipo: str = None):
+        """_summary_
+            Cuenta las entradas por día de la semana del calendario y hora con histograma_semanal, solo con las celdas de los días del rango.
+        Args:
+            desde (date, optional): Primera fecha incluida, None deja el extremo abierto. Defaults to None.
+            hasta (date, optional): Ultima fecha incluida, None deja el extremo abierto. Defaults to None.
+            tipo (str, optional): Solo las entradas de este tipo ('General', 'IngresoUnico'). Defaults to None (todas).
+        Returns:
+            np.ndarray: Matriz de 7 x 24 enteros, filas de lunes a domingo y columnas de las 0 a las 23 horas.
+        """
+        if desde is not None and hasta is not None and (hasta - desde).days < len(self.__dias):
+            fechas = [(desde + timedelta(days=dia)).isoformat() for dia in range((hasta - desde).days + 1)]
+        else:
+            inicio = "" if desde is None else desde.isoformat()
+            fin = "9999-12-31" if hasta is None else hasta.isoformat()
+            fechas = [fecha for fecha in self.__dias if inicio <= fecha <= fin]
+
+        ordinales, horas, cantidades = [], [], []
+        for fecha in fechas:
+            if fecha not in self.__dias:
+                continue
+            try:
+                ordinal = date.fromisoformat(fecha).toordinal()
+            except ValueError:
+                continue # Fecha que no existe en un resumen editado a mano
+            for hora, tipos in self.__dias[fecha].items():
+                if 0 <= hora < 24:
+                    ordinales.append(ordinal)
+                    horas.append(hora)
+                    cantidades.append(sum(tipos.values()) if tipo is None else tipos.get(tipo, 0))
+        return histograma_semanal(ordinales, horas, cantidades)
+
+
+# Un solo CuboAsistencia por archivo, compartido por todos los que registran entradas
+_cubos = {}
+
+def cubo_asistencia(ruta: str):
+    """Retorna el CuboAsistencia compartido del archivo, creandolo con el primer uso (sin cargar)."""
+    if ruta not in _cubos:
+        _cubos[ruta] = CuboAsistencia(ruta)
+    return _cubos[ruta]
@@ -0,0 +1,717 @@
+"""
+Benchmarks del Sistema de Gimnasio 3Stars Solutions
+Se ejecutan con: python Benchmarks.py
+"""
+import os
+import random
+import shutil
+import string
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import Utils as ut
+import Caja
+import Lectores
+from Almacenamiento import AlmacenClientes
+from Indices import IndiceNombres
+from Registros import IndiceFechas, EscritorEnCola
+from Historico import HistoricoRegistros
+from Asistencia import CuboAsistencia
+from Ocupacion import OcupacionGimnasio
+from Gimnasios import Gimnasio
+from Errores import ErrorGimnasio
+from Clientes import Cliente, Membresia
+from Sesiones import Entrenador, SesionEspecial
+
+# ===== UTILIDADES =====
+
+def medir(funcion, *args):
+    # Retorna el tiempo en segundos que tarda en ejecutarse la funcion
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+def imprimir_tabla(titulo: str, encabezados: list, filas: list):
+    print(f"\n=== {titulo} ===")
+    print(" | ".join(f"{encabezado:>14}" for encabezado in encabezados))
+    for fila in filas:
+        print(" | ".join(f"{valor:>14}" for valor in fila))
+
+# ===== ALMACEN DE CLIENTES =====
+
+def benchmark_almacen_clientes(tamanos=(1_000, 10_000, 100_000, 1_000_000)):
+    """_summary_
+        Mide el costo por insercion del AlmacenClientes desde 1k hasta 1M clientes,
+        y el costo de reinsertar en las posiciones liberadas por eliminaciones.
+        Se inserta siempre el mismo objeto para medir solo el costo del almacen y no la creacion de Clientes.
+    """
+    cliente = object()
+    filas = []
+    for n in tamanos:
+        almacen = AlmacenClientes()
+        segundos = medir(lambda: [almacen.agregar(cliente) for _ in range(n)])
+
+        # Liberamos la mitad de las posiciones y las volvemos a ocupar
+        mitad = n // 2
+        for posicion in range(0, n, 2):
+            almacen.eliminar(posicion)
+        segundos_reuso = medir(lambda: [almacen.agregar(cliente) for _ in range(mitad)])
+
+        filas.append([f"{n:,}", f"{segundos*1000:.1f} ms", f"{segundos/n*1e9:.0f} ns", f"{segundos_reuso/mitad*1e9:.0f} ns", f"{almacen.get_capacidad():,}"])
+
+    imprimir_tabla("Inserción en AlmacenClientes", ["Clientes", "Total", "Por inserción", "Reuso libre", "Capacidad"], filas)
+
+
+# ===== BUSQUEDA POR PREFIJO =====
+
+def nombres_aleatorios(n: int, semilla: int = 28):
+    # Nombres de 4 a 10 letras minusculas, reproducibles con la semilla
+    generador = random.Random(semilla)
+    return ["".join(generador.choices(string.ascii_lowercase, k=generador.randint(4, 10))) for _ in range(n)]
+
+def benchmark_indice_nombres(n: int = 100_000, consultas: int = 10_000):
+    """_summary_
+        Mide la construccion del IndiceNombres con n nombres y el tiempo de consulta por prefijo
+        (primera pagina de 20 resultados) comparado con recorrer todos los nombres.
+    """
+    nombres = nombres_aleatorios(n)
+    indice = IndiceNombres()
+    segundos_construccion = medir(lambda: [indice.agregar(nombre, id_cliente) for id_cliente, nombre in enumerate(nombres, 1)])
+    print(f"\nIndiceNombres con {n:,} nombres construido en {segundos_construccion*1000:.1f} ms ({segundos_construccion/n*1e6:.2f} µs por nombre)")
+
+    generador = random.Random(3)
+    filas = []
+    for largo in (1, 2, 3):
+        prefijos = [nombre[:largo] for nombre in generador.choices(nombres, k=consultas)]
+        total = sum(indice.contar(prefijo) for prefijo in prefijos)
+        segundos = medir(lambda: [indice.buscar(prefijo) for prefijo in prefijos])
+        segundos_lineal = medir(lambda: [[nombre for nombre in nombres if nombre.startswith(prefijo)][:20] for prefijo in prefijos[:20]]) / 20 * consultas
+        filas.append([largo, f"{total/consultas:,.0f}", f"{segundos/consultas*1e6:.2f} µs", f"{segundos_lineal/consultas*1e3:.2f} ms"])
+
+    imprimir_tabla(f"Búsqueda por prefijo ({n:,} nombres)", ["Largo prefijo", "Coincidencias", "Indice", "Recorrido"], filas)
+
+
+# ===== SEGUIMIENTO DE MEMBRESIAS =====
+
+def gimnasio_con_clientes(n: int, semilla: int = 28):
+    """Crea un Gimnasio con n clientes, el 90% con membresía iniciada en los ultimos 60 dias y pagada la mitad de las veces."""
+    generador = random.Random(semilla)
+    gimnasio = Gimnasio("Benchmark", "Sin direccion", "0", "bench@gym.com")
+    hoy = ut.hoy()
+    for documento, nombre in enumerate(nombres_aleatorios(n, semilla), 1):
+        cliente = gimnasio.registrar_cliente(nombre, str(documento), fecha_registro="2025-01-01")
+        if generador.random() < 0.9:
+            inicio = hoy - timedelta(days=generador.randint(0, 60))
+            gimnasio.registrar_membresia(cliente, inicio.strftime("%Y-%m-%d"), pago=generador.random() < 0.5)
+    return gimnasio
+
+def benchmark_clasificacion_membresias(n: int = 100_000):
+    """_summary_
+        Compara la clasificacion vectorizada de membresías con el recorrido por objetos llamando calcular_dias_restantes.
+    """
+    gimnasio = gimnasio_con_clientes(n)
+    clientes = list(gimnasio.get()[0])
+
+    def recorrido():
+        for cliente in clientes:
+            membresia = cliente.get_membresia()
+            if membresia is not None:
+                membresia.calcular_dias_restantes()
+
+    segundos_recorrido = medir(recorrido)
+    segundos_vectorizado = medir(gimnasio.clasificar_membresias)
+    imprimir_tabla(f"Clasificación de membresías ({n:,} clientes)", ["Método", "Tiempo"], [
+        ["Recorrido", f"{segundos_recorrido*1000:.1f} ms"],
+        ["Vectorizado", f"{segundos_vectorizado*1000:.1f} ms"],
+    ])
+
+# ===== CARGA DE CLIENTES POR LOTES =====
+
+def benchmark_registro_lote(n: int = 100_000):
+    """_summary_
+        Compara registrar n clientes uno por uno con registrar_cliente contra un solo registrar_clientes_lote.
+        El 1% de los registros repite un documento para medir tambien el descarte de duplicados.
+    """
+    nombres = nombres_aleatorios(n)
+    registros = [(nombre, str(i % (n - n // 100) + 1), None, "2025-01-01") for i, nombre in enumerate(nombres)]
+
+    def uno_por_uno():
+        gimnasio = Gimnasio("Benchmark", "Sin direccion", "0", "bench@gym.com")
+        for registro in registros:
+            try:
+                gimnasio.registrar_cliente(*registro)
+            except ErrorGimnasio:
+                pass
+
+    gimnasio = Gimnasio("Benchmark", "Sin direccion", "0", "bench@gym.com")
+    segundos_uno = medir(uno_por_uno)
+    segundos_lote = medir(gimnasio.registrar_clientes_lote, registros)
+    imprimir_tabla(f"Registro de clientes ({n:,} registros)", ["Método", "Tiempo", "Por cliente"], [
+        ["Uno por uno", f"{segundos_uno*1000:.0f} ms", f"{segundos_uno/n*1e6:.2f} µs"],
+        ["Lote", f"{segundos_lote*1000:.0f} ms", f"{segundos_lote/n*1e6:.2f} µs"],
+    ])
+
+
+# ===== LIBRO DE CAJA BINARIO =====
+
+def caja_aleatoria(ruta: str, n: int, semilla: int = 28):
+    """Escribe un Caja.txt de n ingresos repartidos en los ultimos dos años, con el formato real (fecha;hora;tipo;50,000.0)."""
+    generador = random.Random(semilla)
+    hoy = ut.hoy()
+    tipos = [("PagoMembresia", 50000.0), ("Membresia", 50000.0), ("PagoIngresoUnico", 8000.0), ("Ingreso", 12500.5)]
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for _ in range(n):
+            fecha = hoy - timedelta(days=generador.randint(0, 730))
+            tipo, monto = generador.choice(tipos)
+            archivo.write(f"{fecha:%Y-%m-%d};{generador.randint(6, 21):02d}:{generador.randint(0, 59):02d}:00;{tipo};{monto:,}\n")
+
+def benchmark_caja_binaria(n: int = 1_000_000):
+    """_summary_
+        Compara el resumen de un mes leyendo Caja.txt linea por linea con el mismo resumen sobre Caja.bin mapeado en memoria.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_texto = os.path.join(carpeta, "Caja.txt")
+    ruta_binaria = os.path.join(carpeta, "Caja.bin")
+    caja_aleatoria(ruta_texto, n)
+    mes = ut.hoy() - timedelta(days=30)
+
+    def resumen_texto():
+        total = 0.0
+        with open(ruta_texto, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                datos = linea.strip().split(";")
+                partes_fecha = datos[0].split("-")
+                if int(partes_fecha[0]) == mes.year and int(partes_fecha[1]) == mes.month:
+                    total += float(datos[3].replace(",", ""))
+        return total
+
+    def resumen_binario():
+        return Caja.resumen_mes(Caja.leer_caja_binaria(ruta_binaria), Caja.TiposCaja(ruta_binaria + ".tipos"), mes.year, mes.month)
+
+    segundos_conversion = medir(Caja.convertir_caja_a_binario, ruta_texto, ruta_binaria)
+    imprimir_tabla(f"Resumen de un mes ({n:,} ingresos)", ["Método", "Tiempo", "Archivo"], [
+        ["Caja.txt", f"{medir(resumen_texto)*1000:.0f} ms", f"{os.path.getsize(ruta_texto)/2**20:.1f} MiB"],
+        ["Caja.bin", f"{medir(resumen_binario)*1000:.0f} ms", f"{os.path.getsize(ruta_binaria)/2**20:.1f} MiB"],
+        ["Conversión", f"{segundos_conversion*1000:.0f} ms", ""],
+    ])
+    shutil.rmtree(carpeta)
+
+
+def benchmark_agregados_caja(n: int = 1_000_000):
+    """_summary_
+        Mide la reconstruccion de los agregados de la caja desde Caja.txt y el tiempo de un resumen de mes y de día ya agregados.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_texto = os.path.join(carpeta, "Caja.txt")
+    caja_aleatoria(ruta_texto, n)
+    mes = ut.hoy() - timedelta(days=30)
+
+    agregados = Caja.AgregadosCaja(os.path.join(carpeta, "Caja.agregados.json"))
+    segundos_reconstruccion = medir(agregados.cargar, ruta_texto)
+    segundos_carga = medir(Caja.AgregadosCaja(os.path.join(carpeta, "Caja.agregados.json")).cargar, ruta_texto)
+    consultas = 10_000
+    segundos_mes = medir(lambda: [agregados.resumen_mes(mes.year, mes.month) for _ in range(consultas)]) / consultas
+    segundos_dia = medir(lambda: [agregados.resumen_dia(mes) for _ in range(consultas)]) / consultas
+    imprimir_tabla(f"Agregados de caja ({n:,} ingresos)", ["Operación", "Tiempo"], [
+        ["Reconstrucción", f"{segundos_reconstruccion*1000:.0f} ms"],
+        ["Carga al día", f"{segundos_carga*1000:.1f} ms"],
+        ["Resumen mes", f"{segundos_mes*1e6:.1f} µs"],
+        ["Resumen día", f"{segundos_dia*1e6:.1f} µs"],
+    ])
+    shutil.rmtree(carpeta)
+
+def benchmark_caja_por_meses(n: int = 1_000_000):
+    """_summary_
+        Compara el resumen de un mes leyendo todo Caja.txt con leer solo el archivo del mes en el libro por meses,
+        y mide la migracion de un solo archivo a archivos mensuales.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_texto = os.path.join(carpeta, "Caja.txt")
+    caja_aleatoria(ruta_texto, n)
+    mes = ut.hoy() - timedelta(days=30)
+    segundos_migracion = medir(Caja.migrar_caja_a_meses, ruta_texto, os.path.join(carpeta, "caja"))
+    libro = Caja.CajaPorMeses(os.path.join(carpeta, "caja"))
+
+    def centavos_del_mes(rutas):
+        centavos = 0
+        for ruta in rutas:
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                for linea in archivo:
+                    registro = Caja.interpretar_linea(linea)
+                    if registro is not None and registro[0][:7] == f"{mes:%Y-%m}":
+                        centavos += registro[3]
+        return centavos
+
+    imprimir_tabla(f"Resumen de un mes ({n:,} ingresos, {len(libro.meses())} meses)", ["Libro", "Tiempo"], [
+        ["Un archivo", f"{medir(centavos_del_mes, [ruta_texto + Caja.SUFIJO_MIGRADO])*1000:.0f} ms"],
+        ["Por meses", f"{medir(centavos_del_mes, libro.rutas([(mes.year, mes.month)]))*1000:.0f} ms"],
+        ["Migración", f"{segundos_migracion*1000:.0f} ms"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+def benchmark_indice_fechas(n: int = 1_000_000):
+    """_summary_
+        Compara leer las lineas de un día recorriendo todo el archivo con saltar a ellas con el IndiceFechas.
+        El archivo se escribe en orden de fecha, como crecen los registros reales.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_texto = os.path.join(carpeta, "Caja.txt")
+    caja_aleatoria(ruta_texto, n)
+    with open(ruta_texto, "r", encoding="utf-8") as archivo:
+        lineas = sorted(archivo)
+    with open(ruta_texto, "w", encoding="utf-8") as archivo:
+        archivo.writelines(lineas)
+    fecha = f"{ut.hoy() - timedelta(days=30):%Y-%m-%d}"
+
+    def recorrido():
+        with open(ruta_texto, "r", encoding="utf-8") as archivo:
+            return [linea for linea in archivo if linea.startswith(fecha)]
+
+    indice = IndiceFechas(ruta_texto)
+    segundos_construccion = medir(indice.actualizar)
+    consultas = 100
+    segundos_indice = medir(lambda: [indice.lineas(fecha) for _ in range(consultas)]) / consultas
+    imprimir_tabla(f"Líneas de un día ({n:,} ingresos)", ["Método", "Tiempo"], [
+        ["Recorrido", f"{medir(recorrido)*1000:.0f} ms"],
+        ["Indice", f"{segundos_indice*1000:.2f} ms"],
+        ["Construcción", f"{segundos_construccion*1000:.0f} ms"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+# ===== LECTURA EN UNA PASADA =====
+
+def entradas_aleatorias(ruta: str, n: int, semilla: int = 28):
+    """Escribe un Entradas.txt de n entradas repartidas en los ultimos dos años, con el formato real (fecha;hora;id;documento;nombre;membresía;tipo)."""
+    generador = random.Random(semilla)
+    hoy = ut.hoy()
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for _ in range(n):
+            fecha = hoy - timedelta(days=generador.randint(0, 730))
+            id_cliente = generador.randint(1, 5000)
+            tipo = generador.choice(["General", "IngresoUnico"])
+            archivo.write(f"{fecha:%Y-%m-%d};{generador.randint(6, 21):02d}:{generador.randint(0, 59):02d}:00;{id_cliente};{1000000 + id_cliente};Cliente {id_cliente};True;{tipo}\n")
+
+def benchmark_lectores(n: int = 1_000_000):
+    """_summary_
+        Mide en MB/s el analisis financiero y el informe de entradas leyendo los archivos como antes
+        (una pasada con strptime para los meses y otra con split("-") para el mes) contra una sola pasada de Lectores.
+        Se agregan algunas lineas malformadas para comprobar que se omiten y se cuentan.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_caja = os.path.join(carpeta, "Caja.txt")
+    ruta_entradas = os.path.join(carpeta, "Entradas.txt")
+    caja_aleatoria(ruta_caja, n)
+    entradas_aleatorias(ruta_entradas, n)
+    for ruta in (ruta_caja, ruta_entradas):
+        with open(ruta, "a", encoding="utf-8") as archivo:
+            archivo.write("2025-13-01;10:00:00;Ingreso;100\nlinea dañada\n2025-06-01;10:00;Ingreso;abc\n")
+    mes = ut.hoy() - timedelta(days=30)
+
+    def caja_antes():
+        meses = set()
+        with open(ruta_caja, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                datos = linea.strip().split(";")
+                try:
+                    fecha_obj = datetime.strptime(datos[0], "%Y-%m-%d").date()
+                except ValueError:
+                    continue
+                meses.add((fecha_obj.year, fecha_obj.month))
+        total = 0.0
+        with open(ruta_caja, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                datos = linea.strip().split(";")
+                partes_fecha = datos[0].split("-")
+                try:
+                    if int(partes_fecha[0]) == mes.year and int(partes_fecha[1]) == mes.month:
+                        total += float(datos[3].replace(",", ""))
+                except (ValueError, IndexError):
+                    continue
+        return sorted(meses), total
+
+    def entradas_antes():
+        meses = set()
+        with open(ruta_entradas, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                datos = linea.strip().split(";")
+                if len(datos) >= 7:
+                    meses.add(datetime.strptime(datos[0], "%Y-%m-%d").date().strftime("%m"))
+        por_hora = {}
+        with open(ruta_entradas, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                datos = linea.strip().split(";")
+                if len(datos) >= 7:
+                    partes_fecha = datos[0].split("-")
+                    if int(partes_fecha[0]) == mes.year and int(partes_fecha[1]) == mes.month:
+                        hora = datos[1].split(":")[0]
+                        por_hora[hora] = por_hora.get(hora, 0) + 1
+        return meses, por_hora
+
+    def recorrido(lector, ruta):
+        for _ in lector(ruta):
+            pass
+
+    megas_caja = os.path.getsize(ruta_caja) / 1e6
+    megas_entradas = os.path.getsize(ruta_entradas) / 1e6
+    estadisticas = Lectores.analizar_caja(ruta_caja)["estadisticas"]
+    filas = []
+    for nombre, funcion, megas in [
+        ("Caja antes", caja_antes, megas_caja),
+        ("Caja Lectores", lambda: Lectores.analizar_caja(ruta_caja), megas_caja),
+        ("Caja solo lectura", lambda: recorrido(Lectores.leer_caja, ruta_caja), megas_caja),
+        ("Entradas antes", entradas_antes, megas_entradas),
+        ("Entradas Lectores", lambda: Lectores.analizar_entradas(ruta_entradas), megas_entradas),
+        ("Entradas lectura", lambda: recorrido(Lectores.leer_entradas, ruta_entradas), megas_entradas),
+    ]:
+        segundos = medir(funcion)
+        filas.append([nombre, f"{megas:.1f} MB", f"{segundos*1000:.0f} ms", f"{megas/segundos:.1f} MB/s"])
+    imprimir_tabla(f"Lectura de registros ({n:,} lineas, {estadisticas['malformadas']} malformadas omitidas)", ["Método", "Tamaño", "Tiempo", "Rendimiento"], filas)
+    shutil.rmtree(carpeta)
+
+
+def benchmark_caja_numpy(n: int = 1_000_000):
+    """_summary_
+        Mide la carga de Caja.txt como array de NumPy (primera vez interpretando lineas y despues desde el cache '.npy')
+        y las agrupaciones por mes, día de la semana y tipo, contra agrupar por mes recorriendo el texto.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_texto = os.path.join(carpeta, "Caja.txt")
+    caja_aleatoria(ruta_texto, n)
+    tipos = Caja.TiposCaja(os.path.join(carpeta, "Caja.npy.tipos"))
+
+    def por_mes_texto():
+        meses = {}
+        for año, mes, _, _, _, centavos in Lectores.leer_caja(ruta_texto):
+            meses[(año, mes)] = meses.get((año, mes), 0) + centavos
+        return meses
+
+    segundos_carga = medir(Lectores.cargar_caja_numpy, ruta_texto, tipos)
+    segundos_cache = medir(Lectores.cargar_caja_numpy, ruta_texto, tipos)
+    registros = Lectores.cargar_caja_numpy(ruta_texto, tipos)
+    desde = ut.hoy() - timedelta(days=365)
+    imprimir_tabla(f"Caja en NumPy ({n:,} ingresos)", ["Operación", "Tiempo"], [
+        ["Carga texto", f"{segundos_carga*1000:.0f} ms"],
+        ["Carga cache", f"{segundos_cache*1000:.1f} ms"],
+        ["Mes (texto)", f"{medir(por_mes_texto)*1000:.0f} ms"],
+        ["Por mes", f"{medir(Caja.ingresos_por_mes, registros)*1000:.1f} ms"],
+        ["Día semana", f"{medir(Caja.ingresos_por_dia_semana, registros)*1000:.1f} ms"],
+        ["Por tipo", f"{medir(Caja.ingresos_por_tipo, registros, tipos)*1000:.1f} ms"],
+        ["Mes ult. año", f"{medir(Caja.ingresos_por_mes, registros, desde)*1000:.1f} ms"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+def benchmark_analisis_paralelo(n: int = 1_000_000, archivos: int = 4):
+    """_summary_
+        Compara el analisis de varios archivos de caja y de entradas en serie con el reparto por trozos en procesos,
+        comprobando que los resultados sean iguales. La escala depende de los nucleos de la maquina.
+    """
+    carpeta = tempfile.mkdtemp()
+    rutas_caja = [os.path.join(carpeta, f"Caja_{i}.txt") for i in range(archivos)]
+    rutas_entradas = [os.path.join(carpeta, f"Entradas_{i}.txt") for i in range(archivos)]
+    for semilla, (ruta_caja, ruta_entradas) in enumerate(zip(rutas_caja, rutas_entradas)):
+        caja_aleatoria(ruta_caja, n // archivos, semilla)
+        entradas_aleatorias(ruta_entradas, n // archivos, semilla)
+
+    nucleos = os.cpu_count() or 1
+    filas = []
+    for nombre, analizar, rutas in [("Caja", Lectores.analizar_caja, rutas_caja), ("Entradas", Lectores.analizar_entradas, rutas_entradas)]:
+        serie = analizar(rutas, 1)
+        segundos_serie = medir(analizar, rutas, 1)
+        megas = serie["estadisticas"]["bytes"] / 1e6
+        filas.append([nombre, "1 (serie)", f"{segundos_serie*1000:.0f} ms", f"{megas/segundos_serie:.1f} MB/s", "-"])
+        for procesos in sorted({2, 4, nucleos} - {1}):
+            paralelo = analizar(rutas, procesos)
+            segundos = medir(analizar, rutas, procesos)
+            filas.append([nombre, procesos, f"{segundos*1000:.0f} ms", f"{megas/segundos:.1f} MB/s", "Sí" if paralelo == serie else "NO"])
+    imprimir_tabla(f"Análisis en paralelo ({n:,} lineas por tipo, {nucleos} nucleos)", ["Registro", "Procesos", "Tiempo", "Rendimiento", "Igual serie"], filas)
+    shutil.rmtree(carpeta)
+
+
+def benchmark_historico(n: int = 1_000_000):
+    """_summary_
+        Compara los reportes de todos los meses leyendo las lineas de dos años de Caja.txt y Entradas.txt
+        con leer los resumenes de los meses compactados y las lineas solo del mes abierto.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta_caja = os.path.join(carpeta, "Caja.txt")
+    ruta_entradas = os.path.join(carpeta, "Entradas.txt")
+    caja_aleatoria(ruta_caja, n)
+    entradas_aleatorias(ruta_entradas, n)
+    historico = HistoricoRegistros(os.path.join(carpeta, "historico"))
+
+    segundos_caja = medir(Lectores.analizar_caja, ruta_caja)
+    segundos_entradas = medir(Lectores.analizar_entradas, ruta_entradas)
+    antes = (Lectores.analizar_caja(ruta_caja)["meses"], Lectores.analizar_entradas(ruta_entradas)["meses"])
+
+    mes_abierto = f"{ut.hoy():%Y-%m}"
+    segundos_compactar = medir(lambda: [historico.compactar_archivo(ruta, registro, mes_abierto)
+                                        for ruta, registro in ((ruta_caja, "Caja"), (ruta_entradas, "Entradas"))])
+    caja = lambda: Lectores.analizar_caja(ruta_caja, resumenes=historico.rutas_resumen("Caja"))
+    entradas = lambda: Lectores.analizar_entradas(ruta_entradas, resumenes=historico.rutas_resumen("Entradas"))
+    despues = (caja()["meses"], entradas()["meses"])
+    iguales = antes[0] == despues[0] and all(antes[1][mes]["por_dia"] == despues[1][mes]["por_dia"] for mes in antes[1])
+
+    imprimir_tabla(f"Historico compactado ({n:,} lineas por registro, resultados iguales: {'Sí' if iguales else 'NO'})",
+                   ["Reporte", "Lineas", "Compactado"], [
+        ["Caja", f"{segundos_caja*1000:.0f} ms", f"{medir(caja)*1000:.0f} ms"],
+        ["Entradas", f"{segundos_entradas*1000:.0f} ms", f"{medir(entradas)*1000:.0f} ms"],
+        ["Compactar", "-", f"{segundos_compactar*1000:.0f} ms"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+# ===== CUBO DE ASISTENCIA =====
+
+def benchmark_cubo_asistencia(n: int = 1_000_000, consultas: int = 100):
+    """_summary_
+        Compara los reportes de entradas leyendo Entradas.txt (el día con el IndiceFechas, el mes contando con diccionarios
+        en analizar_entradas) con el CuboAsistencia, que lee unas pocas celdas por fecha, hora y tipo y resume el mes
+        con np.bincount.
+        Se reporta tambien el costo de reconstruir el cubo desde el registro y de cargarlo desde su archivo.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta = os.path.join(carpeta, "Entradas.txt")
+    entradas_aleatorias(ruta, n)
+    mes = ut.hoy().replace(day=1) - timedelta(days=1)
+    desde, hasta = mes.replace(day=1), mes
+    fecha = f"{mes:%Y-%m-%d}"
+
+    indice = IndiceFechas(ruta)
+    indice.actualizar()
+    def dia_indice():
+        tipos = {}
+        for registro in map(Lectores.interpretar_entrada, indice.lineas(fecha)):
+            if registro is not None:
+                tipos[registro[8]] = tipos.get(registro[8], 0) + 1
+        return tipos
+
+    def mes_diccionarios():
+        datos_mes = Lectores.analizar_entradas(ruta)["meses"][(mes.year, mes.month)]
+        por_dia = {dia: 0 for dia in Caja.DIAS_SEMANA}
+        for dia, cantidad in datos_mes["por_dia"].items():
+            por_dia[Caja.DIAS_SEMANA[date(mes.year, mes.month, dia).weekday()]] += cantidad
+        return por_dia
+
+    cubo = CuboAsistencia(os.path.join(carpeta, "Entradas.cubo.json"))
+    segundos_reconstruir = medir(cubo.reconstruir, [ruta])
+    segundos_cargar = medir(CuboAsistencia(os.path.join(carpeta, "Entradas.cubo.json")).cargar, [ruta])
+    iguales = (dia_indice() == cubo.resumen_dia(fecha)["por_tipo"]
+               and list(mes_diccionarios().values()) == cubo.histograma(desde, hasta).sum(axis=1).tolist())
+    imprimir_tabla(f"Reportes de entradas ({n:,} entradas, {len(cubo.meses())} meses, resultados iguales: {'Sí' if iguales else 'NO'})",
+                   ["Método", "Tiempo"], [
+        ["Día con indice", f"{medir(lambda: [dia_indice() for _ in range(consultas)]) / consultas * 1000:.2f} ms"],
+        ["Día en el cubo", f"{medir(lambda: [cubo.resumen_dia(fecha) for _ in range(consultas)]) / consultas * 1000:.3f} ms"],
+        ["Mes con diccionarios", f"{medir(mes_diccionarios)*1000:.0f} ms"],
+        ["Mes en el cubo", f"{medir(lambda: [cubo.histograma(desde, hasta) for _ in range(consultas)]) / consultas * 1000:.2f} ms"],
+        ["Reconstruir cubo", f"{segundos_reconstruir*1000:.0f} ms"],
+        ["Cargar cubo", f"{segundos_cargar*1000:.0f} ms"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+# ===== ENTRADAS EN COLA =====
+
+def benchmark_entradas_en_cola(n: int = 20_000):
+    """_summary_
+        Compara la latencia de registrar una entrada abriendo Entradas.txt, escribiendo la linea y cerrandolo
+        (el camino sincrono) con ponerla en la cola del EscritorEnCola. Se reportan los percentiles por entrada
+        y el tiempo total hasta que todas las lineas estan en el archivo.
+    """
+    carpeta = tempfile.mkdtemp()
+    lineas = [f"{ut.hoy():%Y-%m-%d};{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d};{i};{10**8 + i};cliente;True;General"
+              for i in range(n)]
+
+    def latencias(registrar):
+        tiempos = []
+        for linea in lineas:
+            inicio = time.perf_counter()
+            registrar(linea)
+            tiempos.append(time.perf_counter() - inicio)
+        return sorted(tiempos)
+
+    def sincrono(linea):
+        with open(os.path.join(carpeta, "Sincrono.txt"), "a") as archivo:
+            archivo.write(linea + "\n")
+
+    escritor = EscritorEnCola(os.path.join(carpeta, "Cola.txt"))
+    inicio = time.perf_counter()
+    tiempos_sincrono = latencias(sincrono)
+    total_sincrono = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    tiempos_cola = latencias(escritor.escribir)
+    escritor.cerrar()
+    total_cola = time.perf_counter() - inicio
+
+    percentil = lambda tiempos, p: f"{tiempos[min(len(tiempos) - 1, int(len(tiempos) * p))]*1e6:.1f} µs"
+    imprimir_tabla(f"Latencia de registrar_entrada ({n:,} entradas, {escritor.get_escrituras():,} escrituras en cola)",
+                   ["Método", "p50", "p95", "p99", "Máximo", "Total"], [
+        [nombre, percentil(tiempos, 0.5), percentil(tiempos, 0.95), percentil(tiempos, 0.99),
+         f"{tiempos[-1]*1e6:.0f} µs", f"{total*1000:.0f} ms"]
+        for nombre, tiempos, total in (("Síncrono", tiempos_sincrono, total_sincrono), ("Cola", tiempos_cola, total_cola))
+    ])
+
+    # Si el archivo no se puede abrir el escritor debe lanzar el OSError, no quedarse esperando al hilo escritor
+    fallido = EscritorEnCola(os.path.join(carpeta, "no", "existe", "Cola.txt"), max_cola=4)
+    errores = []
+    def escribir_sin_archivo():
+        for linea in lineas[:16]:
+            try:
+                fallido.escribir(linea)
+            except OSError as e:
+                errores.append(e)
+        try:
+            fallido.vaciar()
+        except OSError as e:
+            errores.append(e)
+    hilo = threading.Thread(target=escribir_sin_archivo, daemon=True)
+    hilo.start()
+    hilo.join(timeout=2)
+    print(f"\nEscritor sin archivo: {'BLOQUEADO' if hilo.is_alive() else 'lanza OSError' if errores else 'NO lanza OSError'}")
+    if not hilo.is_alive():
+        try:
+            fallido.cerrar()
+        except OSError:
+            pass
+    shutil.rmtree(carpeta)
+
+
+# ===== INICIO DESDE EL ESTADO GUARDADO =====
+
+def benchmark_estado(n: int = 100_000):
+    """_summary_
+        Compara el inicio en frio cargando n clientes con sus membresías desde el archivo de clientes (importar_clientes,
+        que valida cada linea) con cargar el punto de control de guardar_estado.
+    """
+    carpeta = tempfile.mkdtemp()
+    gimnasio = gimnasio_con_clientes(n)
+    ruta_clientes = os.path.join(carpeta, "clientes.txt")
+    with open(ruta_clientes, "w", encoding="utf-8") as archivo:
+        archivo.write("Nombre;Documento;Telefono;Fecha Registro;Membresia:Pago;Membresia:Fecha Inicio;Membresia:Fecha Fin\n")
+        for cliente in gimnasio.get()[0]:
+            membresia = cliente.get_membresia()
+            datos = (membresia.get_pago(), membresia.get_fecha_inicio(), membresia.get_fecha_fin()) if membresia else (None, None, None)
+            archivo.write(f"{cliente.get_nombre()};{cliente.get_documento()};None;{cliente.get_fecha_registro()};{datos[0]};{datos[1]};{datos[2]}\n")
+    ruta_estado = os.path.join(carpeta, "estado.json")
+    segundos_guardar = medir(gimnasio.guardar_estado, ruta_estado)
+
+    nuevo = lambda: Gimnasio("Benchmark", "Sin direccion", "0", "bench@gym.com")
+    imprimir_tabla(f"Inicio en frio ({n:,} clientes, estado de {os.path.getsize(ruta_estado) / 2**20:.1f} MiB)", ["Método", "Tiempo"], [
+        ["clientes.txt", f"{medir(lambda: nuevo().importar_clientes(ruta_clientes))*1000:.0f} ms"],
+        ["Estado", f"{medir(lambda: nuevo().cargar_estado(ruta_estado))*1000:.0f} ms"],
+        ["Guardar estado", f"{segundos_guardar*1000:.0f} ms"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+# ===== OCUPACIÓN EN VIVO =====
+
+def benchmark_ocupacion(n: int = 200_000, consultas: int = 1_000):
+    """_summary_
+        Compara saber cuantos clientes hay dentro leyendo Entradas.txt (las entradas de las ultimas 3 horas,
+        sin salidas porque el archivo no las tiene) con la OcupacionGimnasio en memoria alimentada por entradas
+        y salidas. Se reporta el costo de alimentarla y de cada consulta de ocupación y pico de la ventana.
+    """
+    carpeta = tempfile.mkdtemp()
+    ruta = os.path.join(carpeta, "Entradas.txt")
+    aleatorio = random.Random(28)
+    momento = datetime(2025, 3, 1, 6, 0)
+    eventos = []
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for i in range(n):
+            momento += timedelta(seconds=aleatorio.randint(0, 30))
+            id_cliente = aleatorio.randint(1, 5_000)
+            eventos.append((aleatorio.random() < 0.6, id_cliente, momento))
+            if eventos[-1][0]:
+                archivo.write(f"{momento:%Y-%m-%d;%H:%M:%S};{id_cliente};{10**8 + id_cliente};cliente;True;General\n")
+
+    def contar_archivo():
+        limite = momento - timedelta(hours=3)
+        dentro = set()
+        for registro in Lectores.leer_entradas(ruta):
+            if datetime(*registro[:3]) + timedelta(seconds=registro[3]) > limite:
+                dentro.add(registro[4])
+        return len(dentro)
+
+    ocupacion = OcupacionGimnasio(os.path.join(carpeta, "Ocupacion.txt"), 80, 180, 60)
+    alimentar = medir(lambda: [ocupacion.entrada(id_cliente, cuando) if entra else ocupacion.salida(id_cliente, cuando)
+                               for entra, id_cliente, cuando in eventos])
+    tiempo_archivo = medir(contar_archivo)
+    tiempo_ocupacion = medir(lambda: [ocupacion.ocupacion(momento) for _ in range(consultas)]) / consultas
+    tiempo_pico = medir(lambda: [ocupacion.pico_ventana(momento) for _ in range(consultas)]) / consultas
+    imprimir_tabla(f"Ocupación actual ({n:,} eventos, {ocupacion.ocupacion(momento)} dentro, "
+                   f"{len(ocupacion.serie_por_hora())} horas en la serie)", ["Método", "Tiempo"], [
+        ["Leer Entradas.txt", f"{tiempo_archivo*1000:.0f} ms"],
+        ["Alimentar (por evento)", f"{alimentar / n * 1e6:.1f} µs"],
+        ["Ocupación en memoria", f"{tiempo_ocupacion * 1e6:.2f} µs"],
+        ["Pico de la ventana", f"{tiempo_pico * 1e6:.2f} µs"],
+    ])
+    shutil.rmtree(carpeta)
+
+
+# ===== MEMORIA DE LAS ENTIDADES =====
+
+def medir_memoria(funcion, *args):
+    # Retorna los bytes que siguen reservados por el resultado de la funcion
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = funcion(*args)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return despues - antes
+
+def crear_clientes(n: int):
+    """Crea n objetos Cliente, cada uno con su Membresia."""
+    inicio = date(2025, 1, 1)
+    fin = inicio + timedelta(days=30)
+    clientes = []
+    for i in range(n):
+        cliente = Cliente(i + 1, f"Cliente {i}", str(i), "2025-01-01", "3000000000")
+        cliente.set_membresia(Membresia(inicio, fin, pago=True))
+        clientes.append(cliente)
+    return clientes
+
+def crear_sesiones(n: int):
+    """Crea n objetos SesionEspecial de un mismo Entrenador, sin inscritos."""
+    entrenador = Entrenador(1, "Entrenador", "Yoga")
+    fecha = date(2025, 1, 1)
+    return [SesionEspecial(i + 1, entrenador, fecha) for i in range(n)]
+
+def benchmark_memoria_entidades(tamanos=(10_000, 100_000, 1_000_000)):
+    """_summary_
+        Mide con tracemalloc los bytes por cliente (Cliente + Membresia, incluyendo sus textos y fechas)
+        y por sesión especial vacía, creando n objetos de cada tipo.
+    """
+    filas = []
+    for n in tamanos:
+        bytes_clientes = medir_memoria(crear_clientes, n)
+        bytes_sesiones = medir_memoria(crear_sesiones, n)
+        filas.append([f"{n:,}", f"{bytes_clientes / n:.0f} B", f"{bytes_sesiones / n:.0f} B",
+                      f"{bytes_clientes / 2**20:.1f} MiB"])
+    imprimir_tabla("Memoria de las entidades", ["Objetos", "Por cliente", "Por sesión", "Total clientes"], filas)
+
+
+if __name__ == "__main__":
+    benchmark_almacen_clientes()
+    benchmark_indice_nombres()
+    benchmark_clasificacion_membresias()
+    benchmark_registro_lote()
+    benchmark_caja_binaria()
+    benchmark_agregados_caja()
+    benchmark_caja_por_meses()
+    benchmark_indice_fechas()
+    benchmark_lectores()
+    benchmark_caja_numpy()
+    benchmark_analisis_paralelo()
+    benchmark_historico()
+    benchmark_cubo_asistencia()
+    benchmark_entradas_en_cola()
+    benchmark_estado()
+    benchmark_ocupacion()
+    benchmark_memoria_entidades()
@@ -0,0 +1,696 @@
+import json
+import mmap
+import os
+from datetime import date
+
+import numpy as np
+
+from Registros import EscritorRegistro, SUFIJO_RESUMEN, interpretar_resumen
+from Errores import ArchivoInvalido
+
+# ==== LIBRO DE CAJA BINARIO ====
+# Cada ingreso ocupa un registro de ancho fijo, asi el archivo completo se puede ver como un array de NumPy
+# sin interpretar linea por linea. Los montos se guardan en centavos enteros para no acumular errores de float.
+
+DTYPE_CAJA = np.dtype([
+    ("dia", "<i4"),       # Ordinal de la fecha (date.toordinal)
+    ("segundo", "<i4"),   # Segundos desde la medianoche
+    ("centavos", "<i8"),  # Monto en centavos
+    ("tipo", "<u4"),      # Codigo del tipo de transaccion, ver TIPOS_CAJA
+])
+
+# Codigos de los tipos conocidos, los tipos nuevos se agregan al final en el archivo '<ruta>.tipos'
+TIPOS_CAJA = ["Ingreso", "Membresia", "PagoMembresia", "RenovacionMembresia", "PagoIngresoUnico", "IngresoUnico"]
+
+# Clasificacion de los tipos usada por los reportes financieros
+TIPOS_MEMBRESIA = ("Membresia", "PagoMembresia", "RenovacionMembresia")
+TIPOS_ENTRADA_UNICA = ("PagoIngresoUnico", "IngresoUnico")
+TIPOS_OTROS = ("Ingreso",)
+TIPOS_VENTA_MEMBRESIA = ("Membresia", "PagoMembresia") # Los que cuenta el reporte diario como membresías vendidas
+SUFIJO_MIGRADO = ".migrado" # Caja.txt se renombra con este sufijo al migrarlo al libro por meses, asi nadie lo vuelve a leer
+
+
+def a_centavos(monto) -> int:
+    """Convierte un monto en pesos (float o texto '50,000.0') a centavos enteros."""
+    if isinstance(monto, str):
+        monto = float(monto.replace(",", ""))
+    return round(monto * 100)
+
+def a_segundos(hora: str) -> int:
+    """Convierte una hora 'HH:MM:SS' a segundos desde la medianoche."""
+    return int(hora[0:2]) * 3600 + int(hora[3:5]) * 60 + int(hora[6:8])
+
+def interpretar_linea(linea: str):
+    """_summary_
+        Interpreta una linea de Caja.txt (fecha;hora;tipo;efectivo).
+    Returns:
+        tuple: (fecha 'YYYY-MM-DD', hora 'HH:MM:SS', tipo, centavos) o None si la linea no es valida.
+    """
+    datos = linea.strip().split(";")
+    if len(datos) < 4:
+        return None
+    try:
+        date.fromisoformat(datos[0])
+        return datos[0], datos[1], datos[2], a_centavos(datos[3])
+    except ValueError:
+        return None
+
+
+class TiposCaja:
+    """_summary_
+    Clase que representa la tabla de codigos de los tipos de transaccion de un libro de caja binario.
+    Empieza con TIPOS_CAJA y guarda los tipos nuevos en el archivo '<ruta>.tipos' (un tipo por linea, en orden de codigo).
+
+    Atributos:
+        __ruta (str): Ruta del archivo de tipos.
+        __nombres (list): Nombre de cada codigo.
+        __codigos (dict): Nombre -> codigo.
+    """
+    def __init__(self, ruta: str):
+        self.__ruta = ruta
+        self.__nombres = list(TIPOS_CAJA)
+        if os.path.exists(ruta):
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                self.__nombres = [linea.rstrip("\n") for linea in archivo if linea.strip()]
+        self.__codigos = {nombre: codigo for codigo, nombre in enumerate(self.__nombres)}
+
+    def get_nombres(self):
+        return list(self.__nombres)
+
+    def nombre(self, codigo: int):
+        return self.__nombres[codigo]
+
+    def codigo(self, nombre: str, crear: bool = True):
+        """Retorna el codigo del tipo, agregandolo a la tabla (y al archivo) si es nuevo y crear es True, si no None."""
+        codigo = self.__codigos.get(nombre)
+        if codigo is None and crear:
+            codigo = len(self.__nombres)
+            self.__nombres.append(nombre)
+            self.__codigos[nombre] = codigo
+            self.guardar()
+        return codigo
+
+    def guardar(self):
+        """Escribe la tabla de tipos en su archivo."""
+        with open(self.__ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("".join(f"{tipo}\n" for tipo in self.__nombres))
+
+    def codigos(self, nombres):
+        """Retorna el array de codigos de los nombres dados que existen en la tabla."""
+        return np.array([self.__codigos[nombre] for nombre in nombres if nombre in self.__codigos], dtype=DTYPE_CAJA["tipo"])
+
+
+def empaquetar(fecha: str, hora: str, codigo_tipo: int, centavos: int) -> bytes:
+    """Retorna los bytes de un registro del libro binario."""
+    registro = np.zeros(1, dtype=DTYPE_CAJA)
+    registro[0] = (date.fromisoformat(fecha).toordinal(), a_segundos(hora), centavos, codigo_tipo)
+    return registro.tobytes()
+
+def leer_caja_binaria(ruta: str):
+    """_summary_
+        Lee el libro de caja binario como un array estructurado de NumPy, mapeando el archivo en memoria (sin copiarlo
+        ni interpretar registro por registro). Si el archivo termina con un registro incompleto, este se ignora.
+    Args:
+        ruta (str): Ruta del archivo binario.
+    Returns:
+        np.ndarray: Array de solo lectura con dtype DTYPE_CAJA, vacio si el archivo no existe o está vacío.
+    """
+    if not os.path.exists(ruta) or os.path.getsize(ruta) < DTYPE_CAJA.itemsize:
+        return np.zeros(0, dtype=DTYPE_CAJA)
+    with open(ruta, "rb") as archivo:
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    # El array mantiene vivo el mapa mientras se use
+    completos = len(mapa) // DTYPE_CAJA.itemsize
+    return np.frombuffer(mapa, dtype=DTYPE_CAJA, count=completos)
+
+def convertir_caja_a_binario(ruta_texto, ruta_binaria: str):
+    """_summary_
+        Convierte un libro de caja de texto (fecha;hora;tipo;efectivo con montos como '50,000.0') al formato binario.
+        El archivo binario y su tabla de tipos se reemplazan.
+    Args:
+        ruta_texto (str | list): Ruta del archivo de texto, por ejemplo 'registros/Caja.txt', o lista de rutas
+            (por ejemplo los archivos mensuales de CajaPorMeses) que se convierten en orden a un solo archivo.
+        ruta_binaria (str): Ruta del archivo binario a crear, por ejemplo 'registros/Caja.bin'.
+    Returns:
+        dict: 'convertidos' con el numero de registros escritos y 'omitidos' con la lista de tuplas (ruta, numero de linea) invalidas.
+    """
+    rutas_texto = [ruta_texto] if isinstance(ruta_texto, str) else list(ruta_texto)
+    if os.path.exists(ruta_binaria + ".tipos"):
+        os.remove(ruta_binaria + ".tipos")
+    tipos = TiposCaja(ruta_binaria + ".tipos")
+    filas = []
+    omitidos = []
+    for ruta in rutas_texto:
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            for numero_linea, linea in enumerate(archivo, 1):
+                registro = interpretar_linea(linea)
+                try:
+                    fecha, hora, tipo, centavos = registro
+                    filas.append((date.fromisoformat(fecha).toordinal(), a_segundos(hora), centavos, tipos.codigo(tipo)))
+                except (TypeError, ValueError):
+                    omitidos.append((ruta, numero_linea))
+
+    registros = np.array(filas, dtype=DTYPE_CAJA)
+    temporal = ruta_binaria + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(registros.tobytes())
+    os.replace(temporal, ruta_binaria)
+    tipos.guardar()
+    return {"convertidos": len(registros), "omitidos": omitidos}
+
+
+# ==== RESUMENES VECTORIZADOS ====
+
+def meses_con_registros(registros):
+    """Retorna la lista ordenada de tuplas (año, mes) que tienen registros."""
+    if len(registros) == 0:
+        return []
+    dias = np.unique(registros["dia"])
+    meses = {(fecha.year, fecha.month) for fecha in map(date.fromordinal, dias.tolist())}
+    return sorted(meses)
+
+def resumen_mes(registros, tipos: TiposCaja, año: int, mes: int):
+    """_summary_
+        Resume los ingresos de un mes con mascaras y np.bincount sobre el libro binario.
+    Returns:
+        dict: Mismas llaves que el analisis financiero: totales por clase de tipo, cantidades e ingresos por día del mes.
+    """
+    inicio = date(año, mes, 1).toordinal()
+    fin = date(año + (mes == 12), mes % 12 + 1, 1).toordinal()
+    del_mes = registros[(registros["dia"] >= inicio) & (registros["dia"] < fin)]
+    centavos = del_mes["centavos"]
+
+    def clase(nombres):
+        mascara = np.isin(del_mes["tipo"], tipos.codigos(nombres))
+        return int(centavos[mascara].sum()) / 100, int(mascara.sum())
+
+    ingresos_membresia, cantidad_membresias = clase(TIPOS_MEMBRESIA)
+    ingresos_entrada_unica, cantidad_entradas = clase(TIPOS_ENTRADA_UNICA)
+    ingresos_otros, cantidad_otros = clase(TIPOS_OTROS)
+
+    por_dia = np.bincount(del_mes["dia"] - inicio, weights=centavos, minlength=fin - inicio)
+    con_registros = np.bincount(del_mes["dia"] - inicio, minlength=fin - inicio) > 0
+    ingresos_por_dia = {int(dia) + 1: float(por_dia[dia]) / 100 for dia in np.flatnonzero(con_registros)}
+
+    return {
+        "mes": mes,
+        "año": año,
+        "total_ingresos": int(centavos.sum()) / 100,
+        "ingresos_membresia": ingresos_membresia,
+        "ingresos_entrada_unica": ingresos_entrada_unica,
+        "ingresos_otros": ingresos_otros,
+        "cantidad_membresias": cantidad_membresias,
+        "cantidad_entradas": cantidad_entradas,
+        "cantidad_otros": cantidad_otros,
+        "ingresos_por_dia": ingresos_por_dia,
+    }
+
+def resumen_dia(registros, tipos: TiposCaja, fecha: date):
+    """_summary_
+        Resume los ingresos de un día sobre el libro binario.
+    Returns:
+        dict: 'balance_efectivo' (pesos) y 'membresias_compradas'.
+    """
+    del_dia = registros[registros["dia"] == fecha.toordinal()]
+    return {
+        "balance_efectivo": int(del_dia["centavos"].sum()) / 100,
+        "membresias_compradas": int(np.isin(del_dia["tipo"], tipos.codigos(TIPOS_VENTA_MEMBRESIA)).sum()),
+    }
+
+
+# ==== AGRUPACIONES DE VARIOS PERIODOS ====
+# Sobre un array con dtype DTYPE_CAJA (del libro binario o de Lectores.cargar_caja_numpy) cada agrupacion es
+# una clave por registro y un np.bincount de los centavos, sin recorrer los registros en Python.
+
+ORDINAL_1970 = date(1970, 1, 1).toordinal()
+DIAS_SEMANA = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+
+def filtrar_periodo(registros, desde: date = None, hasta: date = None):
+    """Retorna los registros con fecha entre desde y hasta (incluidas), None deja el extremo abierto."""
+    mascara = np.ones(len(registros), dtype=bool)
+    if desde is not None:
+        mascara &= registros["dia"] >= desde.toordinal()
+    if hasta is not None:
+        mascara &= registros["dia"] <= hasta.toordinal()
+    return registros[mascara]
+
+def _totales(claves, centavos, cantidad_claves: int):
+    # (centavos, cantidad) de cada clave 0..cantidad_claves-1
+    totales = np.bincount(claves, weights=centavos, minlength=cantidad_claves)
+    cantidades = np.bincount(claves, minlength=cantidad_claves)
+    return np.rint(totales).astype(np.int64), cantidades
+
+def ingresos_por_mes(registros, desde: date = None, hasta: date = None):
+    """_summary_
+        Agrupa los ingresos por mes con np.unique y np.bincount.
+    Returns:
+        dict: Tupla (año, mes) -> {'total': pesos, 'cantidad': ingresos}, en orden de mes, solo meses con ingresos.
+    """
+    registros = filtrar_periodo(registros, desde, hasta)
+    # Meses desde enero de 1970: se pasa el ordinal a datetime64 de días y se trunca a meses
+    meses = (registros["dia"].astype(np.int64) - ORDINAL_1970).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    claves, inversos = np.unique(meses, return_inverse=True)
+    totales, cantidades = _totales(inversos.ravel(), registros["centavos"], len(claves))
+    return {
+        (1970 + int(clave) // 12, int(clave) % 12 + 1): {"total": int(total) / 100, "cantidad": int(cantidad)}
+        for clave, total, cantidad in zip(claves, totales, cantidades)
+    }
+
+def ingresos_por_dia_semana(registros, desde: date = None, hasta: date = None):
+    """_summary_
+        Agrupa los ingresos por día de la semana del calendario (el ordinal 1 fue lunes).
+    Returns:
+        dict: Nombre del día ('Lunes'...'Domingo') -> {'total': pesos, 'cantidad': ingresos}, siempre los 7 días.
+    """
+    registros = filtrar_periodo(registros, desde, hasta)
+    totales, cantidades = _totales((registros["dia"] - 1) % 7, registros["centavos"], 7)
+    return {DIAS_SEMANA[dia]: {"total": int(totales[dia]) / 100, "cantidad": int(cantidades[dia])} for dia in range(7)}
+
+def ingresos_por_tipo(registros, tipos: TiposCaja, desde: date = None, hasta: date = None):
+    """_summary_
+        Agrupa los ingresos por tipo de transaccion.
+    Returns:
+        dict: Nombre del tipo -> {'total': pesos, 'cantidad': ingresos}, solo los tipos con ingresos.
+    """
+    registros = filtrar_periodo(registros, desde, hasta)
+    cantidad_tipos = len(tipos.get_nombres())
+    totales, cantidades = _totales(registros["tipo"].astype(np.int64), registros["centavos"], cantidad_tipos)
+    return {
+        tipos.nombre(codigo): {"total": int(totales[codigo]) / 100, "cantidad": int(cantidades[codigo])}
+        for codigo in np.flatnonzero(cantidades).tolist()
+    }
+
+# ==== LIBRO DE CAJA POR MESES ====
+
+def nombre_archivo_mes(mes: str) -> str:
+    """Nombre del archivo de un mes 'YYYY-MM' del libro de caja mensual."""
+    return f"Caja_{mes}.txt"
+
+def contar_archivo_caja(ruta: str):
+    """Retorna (registros, centavos) de un archivo de caja de texto, contando solo las lineas validas."""
+    registros = 0
+    centavos = 0
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        for linea in archivo:
+            registro = interpretar_linea(linea)
+            if registro is not None:
+                registros += 1
+                centavos += registro[3]
+    return registros, centavos
+
+def migrar_caja_a_meses(ruta_texto: str, carpeta: str):
+    """_summary_
+        Migracion unica de un libro de caja de un solo archivo (Caja.txt) a archivos por mes con su manifiesto.
+        Las lineas se copian tal cual al archivo de su mes. Despues de guardar el manifiesto el archivo original
+        se renombra a '<ruta>.migrado' (ver SUFIJO_MIGRADO), asi sus totales viejos no se pueden leer por error.
+    Args:
+        ruta_texto (str): Ruta del libro de caja de un solo archivo.
+        carpeta (str): Carpeta donde se crean los archivos 'Caja_YYYY-MM.txt' y 'manifiesto.json'.
+    Returns:
+        dict: 'meses' con el numero de archivos creados, 'registros' migrados, 'omitidos' (numeros de linea invalidos)
+            y 'original' (nueva ruta del archivo original).
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    lineas_por_mes = {}
+    omitidos = []
+    with open(ruta_texto, "r", encoding="utf-8") as archivo:
+        for numero_linea, linea in enumerate(archivo, 1):
+            registro = interpretar_linea(linea)
+            if registro is None:
+                omitidos.append(numero_linea)
+                continue
+            lineas_por_mes.setdefault(registro[0][:7], []).append((linea.rstrip("\n") + "\n", registro[3]))
+
+    manifiesto = {"meses": {}}
+    for mes, lineas in sorted(lineas_por_mes.items()):
+        ruta_mes = os.path.join(carpeta, nombre_archivo_mes(mes))
+        with open(ruta_mes, "w", encoding="utf-8") as archivo:
+            archivo.write("".join(linea for linea, _ in lineas))
+        manifiesto["meses"][mes] = {
+            "archivo": nombre_archivo_mes(mes),
+            "registros": len(lineas),
+            "centavos": sum(centavos for _, centavos in lineas),
+            "bytes": os.path.getsize(ruta_mes),
+        }
+    guardar_manifiesto(carpeta, manifiesto)
+    os.replace(ruta_texto, ruta_texto + SUFIJO_MIGRADO)
+    return {"meses": len(lineas_por_mes), "registros": sum(map(len, lineas_por_mes.values())), "omitidos": omitidos,
+            "original": ruta_texto + SUFIJO_MIGRADO}
+
+def guardar_manifiesto(carpeta: str, manifiesto: dict):
+    """Escribe 'manifiesto.json' en la carpeta del libro mensual, reemplazandolo de forma atomica."""
+    ruta = os.path.join(carpeta, "manifiesto.json")
+    with open(ruta + ".tmp", "w", encoding="utf-8") as archivo:
+        json.dump(manifiesto, archivo, indent=2)
+    os.replace(ruta + ".tmp", ruta)
+
+
+class CajaPorMeses:
+    """_summary_
+    Clase que representa el libro de caja dividido en un archivo de texto por mes ('Caja_YYYY-MM.txt', mismo formato
+    de lineas que Caja.txt) y un 'manifiesto.json' con los archivos, su numero de registros, total en centavos y bytes.
+    Tiene la misma interfaz de escritura que EscritorRegistro: cada linea va al archivo del mes de su fecha,
+    escrita en grupo por un EscritorRegistro que se cambia cuando cambia el mes.
+    No migra solo el libro de un solo archivo: si existe y la carpeta no tiene manifiesto se lanza ArchivoInvalido
+    para que se migre antes con 'python Caja.py migrar' (los dos libros darian totales distintos).
+    Al cargar, los meses cuyo archivo no tiene los bytes del manifiesto (por ejemplo tras un cierre inesperado) se recuentan.
+    Los meses cerrados se pueden compactar en un HistoricoRegistros: su archivo se borra y sus totales pasan a 'compactados'.
+
+    Atributos:
+        __carpeta (str): Carpeta de los archivos mensuales.
+        __ruta_original (str): Libro de caja de un solo archivo que debe estar migrado, None para no revisarlo.
+        __configuracion (tuple): (max_registros, intervalo_ms, durable) de los escritores de cada mes.
+        __manifiesto (dict): {'meses': {'YYYY-MM': {'archivo', 'registros', 'centavos', 'bytes'}},
+            'compactados': {'YYYY-MM': {'registros', 'centavos'}}}, None hasta el primer uso.
+        __escritor (EscritorRegistro): Escritor del mes en curso.
+        __mes_escritor (str): Mes 'YYYY-MM' del escritor en curso.
+    """
+    def __init__(self, carpeta: str, max_registros: int = 32, intervalo_ms: int = 500, durable: bool = False, ruta_original: str = None):
+        self.__carpeta = carpeta
+        self.__ruta_original = ruta_original
+        self.__configuracion = (max_registros, intervalo_ms, durable)
+        self.__manifiesto = None
+        self.__escritor = None
+        self.__mes_escritor = None
+        if ruta_original and os.path.exists(ruta_original) and not os.path.exists(os.path.join(carpeta, "manifiesto.json")):
+            raise ArchivoInvalido(f"El libro de caja '{ruta_original}' no está migrado a '{carpeta}', "
+                                  f"ejecute 'python Caja.py migrar {ruta_original} {carpeta}' o desactive RegistrosConfig.CAJA_POR_MESES.")
+
+    # Métodos de acceso
+
+    def get_carpeta(self):
+        return self.__carpeta
+
+    def get_manifiesto(self):
+        """Retorna el manifiesto, con los ingresos pendientes ya escritos."""
+        self.vaciar()
+        return self.__cargar()
+
+    # Métodos
+
+    def __cargar(self):
+        if self.__manifiesto is not None:
+            return self.__manifiesto
+        ruta_manifiesto = os.path.join(self.__carpeta, "manifiesto.json")
+        try:
+            with open(ruta_manifiesto, "r", encoding="utf-8") as archivo:
+                manifiesto = json.load(archivo)
+            if not isinstance(manifiesto.get("meses"), dict):
+                raise ValueError("Manifiesto sin meses")
+        except (OSError, ValueError, KeyError, TypeError):
+            manifiesto = {"meses": {}}
+            # Manifiesto inexistente o dañado, se reconstruye con los archivos mensuales que haya
+            if os.path.isdir(self.__carpeta):
+                for archivo in sorted(os.listdir(self.__carpeta)):
+                    if archivo.startswith("Caja_") and archivo.endswith(".txt"):
+                        manifiesto["meses"][archivo[5:12]] = {"archivo": archivo, "registros": 0, "centavos": 0, "bytes": -1}
+
+        cambios = False
+        for mes, datos in manifiesto["meses"].items():
+            ruta_mes = os.path.join(self.__carpeta, datos["archivo"])
+            tamano = os.path.getsize(ruta_mes) if os.path.exists(ruta_mes) else 0
+            if tamano != datos["bytes"]:
+                datos["registros"], datos["centavos"] = contar_archivo_caja(ruta_mes) if tamano else (0, 0)
+                datos["bytes"] = tamano
+                cambios = True
+        self.__manifiesto = manifiesto
+        if cambios or not os.path.exists(ruta_manifiesto):
+            os.makedirs(self.__carpeta, exist_ok=True)
+            guardar_manifiesto(self.__carpeta, manifiesto)
+        return manifiesto
+
+    def escribir(self, linea: str):
+        """_summary_
+            Agrega un ingreso (linea fecha;hora;tipo;efectivo) al archivo de su mes y a los totales del manifiesto.
+            El manifiesto se guarda al vaciar o cerrar el libro.
+        Args:
+            linea (str): Linea a guardar, sin salto de linea.
+        """
+        manifiesto = self.__cargar()
+        mes = linea[:7]
+        if mes != self.__mes_escritor:
+            if self.__escritor is not None:
+                self.vaciar()
+                self.__escritor.cerrar()
+            os.makedirs(self.__carpeta, exist_ok=True)
+            self.__escritor = EscritorRegistro(os.path.join(self.__carpeta, nombre_archivo_mes(mes)), *self.__configuracion)
+            self.__mes_escritor = mes
+        self.__escritor.escribir(linea)
+
+        registro = interpretar_linea(linea)
+        datos = manifiesto["meses"].setdefault(mes, {"archivo": nombre_archivo_mes(mes), "registros": 0, "centavos": 0, "bytes": 0})
+        datos["registros"] += 1
+        datos["centavos"] += registro[3] if registro is not None else 0
+
+    def vaciar(self):
+        """Escribe al disco los ingresos pendientes del mes en curso y guarda el manifiesto con los bytes actuales."""
+        if self.__escritor is None:
+            return 0
+        escritas = self.__escritor.vaciar()
+        datos = self.__manifiesto["meses"][self.__mes_escritor]
+        tamano = os.path.getsize(self.__escritor.get_ruta())
+        if escritas or datos["bytes"] != tamano:
+            datos["bytes"] = tamano
+            guardar_manifiesto(self.__carpeta, self.__manifiesto)
+        return escritas
+
+    def cerrar(self):
+        """Escribe los ingresos pendientes, guarda el manifiesto y cierra el archivo del mes en curso."""
+        if self.__escritor is not None:
+            self.vaciar()
+            self.__escritor.cerrar()
+            self.__escritor = None
+            self.__mes_escritor = None
+
+    def meses(self):
+        """Retorna la lista ordenada de tuplas (año, mes) que tienen archivo en el libro o fueron compactados."""
+        manifiesto = self.__cargar()
+        return sorted({(int(mes[:4]), int(mes[5:7])) for mes in [*manifiesto["meses"], *manifiesto.get("compactados", {})]})
+
+    def compactar(self, mes_abierto: str, historico):
+        """_summary_
+            Compacta en el historico los archivos de los meses anteriores a mes_abierto: sus lineas pasan al resumen
+            y al archivo comprimido del mes, el archivo se borra y sus totales quedan en 'compactados' del manifiesto.
+        Args:
+            mes_abierto (str): Mes 'YYYY-MM' en curso, se compactan los meses anteriores.
+            historico (HistoricoRegistros): Historico donde se guardan los meses compactados.
+        Returns:
+            dict: Mes 'YYYY-MM' -> numero de lineas compactadas.
+        """
+        manifiesto = self.__cargar()
+        if self.__mes_escritor is not None and self.__mes_escritor < mes_abierto:
+            self.cerrar()
+        else:
+            self.vaciar()
+        compactados = {}
+        for mes in sorted(manifiesto["meses"]):
+            if mes >= mes_abierto:
+                continue
+            datos = manifiesto["meses"].pop(mes)
+            ruta_mes = os.path.join(self.__carpeta, datos["archivo"])
+            compactados[mes] = historico.compactar_mes(ruta_mes, "Caja", mes) if os.path.exists(ruta_mes) else 0
+            totales = manifiesto.setdefault("compactados", {}).setdefault(mes, {"registros": 0, "centavos": 0})
+            totales["registros"] += datos["registros"]
+            totales["centavos"] += datos["centavos"]
+            guardar_manifiesto(self.__carpeta, manifiesto)
+        return compactados
+
+    def rutas(self, meses=None):
+        """_summary_
+            Retorna las rutas de los archivos mensuales en orden de mes, solo de los meses dados si se indican.
+        Args:
+            meses (list, optional): Lista de tuplas (año, mes). Defaults to None (todos los meses).
+        """
+        seleccion = None if meses is None else {f"{año}-{mes:02d}" for año, mes in meses}
+        return [os.path.join(self.__carpeta, datos["archivo"])
+                for mes, datos in sorted(self.__cargar()["meses"].items())
+                if seleccion is None or mes in seleccion]
+
+
+# ==== AGREGADOS INCREMENTALES ====
+
+class AgregadosCaja:
+    """_summary_
+    Clase que representa los totales de la caja por mes y por día, separados por tipo de transaccion.
+    Se actualizan con cada ingreso, asi los reportes de un mes o un día no tienen que leer el libro de caja.
+    Se guardan en un archivo JSON ('registros/Caja.agregados.json') con el tamaño en bytes de cada archivo del libro
+    que ya incluyen: si un archivo creció desde entonces solo se leen sus bytes nuevos, si el archivo de agregados
+    no existe, está dañado o algun archivo del libro es más pequeño o desapareció, se reconstruyen desde el principio.
+
+    Atributos:
+        __ruta (str): Ruta del archivo JSON de agregados.
+        __bytes_libros (dict): Ruta de cada archivo del libro -> bytes ya incluidos en los agregados.
+        __meses (dict): 'YYYY-MM' -> {'tipos': {tipo: [cantidad, centavos]}, 'dias': {dia: {tipo: [cantidad, centavos]}}}.
+    """
+    def __init__(self, ruta: str):
+        self.__ruta = ruta
+        self.__bytes_libros = {}
+        self.__meses = {}
+
+    # Métodos de acceso
+
+    def get_bytes_libros(self):
+        return dict(self.__bytes_libros)
+
+    # Métodos
+
+    def agregar(self, fecha: str, tipo: str, centavos: int, cantidad: int = 1):
+        """Suma un ingreso (fecha 'YYYY-MM-DD'), o un grupo de cantidad ingresos, a los totales de su mes y de su día en O(1)."""
+        mes = self.__meses.setdefault(fecha[:7], {"tipos": {}, "dias": {}})
+        total_mes = mes["tipos"].setdefault(tipo, [0, 0])
+        total_mes[0] += cantidad
+        total_mes[1] += centavos
+        total_dia = mes["dias"].setdefault(int(fecha[8:10]), {}).setdefault(tipo, [0, 0])
+        total_dia[0] += cantidad
+        total_dia[1] += centavos
+
+    def __leer_libro(self, ruta_libro: str, desde: int):
+        # Suma las lineas del archivo a partir del byte dado y retorna el tamaño leido,
+        # los resumenes de meses compactados ('.resumen.txt') suman cada grupo con su cantidad
+        resumen = ruta_libro.endswith(SUFIJO_RESUMEN)
+        with open(ruta_libro, "rb") as archivo:
+            archivo.seek(desde)
+            for linea in archivo:
+                if not linea.endswith(b"\n"):
+                    break # Linea incompleta, se vuelve a leer cuando termine de escribirse
+                if resumen:
+                    grupo = interpretar_resumen(linea.decode("utf-8"))
+                    if grupo is not None:
+                        self.agregar(grupo[0], grupo[2], grupo[4] or 0, grupo[3])
+                else:
+                    registro = interpretar_linea(linea.decode("utf-8"))
+                    if registro is not None:
+                        self.agregar(registro[0], registro[2], registro[3])
+                desde += len(linea)
+        return desde
+
+    def __poner_al_dia(self, rutas_libro: list):
+        for ruta_libro in rutas_libro:
+            if os.path.exists(ruta_libro):
+                leidos = self.__bytes_libros.get(ruta_libro, 0)
+                if leidos < os.path.getsize(ruta_libro):
+                    self.__bytes_libros[ruta_libro] = self.__leer_libro(ruta_libro, leidos)
+
+    def cargar(self, rutas_libro):
+        """_summary_
+            Carga los agregados desde su archivo y los pone al día con los archivos del libro de caja.
+        Args:
+            rutas_libro (str | list): Ruta del libro de caja o lista de rutas (archivos mensuales y resumenes de meses compactados).
+        Returns:
+            str: 'cargados' si estaban al día, 'actualizados' si se leyeron lineas nuevas del libro o 'reconstruidos'.
+        """
+        rutas_libro = [rutas_libro] if isinstance(rutas_libro, str) else list(rutas_libro)
+        tamanos = {ruta: os.path.getsize(ruta) for ruta in rutas_libro if os.path.exists(ruta)}
+        estado = "reconstruidos"
+        try:
+            with open(self.__ruta, "r", encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+            bytes_libros = datos["bytes_libros"]
+            if all(ruta in tamanos and leidos <= tamanos[ruta] for ruta, leidos in bytes_libros.items()):
+                self.__bytes_libros = bytes_libros
+                self.__meses = {
+                    mes: {"tipos": valores["tipos"], "dias": {int(dia): tipos for dia, tipos in valores["dias"].items()}}
+                    for mes, valores in datos["meses"].items()
+                }
+                al_dia = all(self.__bytes_libros.get(ruta, 0) == tamano for ruta, tamano in tamanos.items())
+                estado = "cargados" if al_dia else "actualizados"
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass # Archivo inexistente o dañado, se reconstruye
+
+        if estado == "reconstruidos":
+            self.__bytes_libros = {}
+            self.__meses = {}
+        self.__poner_al_dia(rutas_libro)
+        if estado != "cargados":
+            self.guardar()
+        return estado
+
+    def reconstruir(self, rutas_libro):
+        """Descarta los agregados y los calcula de nuevo leyendo todos los archivos del libro de caja."""
+        self.__bytes_libros = {}
+        self.__meses = {}
+        self.__poner_al_dia([rutas_libro] if isinstance(rutas_libro, str) else list(rutas_libro))
+        self.guardar()
+
+    def guardar(self, rutas_libro=None):
+        """_summary_
+            Guarda los agregados en su archivo, reemplazandolo de forma atomica.
+        Args:
+            rutas_libro (str | list, optional): Archivos del libro cuyo tamaño actual ya está incluido en los agregados,
+                se dan despues de escribir al disco los ingresos agregados con agregar(). Defaults to None (los ultimos tamaños conocidos).
+        """
+        if rutas_libro is not None:
+            for ruta_libro in [rutas_libro] if isinstance(rutas_libro, str) else rutas_libro:
+                if os.path.exists(ruta_libro):
+                    self.__bytes_libros[ruta_libro] = os.path.getsize(ruta_libro)
+        temporal = self.__ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump({"bytes_libros": self.__bytes_libros, "meses": self.__meses}, archivo)
+        os.replace(temporal, self.__ruta)
+
+    def meses(self):
+        """Retorna la lista ordenada de tuplas (año, mes) que tienen ingresos."""
+        return sorted((int(mes[:4]), int(mes[5:7])) for mes in self.__meses)
+
+    def resumen_mes(self, año: int, mes: int):
+        """Resumen del mes con las mismas llaves que resumen_mes() del libro binario, sin leer el libro."""
+        valores = self.__meses.get(f"{año}-{mes:02d}", {"tipos": {}, "dias": {}})
+
+        def clase(nombres):
+            cantidad = sum(valores["tipos"].get(tipo, (0, 0))[0] for tipo in nombres)
+            centavos = sum(valores["tipos"].get(tipo, (0, 0))[1] for tipo in nombres)
+            return centavos / 100, cantidad
+
+        ingresos_membresia, cantidad_membresias = clase(TIPOS_MEMBRESIA)
+        ingresos_entrada_unica, cantidad_entradas = clase(TIPOS_ENTRADA_UNICA)
+        ingresos_otros, cantidad_otros = clase(TIPOS_OTROS)
+        return {
+            "mes": mes,
+            "año": año,
+            "total_ingresos": sum(centavos for _, centavos in valores["tipos"].values()) / 100,
+            "ingresos_membresia": ingresos_membresia,
+            "ingresos_entrada_unica": ingresos_entrada_unica,
+            "ingresos_otros": ingresos_otros,
+            "cantidad_membresias": cantidad_membresias,
+            "cantidad_entradas": cantidad_entradas,
+            "cantidad_otros": cantidad_otros,
+            "ingresos_por_dia": {dia: sum(centavos for _, centavos in tipos.values()) / 100
+                                 for dia, tipos in sorted(valores["dias"].items())},
+        }
+
+    def resumen_dia(self, fecha: date):
+        """Resumen del día con las mismas llaves que resumen_dia() del libro binario, sin leer el libro."""
+        valores = self.__meses.get(fecha.strftime("%Y-%m"), {"dias": {}})["dias"].get(fecha.day, {})
+        return {
+            "balance_efectivo": sum(centavos for _, centavos in valores.values()) / 100,
+            "membresias_compradas": sum(valores.get(tipo, (0, 0))[0] for tipo in TIPOS_VENTA_MEMBRESIA),
+        }
+
+
+if __name__ == "__main__":
+    # Herramientas del libro de caja, se ejecutan con:
+    #   python Caja.py migrar [registros/Caja.txt] [registros/caja]   -> archivos por mes con manifiesto
+    #   python Caja.py binario [registros/Caja.txt] [registros/Caja.bin]   -> libro binario en centavos
+    import sys
+
+    comando = sys.argv[1] if len(sys.argv) > 1 else ""
+    if comando == "migrar":
+        origen = sys.argv[2] if len(sys.argv) > 2 else "registros/Caja.txt"
+        destino = sys.argv[3] if len(sys.argv) > 3 else "registros/caja"
+        if os.path.exists(os.path.join(destino, "manifiesto.json")):
+            print(f"{destino} ya tiene un manifiesto, no se migra de nuevo.")
+        else:
+            resultado = migrar_caja_a_meses(origen, destino)
+            print(f"{resultado['registros']} registros migrados a {resultado['meses']} archivos mensuales en {destino}.")
+            print(f"El libro original se renombró a {resultado['original']}.")
+            if resultado["omitidos"]:
+                print(f"Lineas omitidas por estar malformadas: {resultado['omitidos']}")
+    elif comando == "binario":
+        origen = sys.argv[2] if len(sys.argv) > 2 else "registros/Caja.txt"
+        destino = sys.argv[3] if len(sys.argv) > 3 else "registros/Caja.bin"
+        resultado = convertir_caja_a_binario(origen, destino)
+        print(f"{resultado['convertidos']} registros convertidos a {destino}.")
+        if resultado["omitidos"]:
+            print(f"Lineas omitidas por estar malformadas: {resultado['omitidos']}")
+    else:
+        print("Uso: python Caja.py migrar|binario [origen] [destino]")
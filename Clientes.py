@@ -1,7 +1,26 @@
 from datetime import date, timedelta, datetime
 import Utils as ut
 from Utils import PRECIO_MEMBRESIA
+from Config import RegistrosConfig, OcupacionConfig
+from Registros import escritor_en_cola
+from Ocupacion import ocupacion_en_vivo
+from Asistencia import cubo_asistencia
 
+# ==== REGISTRO DE ENTRADAS ====
+
+def escritor_entradas():
+    """Retorna el EscritorEnCola compartido de 'registros/Entradas.txt', ver Config.RegistrosConfig."""
+    return escritor_en_cola("registros/Entradas.txt", RegistrosConfig.MAX_COLA_ENTRADAS,
+                            RegistrosConfig.REGISTROS_POR_GRUPO, RegistrosConfig.DURABLE)
+
+def cubo_entradas():
+    """Retorna el CuboAsistencia compartido de 'registros/Entradas.cubo.json', se carga desde el Gimnasio con el primer reporte."""
+    return cubo_asistencia("registros/Entradas.cubo.json")
+
+def ocupacion_gimnasio():
+    """Retorna la OcupacionGimnasio compartida que alimentan las entradas y salidas, ver Config.OcupacionConfig."""
+    return ocupacion_en_vivo("registros/Ocupacion.txt", OcupacionConfig.CAPACIDAD,
+                             OcupacionConfig.TIEMPO_MAXIMO_MIN, OcupacionConfig.VENTANA_PICO_MIN)
 
 
 # ==== CLIENTES Y MEMBRESÍA ====
@@ -9,16 +28,20 @@ from Utils import PRECIO_MEMBRESIA
 class Membresia:
     """_summary_
     Clase que representa una membresía de gimnasio, contiene información sobre el estado, fechas y métodos para gestionar la membresía.
+    Las fechas se guardan como Objetos date ya convertidos y se entregan como str 'YYYY-MM-DD'.
     
     Atributos:
         __pago (bool): Indica si la membresía ha sido pagada o no. Defaults to False.
-        __fecha_inicio (str): Fecha de inicio de la membresía.
-        __fecha_fin (str): Fecha de finalización de la membresía.
+        __fecha_inicio (date): Fecha de inicio de la membresía.
+        __fecha_fin (date): Fecha de finalización de la membresía.
     """
-    def __init__(self, fecha_inicio: str, fecha_fin: str, pago: bool = False):
+    # Sin __dict__ por instancia para reducir la memoria de cada membresía
+    __slots__ = ("__pago", "__fecha_inicio", "__fecha_fin")
+    
+    def __init__(self, fecha_inicio, fecha_fin, pago: bool = False):
         self.__pago = pago
-        self.__fecha_inicio = fecha_inicio
-        self.__fecha_fin = fecha_fin
+        self.__fecha_inicio = ut.a_fecha(fecha_inicio) # Se acepta str 'YYYY-MM-DD' u Objeto date
+        self.__fecha_fin = ut.a_fecha(fecha_fin)
     
     # Métodos de acceso y modificación
     
@@ -28,10 +51,18 @@ class Membresia:
     
     def get_fecha_inicio(self):
         # Retornar como string
-        return self.__fecha_inicio
+        return self.__fecha_inicio.isoformat()
     
     def get_fecha_fin(self):
         # Retornar como string
+        return self.__fecha_fin.isoformat()
+    
+    def get_fecha_inicio_obj(self):
+        # Retornar como Objeto date
+        return self.__fecha_inicio
+    
+    def get_fecha_fin_obj(self):
+        # Retornar como Objeto date
         return self.__fecha_fin
     
     def set_pago(self, estado: bool):
@@ -39,16 +70,15 @@ class Membresia:
     
     # Métodos
 
-    def calcular_dias_restantes(self):
+    def calcular_dias_restantes(self, hoy: date=None):
         """_summary_
             Calcula los días restantes para que la membresia expire.
+        Args:
+            hoy (date, optional): Fecha desde la que se cuenta, si no se da se usa ut.hoy(). Defaults to None.
         Returns:
             int: Número de días restantes.
         """
-        # Convertimos la fecha fin de str a objeto date
-        fecha_fin_obj = datetime.strptime(self.__fecha_fin, "%Y-%m-%d").date()
-        dias_restantes = (fecha_fin_obj - date.today()).days
-        return dias_restantes
+        return (self.__fecha_fin - (hoy or ut.hoy())).days
 
     def renovar_membresia(self, fecha_inicio: str=None, fecha_fin: str=None):
         """_summary_
@@ -69,23 +99,19 @@ class Membresia:
             print("La membresía aún está activa y no necesita renovación.")
             return False
         
-        # Obtenemos el objeto date actual si no se nos dia fecha de inicio
-        if fecha_inicio is None:
-            fecha_inicio = date.today()
-        else:
-            # Si se nos dio una fecha de inicio, la convertimos a objeto date para operar
-            fecha_inicio = datetime.strptime(fecha_inicio, "%Y-%m-%d").date()
+        # Obtenemos el objeto date actual si no se nos dia fecha de inicio, si se dio la convertimos a objeto date
+        fecha_inicio = ut.hoy() if fecha_inicio is None else ut.a_fecha(fecha_inicio)
         
         if fecha_fin is None:
             # Calcular la fecha de fin como 30 días después de el objeto fecha inicio
             fecha_fin = fecha_inicio + timedelta(days=30)
         else:
             # Si se nos dio una fecha de fin, la convertimos a objeto date
-            fecha_fin = datetime.strptime(fecha_fin, "%Y-%m-%d").date()
+            fecha_fin = ut.a_fecha(fecha_fin)
             
             
             # Calcular la diferencia en días
-            diferencia_dias = (nueva_fecha_fin - fecha_inicio).days
+            diferencia_dias = (fecha_fin - fecha_inicio).days
             # Comprobar si la diferencia es exactamente 30 días
             if diferencia_dias != 30:
                 print(f"La diferencia entre la fecha de inicio y fin es de {diferencia_dias} días, no los 30 días estándar.")
@@ -99,9 +125,10 @@ class Membresia:
                 
                 print(f"Se ha actualizado la fecha de fin a: {fecha_fin}")
         
-        self.__fecha_inicio = fecha_inicio.strftime("%Y-%m-%d") # Convertir a string
-        self.__fecha_fin = fecha_fin.strftime("%Y-%m-%d") # Convertir a string
-        print(f"Memebresia actualizada: Inicio: {self.__fecha_inicio}, Fin: {self.__fecha_fin}")
+        self.__fecha_inicio = fecha_inicio
+        self.__fecha_fin = fecha_fin
+        print(f"Memebresia actualizada: Inicio: {self.get_fecha_inicio()}, Fin: {self.get_fecha_fin()}")
+        return True
     
     def ver_info(self):
         """_summary_
@@ -130,6 +157,9 @@ class Cliente:
         __fecha_registro (str): Fecha de registro del cliente en el gimnasio.
         __membresia (Membresia, optional): Objeto Membresía asociada al cliente. Defaults to None.
     """
+    # Sin __dict__ por instancia para reducir la memoria de cada cliente
+    __slots__ = ("__id_cliente", "__nombre", "__documento", "__telefono", "__fecha_registro", "__membresia")
+    
     def __init__(self, id_cliente: int, nombre: str, documento: str, fecha_registro: str, telefono: str = None):
         self.__id_cliente = id_cliente
         self.__nombre = nombre
@@ -236,15 +266,35 @@ class Cliente:
         
         registro_entradas = "registros/Entradas.txt"
         
-        fecha = datetime.now().strftime('%Y-%m-%d') # Genera el objeto fecha y hora actual y lo convierte a fecha string
-        hora = datetime.now().strftime('%H:%M:%S') # Genera el objeto fecha y hora actual y lo convierte a hora string
+        ahora = ut.ahora() # Un solo Objeto fecha y hora actual para que fecha y hora sean consistentes
+        fecha = ahora.strftime('%Y-%m-%d') # Convierte el objeto fecha y hora a fecha string
+        hora = ahora.strftime('%H:%M:%S') # Convierte el objeto fecha y hora a hora string
         estado_membresia = self.__membresia.get_pago() if self.__membresia else "None" # Estado de la membresía (True/False/None)
         
         motivo_registro = f";{motivo}" if motivo else "" # sise coloco un motivo lo agrega al registro
         registro = f"{fecha};{hora};{self.__id_cliente};{self.__documento};{self.__nombre};{estado_membresia}{motivo_registro}\n"
         
-        # Guardar el registro en el archivo
-        with open(registro_entradas, "a") as entrada_file:
-            entrada_file.write(registro)
+        # Guardar el registro en el archivo, con la cola el hilo escritor lo lleva al disco en grupo
+        if RegistrosConfig.ENTRADAS_EN_COLA:
+            escritor_entradas().escribir(registro[:-1])
+        else:
+            with open(registro_entradas, "a") as entrada_file:
+                entrada_file.write(registro)
+        if motivo:
+            cubo_entradas().agregar(fecha, ahora.hour, motivo) # Sin motivo la linea no tiene tipo y no se cuenta
+        ocupacion_gimnasio().entrada(self.__id_cliente, ahora)
         
         print(f"✓ Entrada registrada para {self.__nombre} a las {hora}")
+
+    def registrar_salida(self):
+        """_summary_
+            Registra la salida del cliente del gimnasio en la ocupación en vivo.
+        Returns:
+            bool: True si el cliente estaba dentro, False si no registró entrada o ya se había dado por salido.
+        """
+        ahora = ut.ahora()
+        if not ocupacion_gimnasio().salida(self.__id_cliente, ahora):
+            print(f"{self.__nombre} no tiene una entrada registrada en el gimnasio.")
+            return False
+        print(f"✓ Salida registrada para {self.__nombre} a las {ahora.strftime('%H:%M:%S')}")
+        return True
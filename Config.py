@@ -22,7 +22,7 @@ class Precios:
 # ===== LÍMITES DEL SISTEMA =====
 class Limites:
     """Configuración de límites del sistema"""
-    MAX_CLIENTES = 50
+    MAX_CLIENTES = 50  # Capacidad inicial del almacen de clientes, crece al llenarse
     MAX_MEMBRESIAS = 50
     MAX_ENTRENADORES = 10
     MAX_SESIONES = 20
@@ -31,6 +31,26 @@ class Limites:
     # Duración de membresía en días
     DURACION_MEMBRESIA = 30
 
+# ===== ESCRITURA DE REGISTROS =====
+class RegistrosConfig:
+    """Configuración de la escritura en grupo de los archivos de registros (Caja.txt)"""
+    REGISTROS_POR_GRUPO = 32  # Se escribe al disco cada N registros
+    INTERVALO_MS = 500  # o cuando un registro lleva T milisegundos pendiente
+    DURABLE = False  # True: os.fsync en cada escritura de grupo, más lento pero no se pierde nada si se va la luz
+    CAJA_POR_MESES = False  # True: libro de caja en registros/caja/Caja_YYYY-MM.txt con manifiesto, si ya existe Caja.txt antes se migra con 'python Caja.py migrar'
+    AGREGADOS_CAJA = True  # Totales por mes y día en Caja.agregados.json, los reportes financieros no leen el libro de caja
+    CAJA_BINARIA = False  # True: además de Caja.txt se escribe Caja.bin (centavos enteros) y los reportes financieros lo leen
+    ENTRADAS_EN_COLA = True  # Las entradas van a una cola y un hilo en segundo plano las escribe en grupo en Entradas.txt
+    MAX_COLA_ENTRADAS = 1024  # Lineas de entradas que pueden esperar en la cola (las de un lote cuentan una por una), si se llena se espera al hilo escritor
+    PROCESOS_ANALISIS = None  # Procesos para leer los registros grandes por trozos en los reportes (None: todos los nucleos, 1: en serie)
+
+# ===== OCUPACIÓN DEL GIMNASIO =====
+class OcupacionConfig:
+    """Configuración de la ocupación en vivo del gimnasio (ver Ocupacion.py)"""
+    CAPACIDAD = 80  # Aforo maximo, con el gimnasio lleno la recepcion avisa antes de registrar una entrada
+    TIEMPO_MAXIMO_MIN = 180  # Minutos despues de los cuales un cliente que no marcó salida se da por salido
+    VENTANA_PICO_MIN = 60  # Minutos de la ventana del pico de ocupación
+
 # ===== CONFIGURACIÓN DE SESIONES =====
 class SesionesConfig:
     """Configuración de sesiones especiales"""
@@ -0,0 +1,23 @@
+# ===== ERRORES DEL SISTEMA =====
+"""
+Excepciones lanzadas por las operaciones del Gimnasio que no usan la consola.
+Los metodos interactivos las capturan y muestran su mensaje al usuario.
+"""
+
+class ErrorGimnasio(Exception):
+    """Error base de las operaciones del gimnasio"""
+
+class DatosInvalidos(ErrorGimnasio):
+    """Los datos proporcionados no cumplen el formato esperado"""
+
+class ClienteDuplicado(ErrorGimnasio):
+    """Ya existe un cliente registrado con el mismo documento"""
+
+class ClienteNoEncontrado(ErrorGimnasio):
+    """No existe un cliente con el ID o documento indicado"""
+
+class MembresiaExistente(ErrorGimnasio):
+    """El cliente ya tiene una membresía asignada"""
+
+class ArchivoInvalido(ErrorGimnasio):
+    """El archivo no existe, está vacío o no tiene el formato esperado"""
@@ -1,10 +1,22 @@
 import numpy as np
 from datetime import date, timedelta, datetime
 import json # Importante para la gestión de datos en formato JSON
+import os
+import gc
+import math
 import Utils as ut
 from Utils import PRECIO_MEMBRESIA, PRECIO_ENTRADA_UNICA
 
-from Clientes import Cliente, Membresia
+from Config import Limites, RegistrosConfig
+from Errores import ErrorGimnasio, DatosInvalidos, ClienteDuplicado, ClienteNoEncontrado, MembresiaExistente, ArchivoInvalido
+from Almacenamiento import AlmacenClientes, TablaClientes
+from Indices import IndiceNombres, ColaVencimientos
+from Registros import EscritorRegistro, IndiceFechas
+from Historico import HistoricoRegistros
+from Asistencia import resumen_histograma
+import Caja
+import Lectores
+from Clientes import Cliente, Membresia, escritor_entradas, cubo_entradas, ocupacion_gimnasio
 from Sesiones import Entrenador, SesionEspecial
 
 class Gimnasio:
@@ -17,10 +29,22 @@ class Gimnasio:
         __telefono (str): Número de teléfono del Gimnasio.
         __correo_electronico (str): Correo electrónico de contacto del Gimnasio.
         __efectivo (float, optional): Dinero en efectivo del Gimnasio. Defaults to 0.
-        __maximo_clientes (int): Número máximo de clientes que el gimnasio puede registrar. Defaults to 50.
-        __numero_clientes (int): Contador de clientes registrados.
         __historico_clientes (int): Contador de clientes históricos.
-        __clientes (np.ndarray): Array que almacena los clientes registrados.
+        __clientes (AlmacenClientes): Array que almacena los clientes registrados, crece a medida que se registran clientes.
+        __indice_id (dict): Indice ID de Cliente -> posicion en el array de clientes.
+        __indice_documento (dict): Indice Documento -> posicion en el array de clientes.
+        __indice_nombre (dict): Indice Nombre normalizado -> conjunto de posiciones en el array de clientes.
+        __indice_prefijos (IndiceNombres): Indice ordenado de nombres para busquedas por prefijo.
+        __vencimientos (ColaVencimientos): Cola de prioridad de las membresías vigentes ordenadas por fecha de fin.
+        __tabla (TablaClientes): Columnas de NumPy con los datos de clientes y membresías, en las mismas posiciones que __clientes.
+        __caja (CajaPorMeses | EscritorRegistro): Libro de caja por meses en 'registros/caja/', o escritor en grupo
+            de 'registros/Caja.txt' si RegistrosConfig.CAJA_POR_MESES es False.
+        __caja_binaria (EscritorRegistro): Escritor en grupo de 'registros/Caja.bin', None si RegistrosConfig.CAJA_BINARIA es False.
+        __tipos_caja (TiposCaja): Codigos de los tipos de transaccion de 'registros/Caja.bin' (o de los arrays de NumPy
+            de la caja de texto si RegistrosConfig.CAJA_BINARIA es False), se carga con el primer uso.
+        __agregados_caja (AgregadosCaja): Totales de la caja por mes, día y tipo, se cargan con el primer uso.
+        __indices_fechas (dict): Ruta de un archivo de registros -> IndiceFechas, se crean con el primer uso.
+        __historico (HistoricoRegistros): Resumenes y archivos comprimidos de los meses compactados en 'registros/historico'.
         __historico_entrenadores (int): Contador de entrenadores históricos.
         __entrenadores (list): Lista que almacena los objetos Entrenadores de los entrenadores registrados.
         __historico_sesiones (int): Contador de sesiones especiales históricas.
@@ -34,11 +58,30 @@ class Gimnasio:
         self.__correo_electronico = correo
         
         self.__efectivo = efectivo
+        if RegistrosConfig.CAJA_POR_MESES:
+            self.__caja = Caja.CajaPorMeses("registros/caja", RegistrosConfig.REGISTROS_POR_GRUPO, RegistrosConfig.INTERVALO_MS,
+                                            RegistrosConfig.DURABLE, ruta_original="registros/Caja.txt")
+        else:
+            self.__caja = EscritorRegistro("registros/Caja.txt", RegistrosConfig.REGISTROS_POR_GRUPO,
+                                           RegistrosConfig.INTERVALO_MS, RegistrosConfig.DURABLE)
+        self.__caja_binaria = None
+        if RegistrosConfig.CAJA_BINARIA:
+            self.__caja_binaria = EscritorRegistro("registros/Caja.bin", RegistrosConfig.REGISTROS_POR_GRUPO,
+                                                   RegistrosConfig.INTERVALO_MS, RegistrosConfig.DURABLE, binario=True)
+        self.__tipos_caja = None
+        self.__agregados_caja = None
+        self.__indices_fechas = {}
+        self.__historico = HistoricoRegistros("registros/historico")
 
-        self.__maximo_clientes = 50
-        self.__numero_clientes = 0
         self.__historico_clientes = 0
-        self.__clientes = np.full(self.__maximo_clientes, None, dtype=object)
+        self.__clientes = AlmacenClientes(Limites.MAX_CLIENTES)
+        # Indices para busquedas en O(1), se mantienen sincronizados al crear y eliminar clientes
+        self.__indice_id = {}
+        self.__indice_documento = {}
+        self.__indice_nombre = {}
+        self.__indice_prefijos = IndiceNombres()
+        self.__tabla = TablaClientes(Limites.MAX_CLIENTES)
+        self.__vencimientos = ColaVencimientos()
         self.__historico_entrenadores = 0
         self.__entrenadores = []
         self.__historico_sesiones = 0
@@ -50,12 +93,1021 @@ class Gimnasio:
     def get(self):
         return self.__clientes, self.__entrenadores, self.__sesiones
 
+    def get_tabla(self):
+        return self.__tabla
+
+    def get_efectivo(self):
+        return self.__efectivo
+
+    def cerrar(self):
+        """Escribe al disco los registros pendientes y cierra los archivos de registros, se llama al salir del programa."""
+        self.__caja.cerrar()
+        escritor_entradas().cerrar()
+        cubo_entradas().guardar(self.__rutas_cubo()) # Solo si se cargó, con las entradas ya en el disco
+        ocupacion_gimnasio().cerrar()
+        if self.__agregados_caja is not None:
+            self.__agregados_caja.guardar(self.__libros_caja())
+        if self.__caja_binaria is not None:
+            self.__caja_binaria.cerrar()
+
     def ver_info(self):
         """_summary_
             Imprime el nombre, telefono de contacto del gimnasio y direccion
         """        
         print(f"Gimnasio {self.__nombre}, Tel: {self.__telefono},\nCorreo: {self.__correo_electronico}, nos encontramos ubicados en {self.__direccion}")
 
+    #? ============================== Indices de Clientes ==============================
+
+    def __indexar_cliente(self, posicion: int, cliente):
+        """Agrega el Cliente en la posicion dada a los indices de ID, Documento y Nombre."""
+        self.__indice_id[cliente.get_id_cliente()] = posicion
+        self.__indice_documento[cliente.get_documento()] = posicion
+        nombre = ut.normalizar_nombre(cliente.get_nombre())
+        self.__indice_nombre.setdefault(nombre, set()).add(posicion)
+        self.__indice_prefijos.agregar(nombre, cliente.get_id_cliente())
+        self.__tabla.guardar_cliente(posicion, cliente)
+
+    def __indexar_clientes_lote(self, posiciones: list, clientes: list):
+        """Agrega Clientes nuevos (sin membresía) a los indices, ordenando el indice de prefijos una sola vez."""
+        ids = [cliente.get_id_cliente() for cliente in clientes]
+        nombres = [ut.normalizar_nombre(cliente.get_nombre()) for cliente in clientes]
+        self.__indice_id.update(zip(ids, posiciones))
+        self.__indice_documento.update(zip((cliente.get_documento() for cliente in clientes), posiciones))
+        for nombre, posicion in zip(nombres, posiciones):
+            self.__indice_nombre.setdefault(nombre, set()).add(posicion)
+        self.__indice_prefijos.agregar_lote(list(zip(nombres, ids)))
+        self.__tabla.guardar_clientes(posiciones, clientes)
+
+    def __desindexar_cliente(self, posicion: int, cliente):
+        """Retira el Cliente en la posicion dada de los indices de ID, Documento y Nombre."""
+        self.__indice_id.pop(cliente.get_id_cliente(), None)
+        self.__indice_documento.pop(cliente.get_documento(), None)
+        nombre = ut.normalizar_nombre(cliente.get_nombre())
+        posiciones = self.__indice_nombre.get(nombre)
+        if posiciones is not None:
+            posiciones.discard(posicion)
+            if not posiciones: # Si ya no quedan clientes con ese nombre se elimina la llave
+                del self.__indice_nombre[nombre]
+        self.__indice_prefijos.eliminar(nombre, cliente.get_id_cliente())
+        self.__tabla.eliminar(posicion)
+        self.__vencimientos.cancelar(cliente.get_id_cliente())
+
+    def __sincronizar_membresia(self, cliente):
+        """Actualiza la fila de la tabla columnar y la cola de vencimientos con el estado actual de la membresía del Cliente."""
+        posicion = self.__indice_id.get(cliente.get_id_cliente())
+        if posicion is not None:
+            self.__tabla.guardar_membresia(posicion, cliente.get_membresia())
+        membresia = cliente.get_membresia()
+        if membresia is None:
+            self.__vencimientos.cancelar(cliente.get_id_cliente())
+        else:
+            self.__vencimientos.programar(cliente.get_id_cliente(), membresia.get_fecha_fin_obj())
+
+    def __cliente_de_membresia(self, membresia):
+        """Retorna el Cliente dueño de la Membresia, recorriendo los clientes (solo se usa si no se conoce el Cliente)."""
+        for cliente in self.__clientes:
+            if cliente.get_membresia() is membresia:
+                return cliente
+        return None
+
+    def cliente_por_id(self, id_cliente: int):
+        """Retorna el Objeto Cliente con el ID dado o None si no existe."""
+        posicion = self.__indice_id.get(id_cliente)
+        return None if posicion is None else self.__clientes[posicion]
+
+    def cliente_por_documento(self, documento: str):
+        """Retorna el Objeto Cliente con el Documento dado o None si no existe."""
+        posicion = self.__indice_documento.get(documento)
+        return None if posicion is None else self.__clientes[posicion]
+
+    def __posicion_cliente(self, identificador):
+        # Posicion en el array de clientes de un ID de Cliente (int) o Documento (str)
+        indice = self.__indice_id if isinstance(identificador, int) else self.__indice_documento
+        posicion = indice.get(identificador)
+        if posicion is None:
+            tipo = "ID" if isinstance(identificador, int) else "Documento"
+            raise ClienteNoEncontrado(f"No existe un cliente con {tipo} '{identificador}'.")
+        return posicion
+
+    def obtener_cliente(self, identificador):
+        """_summary_
+            Busca sin usar la consola un cliente por ID o por Documento en los indices, en O(1).
+        Args:
+            identificador (int | str): ID de Cliente (int) o Documento (str).
+        Returns:
+            Cliente: Objeto Cliente encontrado.
+        Raises:
+            ClienteNoEncontrado: Si no existe un cliente con ese ID o Documento.
+        """
+        return self.__clientes[self.__posicion_cliente(identificador)]
+
+    def clientes_por_nombre(self, nombre: str):
+        """Retorna la lista de Clientes cuyo nombre coincide (sin importar mayusculas), ordenada por ID."""
+        posiciones = self.__indice_nombre.get(ut.normalizar_nombre(nombre), ())
+        clientes = [self.__clientes[posicion] for posicion in posiciones]
+        return sorted(clientes, key=lambda cliente: cliente.get_id_cliente())
+
+    def contar_vencimientos(self, dias: int = 7, solo_pagas: bool = True):
+        """_summary_
+            Cuenta las membresías que vencen desde hoy hasta dentro de los dias dados, con una expresion sobre la tabla columnar.
+        Args:
+            dias (int, optional): Numero de dias hacia adelante. Defaults to 7.
+            solo_pagas (bool, optional): Si es True solo se cuentan las membresías pagadas. Defaults to True.
+        Returns:
+            int: Numero de membresías que vencen en el periodo.
+        """
+        hoy = ut.hoy()
+        return int(self.__tabla.vencen_entre(hoy, hoy + timedelta(days=dias), solo_pagas).sum())
+
+    def buscar_clientes_por_prefijo(self, prefijo: str, pagina: int = 0, tamano_pagina: int = 20):
+        """_summary_
+            Busca los clientes cuyo nombre empieza por el prefijo (sin importar mayusculas), ordenados por nombre.
+        Args:
+            prefijo (str): Inicio del nombre a buscar, por ejemplo "ale" encuentra a Alejandra y Alejandro.
+            pagina (int, optional): Numero de pagina empezando en 0. Defaults to 0.
+            tamano_pagina (int, optional): Numero de clientes por pagina. Defaults to 20.
+        Returns:
+            (list, int): Lista de Clientes de la pagina y total de coincidencias.
+        """
+        entradas, total = self.__indice_prefijos.buscar(ut.normalizar_nombre(prefijo), pagina, tamano_pagina)
+        return [self.cliente_por_id(id_cliente) for _, id_cliente in entradas], total
+
+    #? ============================== Operaciones sin Consola ==============================
+    # Estas operaciones no usan print() ni input(), retornan resultados o lanzan errores de Errores.py.
+    # Los metodos interactivos de las siguientes secciones solo piden datos y muestran sus resultados.
+
+    def registrar_cliente(self, nombre: str, documento: str, telefono: str=None, fecha_registro: str=None):
+        """_summary_
+            Registra un nuevo Cliente en el array de clientes sin usar la consola.
+        Args:
+            nombre (str): Nombre del Cliente.
+            documento (str): Documento de indentidad del Cliente.
+            telefono (str, optional): Numero de Telefono del Cliente. Defaults to None.
+            fecha_registro (str, optional): Fecha de Registro del Cliente (YYYY-MM-DD), si no se da se usa la fecha actual. Defaults to None.
+        Returns:
+            Cliente: Objeto Cliente creado.
+        Raises:
+            DatosInvalidos: Si el nombre, documento, telefono o fecha de registro no son validos.
+            ClienteDuplicado: Si ya existe un Cliente con el mismo documento.
+        """
+        fecha_registro = self.__validar_datos_cliente(nombre, documento, telefono, fecha_registro)
+        
+        if documento in self.__indice_documento:
+            raise ClienteDuplicado(f"El cliente con documento {documento} ya está registrado.")
+        
+        id_cliente = self.__historico_clientes + 1 # Se genera un ID para el cliente basado en el contador de clientes históricos
+        nuevo_cliente = Cliente(id_cliente, nombre.lower(), documento, fecha_registro, telefono)
+        # Guardamos la referencia del cliente en el array de clientes, reutilizando un espacio libre o creciendo si está lleno
+        posicion = self.__clientes.agregar(nuevo_cliente)
+        self.__indexar_cliente(posicion, nuevo_cliente)
+        self.__historico_clientes += 1 # Incrementamos el contador de clientes históricos
+        return nuevo_cliente
+
+    def __validar_datos_cliente(self, nombre: str, documento: str, telefono: str=None, fecha_registro: str=None, fechas_validas: set=None):
+        """_summary_
+            Valida los datos de un Cliente sin usar la consola.
+        Args:
+            fechas_validas (set, optional): Fechas ya validadas, para no volver a validar la misma fecha en una carga por lotes. Defaults to None.
+        Returns:
+            str: Fecha de registro, la fecha actual si no se dio ninguna.
+        Raises:
+            DatosInvalidos: Si el nombre, documento, telefono o fecha de registro no son validos.
+        """
+        if not nombre or not ut.es_texto(nombre):
+            raise DatosInvalidos(f"El Nombre '{nombre}' debe ser valido y no debe contener números ni símbolos ni espacios.")
+        if not documento or not ut.es_numero(documento):
+            raise DatosInvalidos(f"El Documento '{documento}' debe ser un número válido, sin espacios.")
+        if telefono and not ut.es_numero(telefono):
+            raise DatosInvalidos(f"El Telefono '{telefono}' debe ser un número válido, sin espacios.")
+        
+        if not fecha_registro:
+            return ut.hoy().strftime("%Y-%m-%d") # Si no se proporciona fecha, se usa la fecha actual
+        if fechas_validas is not None and fecha_registro in fechas_validas:
+            return fecha_registro
+        if not ut.es_fecha(fecha_registro):
+            raise DatosInvalidos(f"La fecha de registro '{fecha_registro}' debe estar en formato 'YYYY-MM-DD'.")
+        if fechas_validas is not None:
+            fechas_validas.add(fecha_registro)
+        return fecha_registro
+
+    def registrar_clientes_lote(self, registros):
+        """_summary_
+            Registra varios Clientes de una vez sin usar la consola.
+            Valida todos los registros y descarta los documentos repetidos (contra los clientes existentes y dentro del lote)
+            en una sola pasada con el indice de documentos, luego guarda los clientes aceptados en bloque en el array,
+            la tabla columnar y los indices. Los IDs se asignan en el orden de los registros aceptados.
+        Args:
+            registros (iterable): Registros (nombre, documento, telefono, fecha_registro) como tuplas o diccionarios
+                con esas llaves, el telefono y la fecha de registro son opcionales.
+        Returns:
+            list: Un resultado por registro, en el mismo orden: el Objeto Cliente creado o el ErrorGimnasio
+                (DatosInvalidos o ClienteDuplicado) que explica por qué se rechazó.
+        """
+        # Se pausa el recolector de basura mientras se crean los objetos, en un lote grande sus pasadas cuestan más que la carga
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            return self.__registrar_clientes_lote(registros)
+        finally:
+            if recolector_activo:
+                gc.enable()
+
+    def __registrar_clientes_lote(self, registros):
+        resultados = []
+        nuevos = []
+        documentos_lote = set()
+        fechas_validas = set()
+        id_cliente = self.__historico_clientes
+        
+        for registro in registros:
+            if isinstance(registro, dict):
+                nombre = registro.get("nombre")
+                documento = registro.get("documento")
+                telefono = registro.get("telefono")
+                fecha_registro = registro.get("fecha_registro")
+            else:
+                nombre, documento, telefono, fecha_registro = (tuple(registro) + (None, None))[:4]
+            
+            try:
+                fecha_registro = self.__validar_datos_cliente(nombre, documento, telefono, fecha_registro, fechas_validas)
+            except DatosInvalidos as e:
+                resultados.append(e)
+                continue
+            if documento in self.__indice_documento or documento in documentos_lote:
+                resultados.append(ClienteDuplicado(f"El cliente con documento {documento} ya está registrado."))
+                continue
+            
+            documentos_lote.add(documento)
+            id_cliente += 1
+            nuevo_cliente = Cliente(id_cliente, nombre.lower(), documento, fecha_registro, telefono)
+            nuevos.append(nuevo_cliente)
+            resultados.append(nuevo_cliente)
+        
+        if nuevos:
+            posiciones = self.__clientes.agregar_lote(nuevos)
+            self.__indexar_clientes_lote(posiciones, nuevos)
+            self.__historico_clientes = id_cliente
+        return resultados
+
+    def registrar_membresia(self, cliente, fecha_inicio: str=None, fecha_fin: str=None, pago: bool=False):
+        """_summary_
+            Crea la Membresia de un Cliente sin usar la consola ni registrar pagos en Caja.
+            La Membresia siempre dura 30 dias, si la fecha de fin dada no coincide se corrige.
+        Args:
+            cliente (Cliente): Objeto Cliente al que se le asignara la Membresia.
+            fecha_inicio (str, optional): Fecha de inicio (YYYY-MM-DD), si no se da se usa la fecha actual. Defaults to None.
+            fecha_fin (str, optional): Fecha de finalizacion (YYYY-MM-DD). Defaults to None.
+            pago (bool, optional): Estado de pago de la Membresia. Defaults to False.
+        Returns:
+            Membresia: Objeto Membresia creado.
+        Raises:
+            MembresiaExistente: Si el Cliente ya tiene membresia.
+            DatosInvalidos: Si alguna de las fechas no tiene el formato 'YYYY-MM-DD'.
+        """
+        if cliente.get_membresia():
+            raise MembresiaExistente(f"El cliente {cliente.get_nombre()} ya tiene membresia.")
+        
+        if fecha_inicio and not ut.es_fecha(fecha_inicio):
+            raise DatosInvalidos(f"La fecha de inicio '{fecha_inicio}' debe estar en formato 'YYYY-MM-DD'.")
+        if fecha_fin and not ut.es_fecha(fecha_fin):
+            raise DatosInvalidos(f"La fecha de fin '{fecha_fin}' debe estar en formato 'YYYY-MM-DD'.")
+        inicio = datetime.strptime(fecha_inicio, "%Y-%m-%d").date() if fecha_inicio else ut.hoy() # Mismo formato que valida ut.es_fecha
+        
+        fin = inicio + timedelta(days=30) # La membresia siempre dura 30 dias
+        
+        nueva_membresia = Membresia(inicio, fin, pago)
+        cliente.set_membresia(nueva_membresia)
+        self.__sincronizar_membresia(cliente)
+        return nueva_membresia
+
+    def registrar_ingreso_caja(self, efectivo: float, motivo: str=None):
+        """_summary_
+            Suma el efectivo a la caja del gimnasio y registra el ingreso en el libro de caja sin usar la consola
+            (el archivo del mes en 'registros/caja/', o 'registros/Caja.txt' si RegistrosConfig.CAJA_POR_MESES es False).
+            El registro se escribe en grupo con otros, ver Config.RegistrosConfig.
+        Args:
+            efectivo (float): Efectivo a ingresar en la caja del gimnasio.
+            motivo (str, optional): Tipo del ingreso. Defaults to "Ingreso".
+        Returns:
+            dict: Registro guardado con fecha, hora, tipo, monto y el efectivo resultante.
+        Raises:
+            DatosInvalidos: Si el efectivo no es un número positivo.
+        """
+        try:
+            monto = float(efectivo)
+        except (TypeError, ValueError):
+            raise DatosInvalidos(f"El efectivo '{efectivo}' debe ser un número válido.")
+        if not (0 < monto < math.inf):
+            raise DatosInvalidos(f"El efectivo '{efectivo}' debe ser un número positivo.")
+        
+        ahora = ut.ahora() # Un solo Objeto fecha y hora para que fecha y hora sean consistentes
+        registro = {
+            "fecha": ahora.strftime('%Y-%m-%d'),
+            "hora": ahora.strftime('%H:%M:%S'),
+            "tipo": motivo if motivo else "Ingreso", # Si no se proporciona motivo, se usa "Ingreso" como predeterminado
+            "monto": monto,
+        }
+        
+        # Guardar el registro en formato: fecha;hora;tipo;efectivo, el escritor lo lleva al disco en grupo
+        self.__caja.escribir(f"{registro['fecha']};{registro['hora']};{registro['tipo']};{monto:,}")
+        if self.__caja_binaria is not None:
+            tipos = self.__preparar_caja_binaria()
+            self.__caja_binaria.escribir(Caja.empaquetar(registro["fecha"], registro["hora"], tipos.codigo(registro["tipo"]), Caja.a_centavos(monto)))
+        if self.__agregados_caja is not None:
+            self.__agregados_caja.agregar(registro["fecha"], registro["tipo"], Caja.a_centavos(monto))
+        
+        self.__efectivo += monto
+        registro["efectivo"] = self.__efectivo
+        return registro
+
+    def registrar_entradas_lote(self, identificadores, motivo: str = "General"):
+        """_summary_
+            Registra sin usar la consola las entradas de varios clientes que llegan juntos al torniquete.
+            Busca todos los clientes en los indices, calcula el estado de sus membresías con una sola fecha y hora
+            sobre la tabla columnar y pone todas las lineas de 'registros/Entradas.txt' en la cola del escritor de una vez
+            (cada linea cuenta contra Config.MAX_COLA_ENTRADAS).
+            Las entradas se registran aunque la membresía no esté vigente (como Cliente.registrar_entrada), el resultado
+            tiene la alerta para que la recepcion decida.
+        Args:
+            identificadores (iterable): IDs de Cliente (int) o Documentos (str).
+            motivo (str, optional): Tipo de la entrada, sin motivo la linea no tiene tipo (como Cliente.registrar_entrada). Defaults to "General".
+        Returns:
+            list: Un diccionario por identificador, en el mismo orden, con 'identificador', 'cliente' (Objeto Cliente o None),
+                'pago' (estado de pago de la membresía o None), 'dias_restantes' (int o None) y 'alerta'
+                (None, "No encontrado", "Sin membresía" o "Membresía vencida").
+        """
+        ahora = ut.ahora() # Una sola fecha y hora para todas las entradas del lote
+        fecha = ahora.strftime('%Y-%m-%d')
+        hora = ahora.strftime('%H:%M:%S')
+        motivo_registro = f";{motivo}" if motivo else ""
+        
+        resultados = []
+        posiciones = []
+        for identificador in identificadores:
+            try:
+                posicion = self.__posicion_cliente(identificador)
+            except ClienteNoEncontrado:
+                posicion = None # El lote sigue, el resultado lleva la alerta
+            resultados.append({"identificador": identificador,
+                               "cliente": None if posicion is None else self.__clientes[posicion],
+                               "pago": None, "dias_restantes": None,
+                               "alerta": "No encontrado" if posicion is None else None})
+            if posicion is not None:
+                posiciones.append(posicion)
+        
+        # Estado de todas las membresías del lote con una expresion sobre la tabla columnar
+        filas = np.asarray(posiciones, dtype=np.int64)
+        tiene_membresia = self.__tabla.get_tiene_membresia()[filas].tolist()
+        pagos = self.__tabla.get_pagos()[filas].tolist()
+        dias_restantes = (self.__tabla.get_fechas_fin()[filas] - np.datetime64(ahora.date(), "D")).astype(np.int64).tolist()
+        
+        lineas = []
+        encontrados = (resultado for resultado in resultados if resultado["cliente"] is not None)
+        for resultado, membresia, pago, dias in zip(encontrados, tiene_membresia, pagos, dias_restantes):
+            cliente = resultado["cliente"]
+            if not membresia:
+                resultado["alerta"] = "Sin membresía"
+            else:
+                resultado["pago"] = pago
+                resultado["dias_restantes"] = dias
+                if dias < 0:
+                    resultado["alerta"] = "Membresía vencida"
+            # Mismo formato que Cliente.registrar_entrada: Fecha;Hora;ID;Documento;Nombre;Membresía(False/True/None);Motivo
+            lineas.append(f"{fecha};{hora};{cliente.get_id_cliente()};{cliente.get_documento()};{cliente.get_nombre()};"
+                          f"{pago if membresia else 'None'}{motivo_registro}")
+        
+        if lineas:
+            if RegistrosConfig.ENTRADAS_EN_COLA:
+                escritor_entradas().escribir_lote(lineas)
+            else:
+                with open("registros/Entradas.txt", "a", encoding="utf-8") as archivo:
+                    archivo.write("\n".join(lineas) + "\n")
+            if motivo:
+                cubo_entradas().agregar(fecha, ahora.hour, motivo, len(lineas)) # Sin motivo la linea no tiene tipo y no se cuenta
+            ocupacion = ocupacion_gimnasio()
+            for resultado in resultados:
+                if resultado["cliente"] is not None:
+                    ocupacion.entrada(resultado["cliente"].get_id_cliente(), ahora)
+        return resultados
+
+    def clasificar_membresias(self):
+        """_summary_
+            Clasifica a los clientes segun el estado de su membresía sin usar la consola, con mascaras sobre la tabla columnar.
+        Returns:
+            dict: Arrays de posiciones en el array de clientes 'sin_membresia', 'en_deuda', 'por_vencer' (≤ 7 días)
+                y 'vencidas' (< 0 días), y 'dias_restantes' indexable por esas posiciones.
+        """
+        return self.__tabla.clasificar_membresias(ut.hoy())
+
+    def membresias_por_vencer(self, dias: int = 7):
+        """_summary_
+            Busca en la cola de vencimientos las membresías que vencen desde hoy hasta dentro de los dias dados,
+            sin recorrer todos los clientes. Antes se hace el barrido de las que ya vencieron.
+        Args:
+            dias (int, optional): Numero de dias hacia adelante. Defaults to 7.
+        Returns:
+            list: Lista de tuplas (Cliente, días restantes) ordenada por fecha de fin.
+        """
+        hoy = ut.hoy()
+        self.__vencimientos.barrer(hoy)
+        return [(self.cliente_por_id(id_cliente), (fecha_fin - hoy).days)
+                for id_cliente, fecha_fin in self.__vencimientos.vencen_hasta(hoy + timedelta(days=dias))]
+
+    def barrido_vencimientos(self):
+        """_summary_
+            Barrido diario: saca de la cola las membresías que vencieron desde el ultimo barrido.
+        Returns:
+            list: Lista de tuplas (Cliente, fecha de fin) de las membresías que acaban de vencer.
+        """
+        return [(self.cliente_por_id(id_cliente), fecha_fin) for id_cliente, fecha_fin in self.__vencimientos.barrer(ut.hoy())]
+
+    def clientes_en_posiciones(self, posiciones):
+        """Retorna la lista de Clientes guardados en las posiciones dadas (por ejemplo las de clasificar_membresias)."""
+        return [self.__clientes[posicion] for posicion in posiciones]
+
+    def importar_clientes(self, ruta: str):
+        """_summary_
+            Carga clientes y sus membresías desde un archivo .txt separado por ';' sin usar la consola.
+            Formato: Nombre;Documento;Telefono;Fecha Registro;Membresia:Pago;Membresia:Fecha Inicio;Membresia:Fecha Fin
+        Args:
+            ruta (str): Ruta del archivo a cargar.
+        Returns:
+            dict: Resumen de la carga con 'encabezados', 'lineas_procesadas', 'clientes_cargados',
+                'membresias_cargadas' y 'errores' (lista de tuplas (numero de linea, motivo)).
+        Raises:
+            ArchivoInvalido: Si el archivo no existe, está vacío, no tiene 7 columnas o solo tiene encabezados.
+        """
+        try:
+            with open(ruta, "r") as archivo:
+                lineas = archivo.readlines()
+        except OSError as e:
+            raise ArchivoInvalido(f"No se pudo leer el archivo {ruta}: {e}")
+        
+        if not lineas:
+            raise ArchivoInvalido(f"El archivo {ruta} está vacío.")
+        encabezados = lineas[0].strip().split(";")
+        if len(encabezados) != 7:
+            raise ArchivoInvalido(f"El archivo {ruta} tiene {len(encabezados)} columnas, se esperaban 7.")
+        if len(lineas) <= 1:
+            raise ArchivoInvalido(f"El archivo {ruta} solo contiene encabezados, no hay datos para cargar.")
+        
+        inval = [None, "None", "none", "", " ", "0", 0] # Valores inválidos
+        resumen = {
+            "encabezados": encabezados,
+            "lineas_procesadas": 0,
+            "clientes_cargados": 0,
+            "membresias_cargadas": 0,
+            "errores": [],
+        }
+        
+        # Primera pasada: separar las lineas validas para registrar todos los clientes en un solo lote
+        numeros_linea = []
+        filas = []
+        for numero_linea in range(2, len(lineas) + 1):
+            resumen["lineas_procesadas"] += 1
+            linea = lineas[numero_linea - 1].strip().split(";")
+            
+            if len(linea) < 7:
+                resumen["errores"].append((numero_linea, f"Línea malformada (solo {len(linea)} columnas)"))
+                continue
+            numeros_linea.append(numero_linea)
+            filas.append(linea)
+        
+        # Validación para teléfono: si es "0", "None", "none" o vacío, se convierte a None
+        resultados = self.registrar_clientes_lote(
+            (linea[0], linea[1], None if linea[2].lower() in inval else linea[2], linea[3]) for linea in filas
+        )
+        
+        # Segunda pasada: membresías de los clientes registrados
+        for numero_linea, linea, cliente in zip(numeros_linea, filas, resultados):
+            if isinstance(cliente, ErrorGimnasio):
+                resumen["errores"].append((numero_linea, str(cliente)))
+                continue
+            resumen["clientes_cargados"] += 1
+            
+            # Verificar si el cliente tiene datos de membresía válidos
+            if linea[4] in inval or linea[5] in inval:
+                resumen["errores"].append((numero_linea, "Cliente sin membresía o datos de membresía inválidos"))
+                continue
+            if linea[4].lower() not in ["true", "false"]:
+                resumen["errores"].append((numero_linea, "Estado de pago inválido, se omitió la membresía"))
+                continue
+            
+            # La fecha de fin es opcional, si es inválida se calcula automáticamente (+30 días)
+            fecha_fin = linea[6] if linea[6] not in inval and ut.es_fecha(linea[6]) else None
+            try:
+                self.registrar_membresia(cliente, linea[5], fecha_fin, linea[4].lower() == "true")
+            except DatosInvalidos as e:
+                resumen["errores"].append((numero_linea, f"{e} Se omitió la membresía"))
+                continue
+            resumen["membresias_cargadas"] += 1
+        
+        resumen["errores"].sort(key=lambda error: error[0]) # En orden de linea, como se leyeron
+        return resumen
+
+    def __rutas_caja(self, meses=None):
+        """_summary_
+            Retorna los archivos de texto del libro de caja, con los ingresos pendientes ya escritos.
+        Args:
+            meses (list, optional): Lista de tuplas (año, mes), con el libro por meses solo se retornan sus archivos. Defaults to None.
+        """
+        self.__caja.vaciar()
+        if isinstance(self.__caja, Caja.CajaPorMeses):
+            return self.__caja.rutas(meses)
+        return ["registros/Caja.txt"] if os.path.exists("registros/Caja.txt") else []
+
+    def __ruta_entradas(self):
+        """Retorna la ruta de 'registros/Entradas.txt' despues de esperar a que se escriban las entradas de la cola."""
+        escritor_entradas().vaciar()
+        return "registros/Entradas.txt"
+
+    def __rutas_cubo(self):
+        """Retorna los resumenes de los meses compactados de entradas seguidos de 'registros/Entradas.txt', las fuentes del cubo."""
+        return self.__historico.rutas_resumen("Entradas") + ["registros/Entradas.txt"]
+
+    def __libros_caja(self, meses=None):
+        """Retorna los archivos de texto del libro de caja seguidos de los resumenes de los meses compactados."""
+        return self.__rutas_caja(meses) + self.__historico.rutas_resumen("Caja", meses)
+
+    def __indice_fechas(self, ruta: str):
+        """Retorna el IndiceFechas del archivo de registros dado, creandolo con el primer uso."""
+        if ruta not in self.__indices_fechas:
+            self.__indices_fechas[ruta] = IndiceFechas(ruta)
+        return self.__indices_fechas[ruta]
+
+    def reconstruir_indices_fechas(self):
+        """_summary_
+            Reconstruye desde cero los indices de fechas de 'registros/Entradas.txt' y de los archivos del libro de caja.
+        Returns:
+            dict: Ruta de cada archivo -> numero de lineas indexadas.
+        """
+        rutas = self.__rutas_caja()
+        if os.path.exists(self.__ruta_entradas()):
+            rutas.append("registros/Entradas.txt")
+        return {ruta: self.__indice_fechas(ruta).reconstruir() for ruta in rutas}
+
+    def compactar_registros(self, hoy=None):
+        """_summary_
+            Compacta sin usar la consola los meses cerrados (anteriores al mes de hoy) de la caja y de 'registros/Entradas.txt':
+            sus lineas se resumen por día, hora y tipo en el historico y se mueven a archivos comprimidos.
+            Los reportes leen despues los resumenes de esos meses y las lineas solo del mes abierto.
+        Args:
+            hoy (date | str, optional): Fecha actual (Objeto date o 'YYYY-MM-DD'). Defaults to None (ut.hoy()).
+        Returns:
+            dict: 'Caja' y 'Entradas', cada uno mes 'YYYY-MM' -> numero de lineas compactadas.
+        """
+        mes_abierto = ut.a_fecha(hoy if hoy is not None else ut.hoy()).strftime("%Y-%m")
+        if self.__caja_binaria is not None:
+            self.__preparar_caja_binaria() # Caja.bin se crea desde el texto, antes de que las lineas pasen al historico
+        if self.__agregados_caja is not None:
+            self.__agregados_caja.guardar(self.__libros_caja())
+
+        if isinstance(self.__caja, Caja.CajaPorMeses):
+            caja = self.__caja.compactar(mes_abierto, self.__historico)
+        else:
+            self.__caja.cerrar() # Caja.txt se reescribe, se vuelve a abrir con el siguiente ingreso
+            caja = self.__historico.compactar_archivo("registros/Caja.txt", "Caja", mes_abierto)
+        escritor_entradas().cerrar() # Entradas.txt se reescribe, se vuelve a abrir con la siguiente entrada
+        entradas = self.__historico.compactar_archivo("registros/Entradas.txt", "Entradas", mes_abierto)
+
+        # Los indices de fechas y los agregados apuntaban a los archivos anteriores, se vuelven a crear con el siguiente uso
+        self.__indices_fechas = {}
+        if entradas and cubo_entradas().get_cargado():
+            cubo_entradas().reconstruir(self.__rutas_cubo()) # Desde los resumenes y el mes abierto, son pocas lineas
+        if caja:
+            self.__agregados_caja = None
+            if os.path.exists("registros/estado.json"):
+                self.guardar_estado() # Los bytes del libro de caja guardados en el estado ya no corresponden a sus archivos
+        return {"Caja": caja, "Entradas": entradas}
+
+    def guardar_estado(self, ruta: str = "registros/estado.json"):
+        """_summary_
+            Guarda sin usar la consola un punto de control con todo el estado del gimnasio: datos del gimnasio, efectivo,
+            clientes con sus membresías, entrenadores y sesiones, junto con los bytes de cada archivo del libro de caja
+            que ya están sumados en el efectivo. cargar_estado lo carga al iniciar y solo suma los ingresos escritos despues.
+            Los clientes y membresías se guardan por columnas (una lista por campo) para cargarlos rapido.
+        Args:
+            ruta (str, optional): Ruta del archivo JSON del estado. Defaults to "registros/estado.json".
+        Returns:
+            dict: Numero de 'clientes', 'membresias', 'entrenadores' y 'sesiones' guardados.
+        """
+        libro_caja = {ruta_caja: os.path.getsize(ruta_caja) for ruta_caja in self.__rutas_caja()} # Con los pendientes ya escritos
+        # Las filas activas de la tabla columnar estan en el mismo orden que recorre el almacen de clientes
+        filas = np.flatnonzero(self.__tabla.get_activos())
+        clientes = [self.__clientes[fila] for fila in filas.tolist()]
+        con_membresia = self.__tabla.get_tiene_membresia()[filas]
+        membresias = np.flatnonzero(con_membresia).tolist() # Posicion del cliente en las listas de 'clientes'
+        filas_membresia = filas[con_membresia]
+        estado = {
+            "version": 1,
+            "gimnasio": {
+                "nombre": self.__nombre,
+                "direccion": self.__direccion,
+                "telefono": self.__telefono,
+                "correo": self.__correo_electronico,
+            },
+            "efectivo": self.__efectivo,
+            "caja_por_meses": isinstance(self.__caja, Caja.CajaPorMeses),
+            "libro_caja": libro_caja,
+            "historico_clientes": self.__historico_clientes,
+            "historico_entrenadores": self.__historico_entrenadores,
+            "historico_sesiones": self.__historico_sesiones,
+            "clientes": {
+                "id_cliente": [cliente.get_id_cliente() for cliente in clientes],
+                "nombre": [cliente.get_nombre() for cliente in clientes],
+                "documento": [cliente.get_documento() for cliente in clientes],
+                "telefono": [cliente.get_telefono() for cliente in clientes],
+                "fecha_registro": [cliente.get_fecha_registro() for cliente in clientes],
+            },
+            "membresias": {
+                "cliente": membresias,
+                "pago": self.__tabla.get_pagos()[filas_membresia].tolist(),
+                "fecha_inicio": np.datetime_as_string(self.__tabla.get_fechas_inicio()[filas_membresia], unit="D").tolist(),
+                "fecha_fin": np.datetime_as_string(self.__tabla.get_fechas_fin()[filas_membresia], unit="D").tolist(),
+            },
+            "vencidas": [[id_cliente, fecha_fin.isoformat()] for id_cliente, fecha_fin in self.__vencimientos.get_vencidas()],
+            "entrenadores": [self.__datos_entrenador(entrenador) for entrenador in self.__entrenadores],
+            "sesiones": [{
+                "id_sesion": sesion.get_id_sesion(),
+                "entrenador": self.__datos_entrenador(sesion.get_entrenador()) if sesion.tiene_entrenador() else None,
+                "fecha": sesion.get_fecha(),
+                "maximo_cupos": sesion.get_maximo_cupos(),
+                "inscritos": [cliente.get_id_cliente() for cliente in sesion.get_clientes_inscritos()],
+            } for sesion in self.__sesiones],
+        }
+        
+        # Se reemplaza de forma atomica: si el programa se detiene a mitad queda el estado anterior completo
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(estado, archivo, ensure_ascii=False)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+        return {"clientes": len(clientes), "membresias": len(membresias),
+                "entrenadores": len(self.__entrenadores), "sesiones": len(self.__sesiones)}
+
+    def __datos_entrenador(self, entrenador):
+        return {
+            "id_entrenador": entrenador.get_id_entrenador(),
+            "nombre": entrenador.get_nombre(),
+            "especialidad": entrenador.get_especialidad(),
+            "telefono": entrenador.get_telefono(),
+        }
+
+    def cargar_estado(self, ruta: str = "registros/estado.json"):
+        """_summary_
+            Carga sin usar la consola el estado guardado con guardar_estado en un gimnasio recien creado y pone el efectivo
+            al día sumando solo los ingresos escritos en el libro de caja despues del punto de control.
+            Los clientes se agregan a los indices y a la tabla en lote, sin volver a validar sus datos.
+        Args:
+            ruta (str, optional): Ruta del archivo JSON del estado. Defaults to "registros/estado.json".
+        Returns:
+            dict: Numero de 'clientes', 'membresias', 'entrenadores' y 'sesiones' cargados,
+                'ingresos_reproducidos' (ingresos de caja posteriores al estado) y el 'efectivo' resultante.
+        Raises:
+            ArchivoInvalido: Si el estado no existe, está dañado, o el libro de caja cambió despues de guardarlo
+                (otro formato de caja o archivos reescritos), en ese caso el gimnasio no se modifica.
+            ErrorGimnasio: Si el gimnasio ya tiene clientes, entrenadores o sesiones.
+        """
+        # Como en registrar_clientes_lote, se pausa el recolector de basura mientras se crean los objetos
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            return self.__cargar_estado(ruta)
+        finally:
+            if recolector_activo:
+                gc.enable()
+
+    def __cargar_estado(self, ruta: str):
+        if len(self.__clientes) or self.__entrenadores or self.__sesiones:
+            raise ErrorGimnasio("El estado guardado solo se puede cargar en un gimnasio sin datos.")
+        try:
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                estado = json.load(archivo)
+        except (OSError, ValueError) as e:
+            raise ArchivoInvalido(f"No se pudo leer el estado guardado {ruta}: {e}")
+        
+        try:
+            if estado["version"] != 1:
+                raise ArchivoInvalido(f"El estado guardado {ruta} tiene una version desconocida ({estado['version']}).")
+            # El efectivo solo coincide con el libro de caja si sus archivos siguen teniendo al menos los bytes guardados
+            if estado["caja_por_meses"] != isinstance(self.__caja, Caja.CajaPorMeses):
+                raise ArchivoInvalido(f"El libro de caja cambió de formato despues de guardar el estado {ruta}.")
+            libro_caja = {ruta_caja: int(bytes_caja) for ruta_caja, bytes_caja in estado["libro_caja"].items()}
+            rutas_caja = set(self.__rutas_caja())
+            for ruta_caja, bytes_caja in libro_caja.items():
+                if ruta_caja not in rutas_caja or os.path.getsize(ruta_caja) < bytes_caja:
+                    raise ArchivoInvalido(f"El libro de caja {ruta_caja} cambió despues de guardar el estado {ruta}.")
+            
+            # Primero se crean todos los objetos, asi un estado dañado no deja el gimnasio a medio cargar
+            columnas = estado["clientes"]
+            clientes = [Cliente(*datos) for datos in zip(columnas["id_cliente"], columnas["nombre"], columnas["documento"],
+                                                         columnas["fecha_registro"], columnas["telefono"])]
+            columnas_membresias = estado["membresias"]
+            # Muchas membresías comparten fechas, cada fecha distinta se convierte a Objeto date una sola vez
+            fechas = {fecha: ut.a_fecha(fecha) for fecha in set(columnas_membresias["fecha_inicio"]) | set(columnas_membresias["fecha_fin"])}
+            membresias = [Membresia(fechas[fecha_inicio], fechas[fecha_fin], pago) for pago, fecha_inicio, fecha_fin
+                          in zip(columnas_membresias["pago"], columnas_membresias["fecha_inicio"], columnas_membresias["fecha_fin"])]
+            # Posicion de cada dueño en la lista de clientes del estado, fuera de rango el estado está dañado
+            posiciones_duenos = [int(posicion) for posicion in columnas_membresias["cliente"]]
+            if any(not 0 <= posicion < len(clientes) for posicion in posiciones_duenos):
+                raise IndexError("Membresía de un cliente que no está en el estado")
+            duenos = [clientes[posicion] for posicion in posiciones_duenos]
+            vencidas = [(int(id_cliente), ut.a_fecha(fecha_fin)) for id_cliente, fecha_fin in estado["vencidas"]]
+            ids = columnas["id_cliente"]
+            ya_vencidas = dict(vencidas)
+            vigentes = [(ids[posicion], fechas[fecha_fin]) for posicion, fecha_fin in zip(posiciones_duenos, columnas_membresias["fecha_fin"])
+                        if ya_vencidas.get(ids[posicion]) != fechas[fecha_fin]]
+            entrenadores = {datos["id_entrenador"]: Entrenador(datos["id_entrenador"], datos["nombre"], datos["especialidad"], datos["telefono"])
+                            for datos in estado["entrenadores"]}
+            por_id = dict(zip(columnas["id_cliente"], clientes)) if estado["sesiones"] else {}
+            sesiones = []
+            for datos in estado["sesiones"]:
+                entrenador = datos["entrenador"]
+                if entrenador is not None: # Se comparte el Objeto si el entrenador sigue registrado
+                    entrenador = entrenadores.get(entrenador["id_entrenador"]) or Entrenador(
+                        entrenador["id_entrenador"], entrenador["nombre"], entrenador["especialidad"], entrenador["telefono"])
+                sesion = SesionEspecial(datos["id_sesion"], entrenador, datos["fecha"], datos["maximo_cupos"])
+                sesion.cargar_inscritos([por_id[id_cliente] for id_cliente in datos["inscritos"] if id_cliente in por_id])
+                sesiones.append(sesion)
+            gimnasio = estado["gimnasio"]
+            datos_gimnasio = (gimnasio["nombre"], gimnasio["direccion"], gimnasio["telefono"], gimnasio["correo"])
+            historicos = (estado["historico_clientes"], estado["historico_entrenadores"], estado["historico_sesiones"])
+            efectivo = estado["efectivo"]
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            raise ArchivoInvalido(f"El estado guardado {ruta} está dañado: {e}")
+        
+        # Desde aqui solo se usan datos ya validados
+        self.__nombre, self.__direccion, self.__telefono, self.__correo_electronico = datos_gimnasio
+        self.__historico_clientes, self.__historico_entrenadores, self.__historico_sesiones = historicos
+        
+        posiciones = []
+        if clientes:
+            posiciones = self.__clientes.agregar_lote(clientes)
+            self.__indexar_clientes_lote(posiciones, clientes)
+        for cliente, membresia in zip(duenos, membresias):
+            cliente.set_membresia(membresia)
+        # La tabla y la cola de vencimientos se llenan desde las columnas del estado, sin pasar por los objetos
+        self.__tabla.guardar_membresias([posiciones[posicion] for posicion in posiciones_duenos], columnas_membresias["pago"],
+                                        columnas_membresias["fecha_inicio"], columnas_membresias["fecha_fin"])
+        self.__vencimientos.cargar(vigentes, vencidas)
+        self.__entrenadores = list(entrenadores.values())
+        self.__sesiones = sesiones
+        
+        self.__efectivo = efectivo
+        ingresos = self.__reproducir_caja(libro_caja)
+        return {"clientes": len(clientes), "membresias": len(membresias), "entrenadores": len(self.__entrenadores),
+                "sesiones": len(sesiones), "ingresos_reproducidos": ingresos, "efectivo": self.__efectivo}
+
+    def __reproducir_caja(self, libro_caja: dict):
+        """_summary_
+            Suma al efectivo los ingresos escritos en el libro de caja despues de los bytes dados de cada archivo
+            (los archivos que no están, como el de un mes nuevo, se leen completos).
+        Args:
+            libro_caja (dict): Ruta de cada archivo del libro de caja -> bytes ya sumados en el efectivo.
+        Returns:
+            int: Numero de ingresos sumados.
+        """
+        centavos = 0
+        ingresos = 0
+        for ruta_caja in self.__rutas_caja():
+            with open(ruta_caja, "rb") as archivo:
+                archivo.seek(libro_caja.get(ruta_caja, 0))
+                for linea in archivo:
+                    if not linea.endswith(b"\n"):
+                        break # Linea incompleta, no se terminó de escribir
+                    datos = Lectores.interpretar_caja(linea.decode("utf-8", "replace"))
+                    if datos is not None:
+                        centavos += datos[5]
+                        ingresos += 1
+        self.__efectivo += centavos / 100
+        return ingresos
+
+    def __preparar_caja_binaria(self):
+        """Crea 'registros/Caja.bin' desde el libro de caja de texto si aún no existe y retorna su tabla de tipos."""
+        if self.__tipos_caja is None:
+            if not os.path.exists("registros/Caja.bin"):
+                Caja.convertir_caja_a_binario(self.__rutas_caja(), "registros/Caja.bin")
+            self.__tipos_caja = Caja.TiposCaja("registros/Caja.bin.tipos")
+        return self.__tipos_caja
+
+    def __cargar_agregados_caja(self):
+        """Retorna los agregados de la caja, cargandolos (y poniendolos al día con el libro de caja) con el primer uso."""
+        if self.__agregados_caja is None:
+            self.__agregados_caja = Caja.AgregadosCaja("registros/Caja.agregados.json")
+            self.__agregados_caja.cargar(self.__libros_caja())
+        return self.__agregados_caja
+
+    def __leer_caja_binaria(self):
+        """Retorna los registros de 'registros/Caja.bin' como array de NumPy, con los pendientes ya escritos."""
+        tipos = self.__preparar_caja_binaria()
+        self.__caja_binaria.vaciar()
+        return Caja.leer_caja_binaria("registros/Caja.bin"), tipos
+
+    def __registros_caja(self):
+        """Retorna (registros, tipos) de toda la caja como array de NumPy: el libro binario si está activo,
+        si no los archivos de texto cargados con Lectores.cargar_caja_numpy (desde su cache '.npy' si no cambiaron)."""
+        if self.__caja_binaria is not None:
+            return self.__leer_caja_binaria()
+        if self.__tipos_caja is None:
+            self.__tipos_caja = Caja.TiposCaja("registros/Caja.npy.tipos")
+        registros = Lectores.cargar_caja_numpy(self.__rutas_caja(), self.__tipos_caja, resumenes=self.__historico.rutas_resumen("Caja"))
+        return registros, self.__tipos_caja
+
+    def meses_con_ingresos(self):
+        """_summary_
+            Busca los meses que tienen registros en la caja sin usar la consola.
+        Returns:
+            list: Lista ordenada de tuplas (año, mes).
+        """
+        if RegistrosConfig.AGREGADOS_CAJA:
+            return self.__cargar_agregados_caja().meses()
+        if self.__caja_binaria is not None:
+            registros, _ = self.__leer_caja_binaria()
+            return Caja.meses_con_registros(registros)
+        if isinstance(self.__caja, Caja.CajaPorMeses):
+            return sorted(set(self.__caja.meses()) | set(self.__historico.meses("Caja"))) # El manifiesto ya lista los meses
+        
+        return list(Lectores.analizar_caja(self.__rutas_caja(), RegistrosConfig.PROCESOS_ANALISIS, self.__historico.rutas_resumen("Caja"))["meses"])
+
+    def resumen_financiero(self, año: int, mes: int):
+        """_summary_
+            Calcula los ingresos de un mes sin usar la consola, clasificados por membresías, entradas únicas y otros.
+            Con RegistrosConfig.AGREGADOS_CAJA se responde desde los totales por mes sin leer el libro de caja,
+            si no, con RegistrosConfig.CAJA_BINARIA se calcula sobre 'registros/Caja.bin' sin interpretar lineas,
+            y si no se lee el libro de texto (solo el archivo del mes con el libro por meses, o su resumen si está compactado).
+        Args:
+            año (int): Año del resumen.
+            mes (int): Mes del resumen (1-12).
+        Returns:
+            dict: 'mes', 'año', 'total_ingresos', 'ingresos_membresia', 'ingresos_entrada_unica', 'ingresos_otros',
+                'cantidad_membresias', 'cantidad_entradas', 'cantidad_otros' e 'ingresos_por_dia' (día -> monto).
+        """
+        if RegistrosConfig.AGREGADOS_CAJA:
+            return self.__cargar_agregados_caja().resumen_mes(año, mes)
+        if self.__caja_binaria is not None:
+            registros, tipos = self.__leer_caja_binaria()
+            return Caja.resumen_mes(registros, tipos, año, mes)
+        
+        # Una sola lectura del archivo del mes, con las fechas cortadas por posicion y sin detenerse en lineas malformadas
+        analisis = Lectores.analizar_caja(self.__rutas_caja([(año, mes)]), RegistrosConfig.PROCESOS_ANALISIS, self.__historico.rutas_resumen("Caja", [(año, mes)]))
+        return analisis["meses"].get((año, mes), Lectores.resumen_caja_vacio(año, mes))
+
+    def ingresos_agrupados(self, por: str = "mes", desde=None, hasta=None):
+        """_summary_
+            Agrupa los ingresos de la caja de varios periodos sin usar la consola, con agrupaciones vectorizadas
+            sobre el array de NumPy de toda la caja.
+        Args:
+            por (str, optional): 'mes', 'dia_semana' o 'tipo'. Defaults to "mes".
+            desde (date | str, optional): Primera fecha incluida (Objeto date o 'YYYY-MM-DD'), None sin limite. Defaults to None.
+            hasta (date | str, optional): Ultima fecha incluida (Objeto date o 'YYYY-MM-DD'), None sin limite. Defaults to None.
+        Raises:
+            DatosInvalidos: Si la agrupacion o las fechas no son validas.
+        Returns:
+            dict: Clave del grupo ((año, mes), nombre del día o nombre del tipo) -> {'total': pesos, 'cantidad': ingresos}.
+        """
+        if por not in ("mes", "dia_semana", "tipo"):
+            raise DatosInvalidos(f"La agrupacion '{por}' debe ser 'mes', 'dia_semana' o 'tipo'.")
+        try:
+            desde = ut.a_fecha(desde) if desde is not None else None
+            hasta = ut.a_fecha(hasta) if hasta is not None else None
+        except (TypeError, ValueError):
+            raise DatosInvalidos(f"Las fechas '{desde}' y '{hasta}' deben estar en formato 'YYYY-MM-DD'.")
+
+        registros, tipos = self.__registros_caja()
+        if por == "mes":
+            return Caja.ingresos_por_mes(registros, desde, hasta)
+        if por == "dia_semana":
+            return Caja.ingresos_por_dia_semana(registros, desde, hasta)
+        return Caja.ingresos_por_tipo(registros, tipos, desde, hasta)
+
+    def resumen_caja_dia(self, fecha):
+        """_summary_
+            Calcula el balance de caja de un día sin usar la consola.
+        Args:
+            fecha (date | str): Fecha del resumen (Objeto date o 'YYYY-MM-DD').
+        Returns:
+            dict: 'balance_efectivo' con el total de ingresos y 'membresias_compradas'.
+        """
+        fecha = ut.a_fecha(fecha)
+        if RegistrosConfig.AGREGADOS_CAJA:
+            return self.__cargar_agregados_caja().resumen_dia(fecha)
+        if self.__caja_binaria is not None:
+            registros, tipos = self.__leer_caja_binaria()
+            return Caja.resumen_dia(registros, tipos, fecha)
+        
+        fecha_str = fecha.strftime("%Y-%m-%d")
+        resumen = {"balance_efectivo": 0.0, "membresias_compradas": 0}
+        centavos = 0
+        for ruta in self.__rutas_caja([(fecha.year, fecha.month)]):
+            # El indice de fechas lleva directo a las lineas del día, sin leer el resto del archivo
+            for linea in self.__indice_fechas(ruta).lineas(fecha_str):
+                registro = Lectores.interpretar_caja(linea)
+                if registro is not None and linea.startswith(fecha_str):
+                    centavos += registro[5]
+                    if registro[4] in Caja.TIPOS_VENTA_MEMBRESIA:
+                        resumen["membresias_compradas"] += 1
+        # Si el mes está compactado el día se lee de su resumen
+        for _, _, tipo, cantidad, centavos_grupo in self.__historico.lineas_dia("Caja", fecha_str):
+            centavos += centavos_grupo or 0
+            if tipo in Caja.TIPOS_VENTA_MEMBRESIA:
+                resumen["membresias_compradas"] += cantidad
+        resumen["balance_efectivo"] = centavos / 100
+        return resumen
+
+    def analisis_entradas(self):
+        """_summary_
+            Lee 'registros/Entradas.txt' una sola vez sin usar la consola y agrupa las entradas por mes,
+            los meses compactados se leen de sus resumenes en el historico.
+            Si el archivo es grande se reparte por trozos entre RegistrosConfig.PROCESOS_ANALISIS procesos.
+        Returns:
+            dict: 'meses' (tupla (año, mes) -> {'total', 'por_dia' {día: n}, 'por_hora' {'HH': n}}, en orden de mes)
+                y 'estadisticas' de la lectura ('lineas', 'validas', 'malformadas', 'bytes', 'archivos').
+        """
+        return Lectores.analizar_entradas(self.__ruta_entradas(), RegistrosConfig.PROCESOS_ANALISIS, self.__historico.rutas_resumen("Entradas"))
+
+    def histograma_entradas(self, desde=None, hasta=None, tipo: str = None):
+        """_summary_
+            Cuenta sin usar la consola las entradas por día de la semana (del calendario) y hora en el rango de fechas dado,
+            leyendo solo las celdas de esos días en el cubo de asistencia.
+        Args:
+            desde (date | str, optional): Primera fecha incluida (Objeto date o 'YYYY-MM-DD'). Defaults to None (sin limite).
+            hasta (date | str, optional): Ultima fecha incluida (Objeto date o 'YYYY-MM-DD'). Defaults to None (sin limite).
+            tipo (str, optional): Solo las entradas de este tipo ('General' o 'IngresoUnico'). Defaults to None (todas).
+        Returns:
+            dict: 'histograma' (np.ndarray de 7 x 24, de lunes a domingo y de las 0 a las 23), 'total',
+                'por_dia_semana' (nombre del día -> entradas) y 'por_hora' ('HH' -> entradas, en orden de hora).
+        Raises:
+            DatosInvalidos: Si alguna de las fechas no tiene el formato 'YYYY-MM-DD'.
+        """
+        try:
+            desde = ut.a_fecha(desde) if desde is not None else None
+            hasta = ut.a_fecha(hasta) if hasta is not None else None
+        except ValueError:
+            raise DatosInvalidos(f"Las fechas '{desde}' y '{hasta}' deben estar en formato 'YYYY-MM-DD'.")
+        histograma = self.__cargar_cubo().histograma(desde, hasta, tipo)
+        return {"histograma": histograma, **resumen_histograma(histograma)}
+
+    def __cargar_cubo(self):
+        """Retorna el cubo de asistencia, cargandolo (y poniendolo al día con los archivos de entradas) con el primer uso."""
+        cubo = cubo_entradas()
+        if not cubo.get_cargado():
+            self.__ruta_entradas() # Las entradas de la cola no se sumaron al cubo sin cargar, deben estar en el archivo
+            cubo.cargar(self.__rutas_cubo())
+        return cubo
+
+    def reconstruir_cubo_entradas(self):
+        """Reconstruye sin usar la consola el cubo de asistencia desde 'registros/Entradas.txt' y los resumenes, retorna el numero de entradas."""
+        self.__ruta_entradas()
+        return cubo_entradas().reconstruir(self.__rutas_cubo())
+
+    def resumen_entradas_dia(self, fecha):
+        """_summary_
+            Cuenta las entradas de un día sin usar la consola, leyendo solo sus celdas del cubo de asistencia.
+        Args:
+            fecha (date | str): Fecha del resumen (Objeto date o 'YYYY-MM-DD').
+        Returns:
+            dict: 'entradas_dia', 'entradas_membresia' (tipo General) y 'entradas_unicas' (tipo IngresoUnico).
+        """
+        resumen = self.__cargar_cubo().resumen_dia(ut.a_fecha(fecha).strftime("%Y-%m-%d"))
+        return {
+            "entradas_dia": resumen["total"],
+            "entradas_membresia": resumen["por_tipo"].get("General", 0),
+            "entradas_unicas": resumen["por_tipo"].get("IngresoUnico", 0),
+        }
+
+    def ocupacion_actual(self):
+        """_summary_
+            Consulta sin usar la consola la ocupación en vivo del gimnasio, en memoria y sin leer el disco.
+        Returns:
+            dict: 'ocupacion' (clientes dentro), 'capacidad', 'disponibles', 'hay_cupo' y
+                'pico_ventana' (ocupación maxima de los ultimos OcupacionConfig.VENTANA_PICO_MIN minutos).
+        """
+        ocupacion = ocupacion_gimnasio()
+        ahora = ut.ahora()
+        dentro = ocupacion.ocupacion(ahora)
+        return {"ocupacion": dentro, "capacidad": ocupacion.get_capacidad(),
+                "disponibles": max(ocupacion.get_capacidad() - dentro, 0), "hay_cupo": ocupacion.hay_cupo(ahora),
+                "pico_ventana": ocupacion.pico_ventana(ahora)}
+
+    def serie_ocupacion(self, desde=None, hasta=None):
+        """_summary_
+            Retorna sin usar la consola la serie de ocupación por hora guardada en 'registros/Ocupacion.txt' con la hora en curso.
+        Args:
+            desde (date | str, optional): Primera fecha incluida (Objeto date o 'YYYY-MM-DD'). Defaults to None (sin limite).
+            hasta (date | str, optional): Ultima fecha incluida (Objeto date o 'YYYY-MM-DD'). Defaults to None (sin limite).
+        Returns:
+            list: Diccionarios con 'fecha', 'hora', 'pico', 'al_cierre', 'entradas', 'salidas' y 'vencidas' en orden de hora.
+        Raises:
+            DatosInvalidos: Si alguna de las fechas no tiene el formato 'YYYY-MM-DD'.
+        """
+        try:
+            desde = ut.a_fecha(desde) if desde is not None else None
+            hasta = ut.a_fecha(hasta) if hasta is not None else None
+        except ValueError:
+            raise DatosInvalidos(f"Las fechas '{desde}' y '{hasta}' deben estar en formato 'YYYY-MM-DD'.")
+        return ocupacion_gimnasio().serie_por_hora(desde, hasta)
+
     #? ============================== Metodos De Creacion ==============================
 
     # R1
@@ -72,10 +1124,6 @@ class Gimnasio:
             (bool, Cliente): False para notificar que no se creo el cliente o el Objeto Cliente creado.
         """        
         
-        if self.__numero_clientes >= self.__maximo_clientes:
-            print("No se pueden registrar más clientes, el gimnasio ha alcanzado su capacidad máxima.")
-            return False
-        
         # Si no hubo datos, se solicita al usuario
         if not nombre or not documento:
             while True:
@@ -96,33 +1144,15 @@ class Gimnasio:
                 else:
                     break
             
-        else:
-            if telefono and ( not ut.is_number(telefono, "Telefono")): # Si se ingreso algo en el telefono se valida
-                return False
-            if not (ut.is_string(nombre, "Nombre") and ut.is_number(documento, "Documento")):
-                return False
         
-        id_cliente = self.__historico_clientes + 1 # Se genera un ID para el cliente basado en el contador de clientes históricos
-        
-        if not fecha_registro:
-            fecha_registro = date.today().strftime("%Y-%m-%d") # Si no se proporciona fecha, se genera un Objeto fecha actual y se convierte a string
-        
-        # Verificar si el cliente ya está registrado
-        for cliente in self.__clientes:
-            if cliente is not None and cliente.get_documento() == documento:
-                print(f"\n!!! El cliente con documento {documento} ya está registrado.")
-                return False
-        
-        nuevo_cliente = Cliente(id_cliente, nombre.lower(), documento, fecha_registro, telefono)
-        # Guardamos la referencia del cliente en el array de clientes buscando el primer espacio vacío
-        for i in range(self.__maximo_clientes):
-            if self.__clientes[i] is None:
-                self.__clientes[i] = nuevo_cliente
-                break # Salimos del ciclo una vez que encontramos un espacio vacío
+        # Las validaciones, la verificacion de documento duplicado y el registro se hacen en registrar_cliente
+        try:
+            nuevo_cliente = self.registrar_cliente(nombre, documento, telefono, fecha_registro)
+        except ErrorGimnasio as e:
+            print(f"\n!!! {e}")
+            return False
         
-        self.__numero_clientes += 1 # Incrementamos el contador de clientes
-        self.__historico_clientes += 1 # Incrementamos el contador de clientes históricos
-        print(f"ID {id_cliente}  {nombre} registrado exitosamente. {fecha_registro}")
+        print(f"ID {nuevo_cliente.get_id_cliente()}  {nombre} registrado exitosamente. {nuevo_cliente.get_fecha_registro()}")
         return nuevo_cliente # Objeto Cliente creado
 
     # R3
@@ -145,34 +1175,9 @@ class Gimnasio:
             cliente.info_membresia()
             return False
         
-        if not fecha_inicio:
-            fecha_inicio = date.today() # Si no se proporciona fecha de inicio, se crea el Objeto fecha actual
-        else:
-            # Convertimos la fecha_inicio de str a objeto date
-            fecha_inicio = datetime.strptime(fecha_inicio, "%Y-%m-%d").date()
-        
-        if not fecha_fin: # Si no se proporciona fecha de fin, se suman 30 dias al Objeto fecha de inicio
-            fecha_fin = fecha_inicio + timedelta(days=30)
-        else:
-            # Convertimos la fecha_fin de str a objeto date
-            fecha_fin = datetime.strptime(fecha_fin, "%Y-%m-%d").date()
-        
-        # Validar la diferencia entre fecha_inicio y fecha_fin cuando ambas son proporcionadas
-        if fecha_inicio is not None and fecha_fin is not None:
-            
-            # Calcular la diferencia en días
-            diferencia_dias = (fecha_fin - fecha_inicio).days
-            # Comprobar si la diferencia es exactamente 30 días
-            if diferencia_dias != 30:
-                print(f"La diferencia entre la fecha de inicio y fin es de {diferencia_dias} días, no los 30 días estándar.")
-                if diferencia_dias > 30:
-                    print(f"Hay {diferencia_dias - 30} días adicionales.")
-                else:
-                    print(f"Faltan {30 - diferencia_dias} días para completar los 30 días estándar.")
-                
-                # Calcular la fecha de fin correcta (30 días después de la fecha de inicio)
-                fecha_fin= fecha_inicio + timedelta(days=30)
-                print(f"Se ha actualizado la fecha de fin a: {fecha_fin}")
+        if (fecha_inicio and not ut.es_fecha(fecha_inicio)) or (fecha_fin and not ut.es_fecha(fecha_fin)):
+            print("Fecha inválida. Debe ser en formato 'YYYY-MM-DD'.")
+            return False
         
         if pago is None:
             while True: # Ciclo para Ingreso correcto del pago
@@ -186,11 +1191,14 @@ class Gimnasio:
                 # Se registra el pago en Caja con su motivo
                 self.ingreso_caja(PRECIO_MEMBRESIA, "Membresia")
 
-        # Crear la membresía y nos aseguramos de guardar las fechas str y no como Objetos date
-        nueva_membresia = Membresia(fecha_inicio.strftime("%Y-%m-%d"), fecha_fin.strftime("%Y-%m-%d"), pago)
-        cliente.set_membresia(nueva_membresia)
+        # La membresia se crea en registrar_membresia, que corrige la fecha de fin a 30 dias despues del inicio
+        nueva_membresia = self.registrar_membresia(cliente, fecha_inicio, fecha_fin, pago)
+        if fecha_fin and fecha_fin != nueva_membresia.get_fecha_fin():
+            print(f"La diferencia entre la fecha de inicio y fin no es de 30 días estándar.")
+            print(f"Se ha actualizado la fecha de fin a: {nueva_membresia.get_fecha_fin()}")
+        
         print(f"Membresía creada para {cliente.get_nombre()} con ID {cliente.get_id_cliente()}")
-        print(f"Vigencia: {fecha_inicio} hasta {fecha_fin}")
+        print(f"Vigencia: {nueva_membresia.get_fecha_inicio()} hasta {nueva_membresia.get_fecha_fin()}")
         print(f"Estado: {'Pagada' if pago else 'Pendiente de pago'}")
         
         return nueva_membresia # Objeto Membresia creado
@@ -292,7 +1300,7 @@ class Gimnasio:
         
         id_sesion = self.__historico_sesiones + 1 # Generamos un ID para la sesión basado en el contador de sesiones históricas
         # Creamos la sesión especial y nos aseguramos de que la fecha sea un string y no un Objeto date
-        nueva_sesion = SesionEspecial(id_sesion, entrenador, fecha.strftime("%Y-%m-%d"), maximo_cupos)
+        nueva_sesion = SesionEspecial(id_sesion, entrenador, fecha, maximo_cupos)
         self.__sesiones.append(nueva_sesion) # Agregamos la nueva sesión a la lista de sesiones
         self.__historico_sesiones += 1 # Incrementamos el contador de sesiones históricas
         print(f"Sesión especial creada con ID: {id_sesion} para la fecha {fecha}")
@@ -336,40 +1344,56 @@ class Gimnasio:
                     id_cliente = input("Ingrese el ID del cliente: ")
                     if ut.is_number(id_cliente, "ID"):
                         break # Salir del ciclo si el ID es válido
-                for cliente in self.__clientes: # Recorrer el array de clientes
-                    if cliente is not None and cliente.get_id_cliente() == int(id_cliente): # Buscar coincidencia
-                        cliente_encontrado = cliente # Guardar el cliente encontrado
-                        # Imprimir los detalles del cliente encontrado
-                        print(f"Cliente encontrado: ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Fecha de Registro: {cliente.get_fecha_registro()}")
+                cliente_encontrado = self.cliente_por_id(int(id_cliente)) # Busqueda directa en el indice de IDs
                 if not cliente_encontrado: # Si no se encontró el cliente, informar al usuario
                     print(f"No se encontró un cliente con ID {id_cliente}.")
                     return None
+                print(f"Cliente encontrado: ID: {cliente_encontrado.get_id_cliente()}, Nombre: {cliente_encontrado.get_nombre()}, Documento: {cliente_encontrado.get_documento()}, Fecha de Registro: {cliente_encontrado.get_fecha_registro()}")
             case "2":
-                # Busqueda por Nombre - Este metodo toma la primer coincidencia del nombre
+                # Busqueda por Nombre - Se listan por paginas los clientes cuyo nombre empieza por lo ingresado
                 while True:
-                    nombre_cliente = input("Ingrese el nombre del cliente: ")
+                    nombre_cliente = input("Ingrese el nombre o el inicio del nombre del cliente: ")
                     if ut.is_string(nombre_cliente, "Nombre"):
                         break
-                for cliente in self.__clientes:
-                    if cliente is not None and cliente.get_nombre() == nombre_cliente.lower():
-                        cliente_encontrado = cliente
+                pagina = 0
+                while True:
+                    coincidencias, total = self.buscar_clientes_por_prefijo(nombre_cliente, pagina)
+                    if total == 0:
+                        print(f"No se encontró un cliente con nombre {nombre_cliente}.")
+                        return None
+                    for cliente in coincidencias:
                         print(f"Cliente encontrado: ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Fecha de Registro: {cliente.get_fecha_registro()}")
-                if not cliente_encontrado:
-                    print(f"No se encontró un cliente con nombre {nombre_cliente}.")
-                    return None
+                    if total == 1:
+                        cliente_encontrado = coincidencias[0]
+                        break
+                    
+                    # Si hay mas de un cliente, se pide seleccionar uno por ID o pasar de pagina
+                    paginas = (total + 19) // 20
+                    print(f"Página {pagina + 1}/{paginas} ({total} coincidencias)")
+                    opcion = input("Seleccione un ID, 's' para la siguiente página o Enter para cancelar: ")
+                    if opcion == "":
+                        print("Saliendo del menú de búsqueda...")
+                        return None
+                    if opcion.lower() == "s":
+                        pagina = (pagina + 1) % paginas
+                        continue
+                    if ut.is_number(opcion, "ID"):
+                        cliente_encontrado = self.cliente_por_id(int(opcion))
+                        if cliente_encontrado and cliente_encontrado.get_nombre().startswith(ut.normalizar_nombre(nombre_cliente)):
+                            break
+                        print(f"El ID {opcion} no está entre las coincidencias.")
+                        cliente_encontrado = None
             case "3":
                 # Busqueda por Documento
                 while True:
                     documento = input("Ingrese el documento del cliente: ")
                     if ut.is_number(documento, "Documento"):
                         break
-                for cliente in self.__clientes:
-                    if cliente is not None and cliente.get_documento() == documento:
-                        cliente_encontrado = cliente
-                        print(f"Cliente encontrado: ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Fecha de Registro: {cliente.get_fecha_registro()}")
+                cliente_encontrado = self.cliente_por_documento(documento) # Busqueda directa en el indice de documentos
                 if not cliente_encontrado:
                     print(f"No se encontró un cliente con documento {documento}.")
                     return None
+                print(f"Cliente encontrado: ID: {cliente_encontrado.get_id_cliente()}, Nombre: {cliente_encontrado.get_nombre()}, Documento: {cliente_encontrado.get_documento()}, Fecha de Registro: {cliente_encontrado.get_fecha_registro()}")
             case "":
                 print("Saliendo del menú de búsqueda...")
                 
@@ -454,16 +1478,16 @@ class Gimnasio:
                 return None
             
             # Buscar el cliente por ID
-            for cliente in self.__clientes:
-                if cliente is not None and cliente.get_id_cliente() == id_cliente:
-                    # Si se encuentra el cliente, se imprime su información
-                    print(f"\n===== Cliente Seleccionado ====")
-                    print(f"Cliente ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Fecha de Registro: {cliente.get_fecha_registro()}")
-                    print(f"Telefono: {cliente.get_telefono() if cliente.get_telefono() else 'No registrado'}")
-                    print(f"Membresía: {cliente.tiene_membresia()}")
-                    return cliente # Y se retorna el Objeto Cliente encontrado para finalizar la ejecucion
-            print(f"No se encontró un cliente con ID {id_cliente}.")
-            return None
+            cliente = self.cliente_por_id(id_cliente)
+            if cliente is None:
+                print(f"No se encontró un cliente con ID {id_cliente}.")
+                return None
+            # Si se encuentra el cliente, se imprime su información
+            print(f"\n===== Cliente Seleccionado ====")
+            print(f"Cliente ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Fecha de Registro: {cliente.get_fecha_registro()}")
+            print(f"Telefono: {cliente.get_telefono() if cliente.get_telefono() else 'No registrado'}")
+            print(f"Membresía: {cliente.tiene_membresia()}")
+            return cliente # Y se retorna el Objeto Cliente encontrado para finalizar la ejecucion
     
     def visualizar_membresias(self):
         """Muestra todas las membresias registradas en el gimnasio."""
@@ -589,25 +1613,16 @@ class Gimnasio:
             - Se penso en guardar informacion del cliente que paga pero no c implemento
         """        
 
-        # Registrar el ingreso en formato: fecha;hora;tipo;efectivo
-        fecha = datetime.now().strftime('%Y-%m-%d') # Objeto fecha y hora actual a str
-        hora = datetime.now().strftime('%H:%M:%S')  # Objeto fecha y hora actual a str
-        tipo = motivo if motivo else "Ingreso" # Si no se proporciona motivo, se usa "Ingreso" como predeterminado
-        registro = f"{fecha};{hora};{tipo};{float(efectivo):,}\n"
-        
         print(f"Efectivo actual: ${self.__efectivo:,} + ${float(efectivo):,}")
-        self.__efectivo += float(efectivo)
-        print(f"Efectivo actualizado a: ${self.__efectivo:,}")
-        
-        # Guardar el registro en un archivo de texto
-        with open("registros/Caja.txt", "a") as caja_file:
-            caja_file.write(registro)
+        registro = self.registrar_ingreso_caja(efectivo, motivo)
+        print(f"Efectivo actualizado a: ${registro['efectivo']:,}")
     
-    def pagar_membresia(self, membresia):
+    def pagar_membresia(self, membresia, cliente=None):
         """_summary_
             Metodo encargado de pagar la Membresia del Cliente si esta en deuda.
         Args:
             membresia (Membresia): Objeto Membresia del Cliente a pagar.
+            cliente (Cliente, optional): Objeto Cliente dueño de la Membresia, si no se da se busca. Defaults to None.
         """        
         if membresia.get_pago():
             print("La membresía ya ha sido pagada.")
@@ -616,6 +1631,9 @@ class Gimnasio:
             print(f"El cliente tiene una membresía que aún no ha sido pagada.")
             self.ingreso_caja(PRECIO_MEMBRESIA,"PagoMembresia") # Se registra el ingreso en caja con su motivo
             membresia.set_pago(True) # Actualizamos el estado de pago de la membresía
+            cliente = cliente if cliente is not None else self.__cliente_de_membresia(membresia)
+            if cliente is not None:
+                self.__sincronizar_membresia(cliente)
             print(f"Pago realizado exitosamente. Monto: ${PRECIO_MEMBRESIA:,}")
     
     def renovar_membresia(self, cliente=None ,membresia=None):
@@ -647,6 +1665,9 @@ class Gimnasio:
         print(f"Membresía renovada.")
         self.ingreso_caja(PRECIO_MEMBRESIA, "RenovacionMembresia") # Se registra el ingreso en caja con su motivo
         membresia.renovar_membresia() # Actualiza la fecha de fin de la membresía
+        cliente = cliente if cliente is not None else self.__cliente_de_membresia(membresia)
+        if cliente is not None:
+            self.__sincronizar_membresia(cliente)
     
     def pago_ingreso_unico(self, cliente):
         """"Metodo encargado de registrar el ingreso unico de un cliente sin tener que adquirir memebreisa, pagando el ingreso unico del Cliente."""
@@ -751,7 +1772,7 @@ class Gimnasio:
             bool: Booleano que indica si la eliminación fue exitosa o no.
         """        
         
-        if self.__numero_clientes == 0:
+        if len(self.__clientes) == 0:
             print("No hay clientes registrados para eliminar.")
             return False
         
@@ -770,16 +1791,9 @@ class Gimnasio:
                 # Si se proporciona un objeto Cliente, obtenemos su ID
                 id_cliente = cliente.get_id_cliente()
         
-        # Buscar el cliente por ID
-        cliente_encontrado = None
-        indice_cliente = -1
-        
-        for i in range(len(self.__clientes)):
-            cliente = self.__clientes[i]
-            if cliente is not None and cliente.get_id_cliente() == id_cliente:
-                cliente_encontrado = cliente
-                indice_cliente = i
-                break
+        # Buscar el cliente por ID en el indice
+        indice_cliente = self.__indice_id.get(id_cliente)
+        cliente_encontrado = None if indice_cliente is None else self.__clientes[indice_cliente]
         
         if cliente_encontrado:
             # Mostrar Cliente
@@ -797,11 +1811,11 @@ class Gimnasio:
                 # Buscar si el cliente tiene sesiones especiales
                 for sesion in self.__sesiones:
                     print(f"Verificando sesion {sesion.get_id_sesion()} ...")
-                    sesion.editar_inscritos(cliente.get_id_cliente())
+                    sesion.editar_inscritos(cliente_encontrado.get_id_cliente())
                 
-                # Eliminar cliente del array
-                self.__clientes[indice_cliente] = None 
-                self.__numero_clientes -= 1 
+                # Eliminar cliente del array y de los indices
+                self.__desindexar_cliente(indice_cliente, cliente_encontrado)
+                self.__clientes.eliminar(indice_cliente)
                 print(f"Cliente con ID {id_cliente} eliminado exitosamente.")
                 return True
             else:
@@ -839,6 +1853,7 @@ class Gimnasio:
                 break
         if ut.yes_no(confirmar):
             cliente.set_membresia(None) # Eliminar la membresía del cliente
+            self.__sincronizar_membresia(cliente)
             print(f"Membresía del cliente {cliente.get_nombre()} eliminada exitosamente.")
             return True
         else:
@@ -970,56 +1985,56 @@ class Gimnasio:
         """_summary_
             Permite realizar un seguimiento de las membresías de los clientes, mostrando las que están en deuda, por vencer, vencidas y los clientes sin membresía.
         """        
-        # Listas para categorizar
-        membresias_en_deuda = []
-        membresias_por_vencer = []  # ≤ 7 días
-        membresias_vencidas = []    # < 0 días
-        clientes_sin_membresia = []
-        
-        for i in range(self.__maximo_clientes):
-            cliente = self.__clientes[i]
-            if cliente is not None: # si no es None
-                membresia = cliente.get_membresia() # Obtenemos la membresía del cliente
-                if membresia is None:
-                    clientes_sin_membresia.append(cliente) # Si no tiene membresía, lo agregamos a la lista de clientes sin membresía
-                else:
-                    dias_restantes = membresia.calcular_dias_restantes() # Si si tiene membresia calculamos los días restantes de la membresía
-                    if dias_restantes < 0:
-                        membresias_vencidas.append(cliente) # Si los días restantes son negativos, la membresía está vencida
-                    elif dias_restantes <= 7:
-                        membresias_por_vencer.append(cliente) # Si los días restantes son menores o iguales a 7, la membresía está por vencer
-                    elif not membresia.get_pago():
-                        membresias_en_deuda.append(cliente) # Si la membresía no está pagada, la agregamos a la lista de membresías en deuda
-        
-        # Imprimimos las listas
+        clasificacion = self.clasificar_membresias()
+        dias_restantes = clasificacion["dias_restantes"]
+        
+        categorias = [
+            ("CLIENTES SIN MEMBRESÍA", "clientes sin membresía", "sin_membresia", None),
+            ("MEMBRESÍAS EN DEUDA", "membresías en deuda", "en_deuda", None),
+            ("MEMBRESÍAS POR VENCER", "membresías por vencer", "por_vencer", "Días restantes"),  # ≤ 7 días
+            ("MEMBRESÍAS VENCIDAS", "membresías vencidas", "vencidas", "Días vencida"),  # < 0 días
+        ]
+        
+        # Imprimimos cada categoria por paginas, solo se buscan los Clientes de la pagina que se muestra
         print("\n====== CONTROL DE MEMBRESÍAS ======")
         print("="*50)
-        print("\n=== CLIENTES SIN MEMBRESÍA ===")
-        print(f"Total de clientes sin membresía: {len(clientes_sin_membresia)}")
-        if clientes_sin_membresia:
-            print("Clientes sin membresía:")
-            for cliente in clientes_sin_membresia:
-                print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}")
-        print("\n===== MEMBRESÍAS EN DEUDA ====")
-        print(f"Total de membresías en deuda: {len(membresias_en_deuda)}")
-        if membresias_en_deuda:
-            print("Clientes con membresías en deuda:")
-            for cliente in membresias_en_deuda:
-                print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}")
-        print("\n==== MEMBRESÍAS POR VENCER ===")
-        print(f"Total de membresías por vencer: {len(membresias_por_vencer)}")
-        if membresias_por_vencer:
-            print("Clientes con membresías por vencer:")
-            for cliente in membresias_por_vencer:
-                dias_restantes = cliente.get_membresia().calcular_dias_restantes()
-                print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Días restantes: {dias_restantes}")
-        print("\n===== MEMBRESÍAS VENCIDAS ====")
-        print(f"Total de membresías vencidas: {len(membresias_vencidas)}")
-        if membresias_vencidas:
-            print("Clientes con membresías vencidas:")
-            for cliente in membresias_vencidas:
-                dias_restantes = cliente.get_membresia().calcular_dias_restantes()
-                print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}, Días vencida: {dias_restantes}")
+        for titulo, descripcion, llave, etiqueta_dias in categorias:
+            posiciones = clasificacion[llave]
+            print(f"\n=== {titulo} ===")
+            print(f"Total de {descripcion}: {len(posiciones)}")
+            for inicio in range(0, len(posiciones), 20):
+                pagina = posiciones[inicio:inicio + 20]
+                for posicion, cliente in zip(pagina, self.clientes_en_posiciones(pagina)):
+                    dias = f", {etiqueta_dias}: {dias_restantes[posicion]}" if etiqueta_dias else ""
+                    print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Documento: {cliente.get_documento()}{dias}")
+                if inicio + 20 < len(posiciones):
+                    continuar = input(f"Mostrando {inicio + 20}/{len(posiciones)}, Enter para ver más o 'n' para pasar a la siguiente categoría: ")
+                    if continuar.lower() == "n":
+                        break
+
+    def vencimientos_proximos(self):
+        """_summary_
+            Muestra las membresías que vencieron desde el ultimo barrido y las que vencen en los proximos dias, usando la cola de vencimientos.
+        """
+        print("\n=== VENCIMIENTOS DE MEMBRESÍAS ===")
+        while True:
+            dias = input("Ingrese el número de días a revisar (Enter para 7): ")
+            if dias == "":
+                dias = 7
+                break
+            if ut.is_number(dias, "Días"):
+                dias = int(dias)
+                break
+        
+        recien_vencidas = self.barrido_vencimientos()
+        print(f"\nMembresías vencidas desde la última revisión: {len(recien_vencidas)}")
+        for cliente, fecha_fin in recien_vencidas:
+            print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Venció: {fecha_fin}")
+        
+        por_vencer = self.membresias_por_vencer(dias)
+        print(f"\nMembresías que vencen en los próximos {dias} días: {len(por_vencer)}")
+        for cliente, dias_restantes in por_vencer:
+            print(f"    - ID: {cliente.get_id_cliente()}, Nombre: {cliente.get_nombre()}, Días restantes: {dias_restantes}, Estado: {'Paga' if cliente.get_membresia().get_pago() else 'Pendiente'}")
 
     def analisis_financiero(self):
         """_summary_
@@ -1030,26 +2045,14 @@ class Gimnasio:
         
         print("\n=== ANÁLISIS FINANCIERO ===")
         
-        registro_caja = "registros/Caja.txt"  # Formato: fecha;hora;tipo;efectivo
-        
-        meses_disponibles = []
-        # Buscamos los meses disponibles en el archivo de caja
-        with open(registro_caja, "r", encoding='utf-8') as archivo:
-            for linea in archivo:
-                datos = linea.strip().split(";")
-                if len(datos) >= 4:
-                    fecha = datos[0]  # Formato YYYY-MM-DD
-                    fecha_obj = datetime.strptime(fecha, "%Y-%m-%d").date()
-                    mes_año = fecha_obj.strftime("%m")  # Formato YYYY-MM
-                    # Solo agregar si no está ya en la lista (evitar duplicados)
-                    if mes_año not in meses_disponibles:
-                        meses_disponibles.append(mes_año)
+        # Buscamos los meses disponibles en la caja
+        meses_disponibles = self.meses_con_ingresos()
         if not meses_disponibles:
             print("❌ No se encontraron registros de entradas en el archivo.")
             return
         
         # Mostrar meses disponibles y permitir selección
-        meses_lista = sorted(meses_disponibles, reverse=True)  # Más recientes primero
+        meses_lista = [f"{año_mes[0]}-{año_mes[1]:02d}" for año_mes in reversed(meses_disponibles)]  # Más recientes primero
         
         print(f"\nMeses con registros disponibles:")
         print("="*40)
@@ -1076,51 +2079,16 @@ class Gimnasio:
         print(f"\nGenerando análisis financiero para: {mes}/{año}")
         print("="*50)
         
-        # Contadores para el análisis
-        total_ingresos = 0.0
-        ingresos_membresia = 0.0
-        ingresos_entrada_unica = 0.0
-        ingresos_otros = 0.0
-        cantidad_membresias = 0
-        cantidad_entradas = 0
-        cantidad_otros = 0
-        ingresos_por_dia = {}
-        
-        # Leer archivo de caja y procesar datos del mes
-        with open(registro_caja, "r", encoding='utf-8') as archivo:
-            for linea in archivo:
-                datos = linea.strip().split(";")
-                if len(datos) >= 4:
-                    fecha = datos[0]  # YYYY-MM-DD
-                    tipo = datos[2]   # Tipo de transacción
-                    monto = float(datos[3].replace(",", ""))  # Monto
-                    
-                    # Extraer año y mes de la fecha
-                    partes_fecha = fecha.split("-")
-                    año_transaccion = int(partes_fecha[0])
-                    mes_transaccion = int(partes_fecha[1])
-                    dia_transaccion = int(partes_fecha[2])
-                    
-                    # Solo procesar si es del mes y año seleccionado
-                    if año_transaccion == año and mes_transaccion == mes:
-                        total_ingresos += monto
-                        
-                        # Clasificar por tipo de ingreso
-                        if tipo in ["Membresia", "PagoMembresia", "RenovacionMembresia"]:
-                            ingresos_membresia += monto
-                            cantidad_membresias += 1
-                        elif tipo in ["PagoIngresoUnico", "IngresoUnico"]:
-                            ingresos_entrada_unica += monto
-                            cantidad_entradas += 1
-                        elif tipo == "Ingreso":
-                            ingresos_otros += monto
-                            cantidad_otros += 1
-                        
-                        # Agrupar por día
-                        if dia_transaccion in ingresos_por_dia:
-                            ingresos_por_dia[dia_transaccion] += monto
-                        else:
-                            ingresos_por_dia[dia_transaccion] = monto
+        # El calculo se hace en resumen_financiero, aqui solo se muestra el resultado
+        resumen = self.resumen_financiero(año, mes)
+        total_ingresos = resumen["total_ingresos"]
+        ingresos_membresia = resumen["ingresos_membresia"]
+        ingresos_entrada_unica = resumen["ingresos_entrada_unica"]
+        ingresos_otros = resumen["ingresos_otros"]
+        cantidad_membresias = resumen["cantidad_membresias"]
+        cantidad_entradas = resumen["cantidad_entradas"]
+        cantidad_otros = resumen["cantidad_otros"]
+        ingresos_por_dia = resumen["ingresos_por_dia"]
         
         # Mostrar resultados
         print(f"\nRESUMEN FINANCIERO DEL MES:")
@@ -1151,18 +2119,49 @@ class Gimnasio:
         print("="*50)
         
         # Retornar un resumen del análisis
-        return {
-            "mes": mes,
-            "año": año,
-            "total_ingresos": total_ingresos,
-            "ingresos_membresia": ingresos_membresia,
-            "ingresos_entrada_unica": ingresos_entrada_unica,
-            "ingresos_otros": ingresos_otros,
-            "cantidad_membresias": cantidad_membresias,
-            "cantidad_entradas": cantidad_entradas,
-            "cantidad_otros": cantidad_otros,
-            "ingresos_por_dia": ingresos_por_dia
-        }
+        return resumen
+
+    def comparativo_ingresos(self):
+        """_summary_
+            Muestra los ingresos mes a mes con la variacion contra el mismo mes del año anterior,
+            y los ingresos por día de la semana y por tipo, en un rango de fechas opcional.
+        Returns:
+            dict: 'por_mes', 'por_dia_semana' y 'por_tipo' con los grupos de ingresos_agrupados.
+        """
+        print("\n=== COMPARATIVO DE INGRESOS ===")
+        while True:
+            desde = input("Fecha inicial (YYYY-MM-DD) o Enter para desde el inicio: ") or None
+            hasta = input("Fecha final (YYYY-MM-DD) o Enter para hasta hoy: ") or None
+            try:
+                por_mes = self.ingresos_agrupados("mes", desde, hasta)
+                break
+            except DatosInvalidos as e:
+                print(f"Error : {str(e)}")
+
+        if not por_mes:
+            print("❌ No se encontraron ingresos en el rango seleccionado.")
+            return
+        por_dia_semana = self.ingresos_agrupados("dia_semana", desde, hasta)
+        por_tipo = self.ingresos_agrupados("tipo", desde, hasta)
+
+        print(f"\nINGRESOS POR MES:")
+        for (año, mes), grupo in por_mes.items():
+            linea = f"   {año}-{mes:02d}: ${grupo['total']:,.0f} ({grupo['cantidad']} transacciones)"
+            anterior = por_mes.get((año - 1, mes))
+            if anterior and anterior["total"]:
+                linea += f"  vs {año - 1}: {(grupo['total'] / anterior['total'] - 1) * 100:+.1f}%"
+            print(linea)
+
+        print(f"\nINGRESOS POR DÍA DE LA SEMANA:")
+        for dia, grupo in por_dia_semana.items():
+            print(f"   {dia}: ${grupo['total']:,.0f} ({grupo['cantidad']} transacciones)")
+
+        print(f"\nINGRESOS POR TIPO:")
+        for tipo, grupo in por_tipo.items():
+            print(f"   {tipo}: ${grupo['total']:,.0f} ({grupo['cantidad']} transacciones)")
+        print("="*50)
+
+        return {"por_mes": por_mes, "por_dia_semana": por_dia_semana, "por_tipo": por_tipo}
 
     def reporte_diario(self):
         """_summary_
@@ -1191,55 +2190,23 @@ class Gimnasio:
         print(f"\n📅 Generando reporte para: {fecha_reporte_str}")
         print("="*50)
         
-        # Rutas de archivos
-        registro_caja = "registros/Caja.txt" # Formato: fecha;hora;tipo;efectivo(0,000.0)
-        registro_entradas = "registros/Entradas.txt" # Formato Fecha;Hora;ID;Documento;Nombre;Membresía(False:Vencida/True:Activa/None:SinMembresía);Tipo(Entrada Unica/Membresia)
-        
-        # Variables para el reporte
-        membresias_compradas = 0
-        balance_efectivo = 0.0
-        
         # Analizar registros de caja del día
         print("\nBALANCE DE EFECTIVO DEL DÍA:")
-        with open(registro_caja, "r", encoding='utf-8') as archivo_caja:
-            for linea in archivo_caja:
-                datos = linea.strip().split(";")
-                if len(datos) >= 4:
-                    fecha_transaccion = datos[0]
-                    tipo_transaccion = datos[2]
-                    monto = float(datos[3].replace(",", ""))
-                    
-                    if fecha_transaccion == fecha_reporte_str:
-                        balance_efectivo += monto
-                        if tipo_transaccion in ["Membresia", "PagoMembresia"]:
-                            membresias_compradas += 1
+        resumen_caja = self.resumen_caja_dia(fecha_obj)
+        membresias_compradas = resumen_caja["membresias_compradas"]
+        balance_efectivo = resumen_caja["balance_efectivo"]
         
         print(f"   Total ingresos del día: ${balance_efectivo:,.0f}")
         print(f"   Membresías vendidas: {membresias_compradas}")  # Dividir por 2 porque hay Membresia y PagoMembresia
         
         # Analizar entradas del día
         print("\nENTRADAS DEL DÍA:")
-        entradas_dia = 0
-        entradas_membresia = 0
-        entradas_unicas = 0
-        
-        with open(registro_entradas, "r", encoding='utf-8') as archivo_entradas:
-            for linea in archivo_entradas:
-                datos = linea.strip().split(";")
-                if len(datos) >= 7:
-                    fecha_entrada = datos[0]
-                    tipo_entrada = datos[6]
-                    
-                    if fecha_entrada == fecha_reporte_str:
-                        entradas_dia += 1
-                        if tipo_entrada == "General":
-                            entradas_membresia += 1
-                        elif tipo_entrada == "IngresoUnico":
-                            entradas_unicas += 1
-            
-            print(f"   Total entradas: {entradas_dia}")
-            print(f"   Entradas con membresía: {entradas_membresia}")
-            print(f"   Entradas únicas: {entradas_unicas}")
+        resumen_entradas = self.resumen_entradas_dia(fecha_obj)
+        entradas_dia = resumen_entradas["entradas_dia"]
+        
+        print(f"   Total entradas: {entradas_dia}")
+        print(f"   Entradas con membresía: {resumen_entradas['entradas_membresia']}")
+        print(f"   Entradas únicas: {resumen_entradas['entradas_unicas']}")
         
         # Resumen final
         print("\n" + "="*50)
@@ -1259,6 +2226,32 @@ class Gimnasio:
         }
     
     
+    def reconstruir_indices(self):
+        """_summary_
+            Reconstruye los indices de fechas de los archivos de registros y muestra cuantas lineas se indexaron.
+        """
+        print("\n=== RECONSTRUIR ÍNDICES DE REGISTROS ===")
+        for ruta, lineas in self.reconstruir_indices_fechas().items():
+            print(f"   {ruta}: {lineas} líneas indexadas")
+        print(f"   Cubo de asistencia: {self.reconstruir_cubo_entradas()} entradas")
+
+    def compactar_historico(self):
+        """_summary_
+            Compacta los meses cerrados de la caja y de las entradas en el historico y muestra cuantas lineas se compactaron.
+        """
+        print("\n=== COMPACTAR REGISTROS ANTIGUOS ===")
+        confirmacion = input("Las lineas de los meses anteriores al actual se moverán a 'registros/historico' comprimidas. ¿Continuar? (si/no): ")
+        if not ut.valid_yes_no(confirmacion) or not ut.yes_no(confirmacion):
+            print("Operación cancelada.")
+            return
+        resultado = self.compactar_registros()
+        for registro, meses in resultado.items():
+            if not meses:
+                print(f"   {registro}: no hay meses cerrados por compactar")
+            for mes, lineas in meses.items():
+                print(f"   {registro} {mes}: {lineas} líneas compactadas")
+        return resultado
+
     def informe_entrada(self):
         """_summary_
             Permite generar un informe de entradas del gimnasio, mostrando el número de entradas por días y las horas más frecuentadas.
@@ -1266,28 +2259,18 @@ class Gimnasio:
         
         print("\n=== INFORME DE ENTRADAS ===")
         
-        registro_entradas = "registros/Entradas.txt" # Formato Fecha;Hora;ID;Documento;Nombre;Membresía(False:Vencida/True:Activa/None:SinMembresía);Tipo(Entrada Unica/Membresia)
-        
-        # Leer archivo y extraer meses únicos
-        meses_disponibles = []
-        # Buscamos los meses disponibles en el archivo de entradas
-        with open(registro_entradas, "r", encoding='utf-8') as archivo:
-            for linea in archivo:
-                datos = linea.strip().split(";")
-                if len(datos) >= 7:
-                    fecha = datos[0]  # Formato YYYY-MM-DD
-                    fecha_obj = datetime.strptime(fecha, "%Y-%m-%d").date()
-                    mes_año = fecha_obj.strftime("%m")  # Formato YYYY-MM
-                    # Solo agregar si no está ya en la lista (evitar duplicados)
-                    if mes_año not in meses_disponibles:
-                        meses_disponibles+=[mes_año]
+        # El informe lee las celdas de los días del mes en el cubo de asistencia, sin recorrer el archivo de entradas
+        cubo = self.__cargar_cubo()
+        meses_disponibles = cubo.meses()
+        if cubo.get_malformadas():
+            print(f"⚠️ Se omitieron {cubo.get_malformadas()} líneas malformadas del archivo de entradas.")
         
         if not meses_disponibles:
             print("❌ No se encontraron registros de entradas en el archivo.")
             return
         
         # Mostrar meses disponibles y permitir selección
-        meses_lista = sorted(meses_disponibles, reverse=True)  # Más recientes primero
+        meses_lista = [f"{año_mes[0]}-{año_mes[1]:02d}" for año_mes in reversed(meses_disponibles)]  # Más recientes primero
         
         print(f"\nMeses con registros disponibles:")
         print("="*40)
@@ -1312,79 +2295,48 @@ class Gimnasio:
                 if año >= 2020 and año <= 2030:
                     break
         
-        dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-        print(f"\n¿Qué día de la semana fue el 1 de {mes}/{año}?")
-        for i, dia in enumerate(dias_semana):
-            print(f"{i+1}. {dia}")
-        
-        # Preguntar qué día de la semana fue el primer día del mes
-        while True:
-            dia_inicio = input("Seleccione el día (1-7): ")
-            if ut.is_number(dia_inicio, "Día"):
-                dia_inicio = int(dia_inicio)
-                if dia_inicio >= 1 and dia_inicio <= 7:
-                    dia_inicio = dia_inicio - 1  # Convertir a índice (0-6)
-                    break
-        
         print(f"\n Generando informe para: {mes}/{año}")
         print("="*50)
         
-        # Contadores simples
-        total_entradas = 0
-        entradas_por_dia = {}  # Lunes: 0, Martes: 0, etc.
-        entradas_por_hora = {}  # 08: 0, 09: 0, etc.
-        
-        # Inicializar contadores
-        for dia in dias_semana:
-            entradas_por_dia[dia] = 0
-        
-        # Leer archivo y contar entradas del mes seleccionado
-        with open(registro_entradas, "r", encoding='utf-8') as archivo:
-            for linea in archivo:
-                datos = linea.strip().split(";")
-                if len(datos) >= 7:
-                    fecha = datos[0]  # YYYY-MM-DD
-                    hora = datos[1]   # HH:MM:SS
-                    
-                    # Extraer año y mes de la fecha
-                    partes_fecha = fecha.split("-")
-                    año_entrada = int(partes_fecha[0])
-                    mes_entrada = int(partes_fecha[1])
-                    dia_entrada = int(partes_fecha[2])
-                    
-                    # Solo procesar si es del mes y año seleccionado
-                    if año_entrada == año and mes_entrada == mes:
-                        total_entradas += 1
-                        
-                        # Calcular día de la semana usando el día de inicio
-                        dia_semana_indice = (dia_entrada - 1 + dia_inicio) % 7
-                        dia_semana = dias_semana[dia_semana_indice]
-                        entradas_por_dia[dia_semana] += 1
-                        
-                        # Obtener hora (solo la parte de la hora)
-                        hora_simple = hora.split(":")[0]  # Solo la hora (ej: "14" de "14:30:00")
-                        if hora_simple in entradas_por_hora:
-                            entradas_por_hora[hora_simple] += 1
-                        else:
-                            entradas_por_hora[hora_simple] = 1
+        # El día de la semana de cada entrada sale del calendario, ya no se pregunta qué día fue el 1 del mes
+        primer_dia = date(año, mes, 1)
+        ultimo_dia = (primer_dia + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+        informe = self.histograma_entradas(primer_dia, ultimo_dia)
         
         # Mostrar resultados
-        print(f"\nTOTAL DE ENTRADAS: {total_entradas}")
+        print(f"\nTOTAL DE ENTRADAS: {informe['total']}")
         
         print(f"\nENTRADAS POR DÍA DE LA SEMANA:")
-        for dia, cantidad in entradas_por_dia.items():
+        for dia, cantidad in informe["por_dia_semana"].items():
             print(f"   {dia}: {cantidad} entradas")
         
         print(f"\nFRECUENCIA HORAS:")
-        # Ordenar horas por cantidad de entradas
-        # horas_ordenadas = sorted(entradas_por_hora.items(), key=lambda x: x[1], reverse=True)
-        # for hora, cantidad in horas_ordenadas[:5]:  # Solo mostrar top 5
-        for hora, cantidad in entradas_por_hora.items(): 
+        for hora, cantidad in informe["por_hora"].items():
             print(f"   {hora}:00 - {cantidad} entradas")
         
         print("="*50)
 
     
+    def mostrar_ocupacion(self):
+        """_summary_
+            Muestra la ocupación en vivo del gimnasio y la serie por hora del día de hoy.
+        """
+        print("\n=== OCUPACIÓN DEL GIMNASIO ===")
+        ocupacion = self.ocupacion_actual()
+        print(f"Clientes dentro: {ocupacion['ocupacion']} de {ocupacion['capacidad']}")
+        print(f"Cupos disponibles: {ocupacion['disponibles']}")
+        print(f"Pico de la ultima ventana: {ocupacion['pico_ventana']}")
+        if not ocupacion["hay_cupo"]:
+            print("⚠️ El gimnasio está en su capacidad máxima.")
+        
+        serie = self.serie_ocupacion(ut.hoy(), ut.hoy())
+        if serie:
+            print(f"\nOCUPACIÓN POR HORA DE HOY:")
+            for hora in serie:
+                print(f"   {hora['hora']:02d}:00 - pico {hora['pico']}, entradas {hora['entradas']}, salidas {hora['salidas']}")
+        print("="*50)
+
+    
     #* ============================== Exportar e Importar Datos ==============================
     
     def exportar_datos_json(self, nombre_archivo: str = None):
@@ -1397,7 +2349,7 @@ class Gimnasio:
         """
         # Generar nombre de achivo si no se proporciona
         if nombre_archivo is None:
-            fecha_actual = date.today().strftime("%Y%m%d")
+            fecha_actual = ut.hoy().strftime("%Y%m%d")
             nombre_archivo = f"datos_gimnasio_{fecha_actual}.json"
         nombre_archivo = f"registros/{nombre_archivo}"
         
@@ -1411,16 +2363,15 @@ class Gimnasio:
                 "efectivo": self.__efectivo
             },
             "estadisticas": {
-                "total_clientes": self.__numero_clientes,
+                "total_clientes": len(self.__clientes),
                 "historico_clientes": self.__historico_clientes,
-                "fecha_exportacion": date.today().strftime("%Y-%m-%d")
+                "fecha_exportacion": ut.hoy().strftime("%Y-%m-%d")
             },
             "clientes": []
         }
         
         # Procesar cada cliente registrado
-        for i in range(self.__numero_clientes):
-            cliente = self.__clientes[i]
+        for cliente in self.__clientes:
             if cliente is not None:
                 # Datos básicos del cliente
                 datos_cliente = {
@@ -1480,147 +2431,23 @@ class Gimnasio:
         print("="*40)
         print(f"📂 Cargando datos desde el archivo: {nombre_archivo}\n")
         
+        # La carga se hace en importar_clientes, aqui solo se muestra el resultado
         try:
-            with open(nombre_archivo, "r") as archivo:
-                lineas = archivo.readlines()
-                rows = len(lineas)
-                
-                if rows == 0:
-                    print("✗ El archivo está vacío.")
-                    return False
-                
-                # Validar formato del archivo (debe tener encabezados)
-                primera_linea = lineas[0].strip().split(";")
-                columns = len(primera_linea)
-                print(f"Número de líneas : {rows}")
-                print(f"Número de columnas : {columns}")
-                print(f"Encabezados detectados: {primera_linea}")
-                
-                # Validar que tenga el formato esperado para clientes (7 columnas)
-                if columns != 7:
-                    print(f"⚠️  ADVERTENCIA: Este archivo tiene {columns} columnas.")
-                    print("""📋 Formato esperado para clientes : 
+            resumen = self.importar_clientes(nombre_archivo)
+        except ArchivoInvalido as e:
+            print(f"✗ {e}")
+            print("""📋 Formato esperado para clientes : 
     Nombre;Documento;Telefono;Fecha Registro;Membresia:Pago;Membresia:Fecha Inicio;Membresia:Fecha Fin""")
-                    print("📋 Formato detectado:", ";".join(primera_linea))
-                    return False
-                
-                # Verificar si hay líneas de datos (más de solo encabezados)
-                if rows <= 1:
-                    print("✗ El archivo solo contiene encabezados, no hay datos para cargar.")
-                    return False
-                    
-        except FileNotFoundError:
-            print(f"✗ Archivo {nombre_archivo} no encontrado.")
-            return False
-        except Exception as e:
-            print(f"✗ Error al leer el archivo: {str(e)}")
             return False
-
-        # Contadores para estadísticas
-        lineas_error = []
-        clientes_cargados = 0
-        membresias_cargadas = 0
-        lineas_procesadas = 0
-        
-        inval = [None, "None", "none", "", " ", "0", 0]
-        # Valores inválido
         
-        print(f"\n📥 Iniciando carga de {rows-1} líneas de datos...")
+        lineas_procesadas = resumen["lineas_procesadas"]
+        clientes_cargados = resumen["clientes_cargados"]
+        membresias_cargadas = resumen["membresias_cargadas"]
+        lineas_error = [numero_linea for numero_linea, _ in resumen["errores"]]
         
-        for i in range(1, rows):
-            lineas_procesadas += 1
-            linea = lineas[i].strip().split(";")
-            
-            # Validar que la línea tenga suficientes columnas
-            if len(linea) < 7:
-                print(f"✗ Línea {i+1} malformada (solo {len(linea)} columnas): {lineas[i].strip()}")
-                lineas_error.append(i+1)
-                continue
-            try:
-                print("="*30)
-                print(f"Procesando línea {i+1}/{rows}: {linea}")
-                
-                # Validación para teléfono: si es "0", "None", "none" o vacío, se convierte a None
-                telefono = linea[2]
-                if telefono and telefono.lower() in inval:
-                    telefono = None
-                
-                # Validar fecha de registro (obligatoria para crear cliente)
-                try:
-                    fecha_registro = datetime.strptime(linea[3], "%Y-%m-%d").date()
-                except Exception as e:
-                    print(f"✗ Error en la fecha de registro en línea {i+1}: {str(e)}")
-                    lineas_error.append(i+1)
-                    continue
-                
-                # Crear el cliente primero
-                cliente_creado = self.crear_cliente(
-                    nombre=linea[0],
-                    documento=linea[1],
-                    telefono=telefono,
-                    fecha_registro=linea[3]
-                )
-                
-                if cliente_creado:
-                    clientes_cargados += 1
-                    
-                    # Verificar si el cliente tiene datos de membresía válidos
-                    if (linea[4] in inval) or (linea[5] in inval):
-                        print(f"⚠️  Línea {i+1}: Cliente sin membresía o datos de membresía inválidos.")
-                        lineas_error.append(i+1)
-                        continue
-                    
-                    # Validar fecha de inicio de membresía (obligatoria)
-                    try:
-                        datetime.strptime(linea[5], "%Y-%m-%d").date()
-                    except Exception as e:
-                        print(f"✗ Error en la fecha de inicio de membresía en línea {i+1}: {str(e)}")
-                        print("⚠️  Se omitirá la membresía para este cliente.")
-                        lineas_error.append(i+1)
-                        continue
-                    
-                    # Validar fecha de fin de membresía (opcional - se puede calcular automáticamente)
-                    fecha_fin_valida = linea[6]
-                    if linea[6] in inval:
-                        print(f"⚠️  Línea {i+1}: Fecha fin inválida, se calculará automáticamente (+30 días).")
-                        fecha_fin_valida = None
-                    else:
-                        try:
-                            datetime.strptime(linea[6], "%Y-%m-%d").date()
-                        except Exception as e:
-                            print(f"⚠️  Error en la fecha fin en línea {i+1}: {str(e)}")
-                            print("⚠️  Se calculará automáticamente (+30 días).")
-                            fecha_fin_valida = None
-                    
-                    # Procesar el pago
-                    if linea[4] in [False, "False", "false", True, "True", "true"]:
-                        pago_bool = linea[4].strip().lower() == 'true'
-                    else:
-                        print(f"⚠️  Línea {i+1}: Estado de pago inválido. Se omitirá la membresía.")
-                        lineas_error.append(i+1)
-                        continue
-                    
-                    # Intentar crear la membresía
-                    membresia_creada = self.crear_membresia(
-                        cliente=cliente_creado,
-                        fecha_inicio=linea[5],
-                        fecha_fin=fecha_fin_valida,
-                        pago=pago_bool
-                    )
-                    
-                    if membresia_creada:
-                        membresias_cargadas += 1
-                        print(f"✓ Cliente y membresía cargados exitosamente.")
-                    else:
-                        print(f"⚠️  Cliente creado pero falló la creación de la membresía.")
-                else:
-                    lineas_error.append(i+1)
-                    print(f"✗ No se pudo crear el cliente {linea[0]} con documento {linea[1]}.")
-                    continue
-            except Exception as e:
-                print(f"✗ Error procesando línea {i+1}: {str(e)}")
-                lineas_error.append(i+1)
-                continue
+        print(f"Encabezados detectados: {resumen['encabezados']}")
+        for numero_linea, motivo in resumen["errores"]:
+            print(f"⚠️  Línea {numero_linea}: {motivo}")
         
         # Mostrar estadísticas finales
         print("="*60)
@@ -1644,10 +2471,10 @@ class Gimnasio:
             
         print("="*60)
         
-        return 
+        return resumen
     
     def exportar_clientes(self):
-        nombre_archivo = f"registros/clientes_{date.today().strftime('%Y%m%d')}.txt"
+        nombre_archivo = f"registros/clientes_{ut.hoy().strftime('%Y%m%d')}.txt"
         
         with open(nombre_archivo, "w") as archivo:
             archivo.write("Nombre;Documento;Telefono;Fecha Registro;Membresia:Pago;Membresia:Fecha Inicio;Membresia:Fecha Fin\n")
@@ -1721,13 +2548,13 @@ class Gimnasio:
         Returns:
             str: Ruta del archivo creado o None si hubo error
         """
-        nombre_archivo = f"registros/entrenadores_{date.today().strftime('%Y%m%d')}.json"
+        nombre_archivo = f"registros/entrenadores_{ut.hoy().strftime('%Y%m%d')}.json"
         
         # Crear estructura de datos para exportar
         datos_exportar = {
             "gimnasio": {
                 "nombre": self.__nombre,
-                "fecha_exportacion": date.today().strftime("%Y-%m-%d")
+                "fecha_exportacion": ut.hoy().strftime("%Y-%m-%d")
             },
             "estadisticas": {
                 "total_entrenadores": len(self.__entrenadores),
@@ -1756,10 +2583,8 @@ class Gimnasio:
                     
                     # Obtener documentos de clientes inscritos
                     documentos_inscritos = []
-                    for i in range(sesion.get_cupos()):
-                        cliente_inscrito = sesion._SesionEspecial__inscritos[i]
-                        if cliente_inscrito is not None:
-                            documentos_inscritos.append(cliente_inscrito.get_documento())
+                    for cliente_inscrito in sesion.get_clientes_inscritos():
+                        documentos_inscritos.append(cliente_inscrito.get_documento())
                     
                     # Crear datos de la sesión
                     datos_sesion = {
@@ -0,0 +1,171 @@
+import gzip
+import os
+
+import Lectores
+from Registros import SUFIJO_RESUMEN, linea_resumen, interpretar_resumen
+
+# ==== HISTORICO DE REGISTROS ====
+# Las lineas de los meses cerrados de Caja y Entradas casi nunca se consultan una por una, pero cada reporte
+# las volvía a leer. Al compactar un mes sus lineas se resumen por día, hora y tipo en '<Registro>_YYYY-MM.resumen.txt'
+# y las lineas originales se mueven comprimidas a '<Registro>_YYYY-MM.txt.gz'. Los reportes leen los resumenes
+# de los meses cerrados y las lineas solo del mes abierto.
+# Los dos archivos solo crecen al final: si llegan lineas de un mes ya compactado se agregan nuevas lineas
+# de resumen (los lectores suman las repetidas) y un nuevo miembro al gzip.
+
+REGISTROS = {
+    # nombre del registro -> interpretar linea (con fecha y hora en las posiciones fijas de Lectores)
+    "Caja": Lectores.interpretar_caja,
+    "Entradas": Lectores.interpretar_entrada,
+}
+
+
+class HistoricoRegistros:
+    """_summary_
+    Clase que representa la carpeta del historico de los registros ('registros/historico'), con el resumen
+    y el archivo comprimido de cada mes compactado de Caja y Entradas.
+
+    Atributos:
+        __carpeta (str): Carpeta de los resumenes y archivos comprimidos.
+    """
+    def __init__(self, carpeta: str):
+        self.__carpeta = carpeta
+
+    # Métodos de acceso
+
+    def get_carpeta(self):
+        return self.__carpeta
+
+    # Métodos
+
+    def ruta_resumen(self, registro: str, mes: str):
+        """Ruta del resumen de un mes 'YYYY-MM' del registro ('Caja' o 'Entradas')."""
+        return os.path.join(self.__carpeta, f"{registro}_{mes}{SUFIJO_RESUMEN}")
+
+    def ruta_archivo(self, registro: str, mes: str):
+        """Ruta del archivo comprimido con las lineas originales de un mes 'YYYY-MM' del registro."""
+        return os.path.join(self.__carpeta, f"{registro}_{mes}.txt.gz")
+
+    def meses(self, registro: str):
+        """Retorna la lista ordenada de tuplas (año, mes) compactadas del registro."""
+        if not os.path.isdir(self.__carpeta):
+            return []
+        prefijo = f"{registro}_"
+        return sorted((int(archivo[len(prefijo):len(prefijo) + 4]), int(archivo[len(prefijo) + 5:len(prefijo) + 7]))
+                      for archivo in os.listdir(self.__carpeta)
+                      if archivo.startswith(prefijo) and archivo.endswith(SUFIJO_RESUMEN))
+
+    def rutas_resumen(self, registro: str, meses=None):
+        """_summary_
+            Retorna las rutas de los resumenes del registro en orden de mes, solo de los meses dados si se indican.
+        Args:
+            registro (str): 'Caja' o 'Entradas'.
+            meses (list, optional): Lista de tuplas (año, mes). Defaults to None (todos los meses compactados).
+        """
+        seleccion = None if meses is None else set(meses)
+        return [self.ruta_resumen(registro, f"{año}-{mes:02d}") for año, mes in self.meses(registro)
+                if seleccion is None or (año, mes) in seleccion]
+
+    def lineas_dia(self, registro: str, fecha: str):
+        """_summary_
+            Lee las lineas de resumen de un día del registro (el resumen de un mes es pequeño, se lee completo).
+        Returns:
+            list: Tuplas (fecha, hora, tipo, cantidad, centavos o None) de Registros.interpretar_resumen.
+        """
+        ruta = self.ruta_resumen(registro, fecha[:7])
+        if not os.path.exists(ruta):
+            return []
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            return [resumen for resumen in map(interpretar_resumen, archivo) if resumen is not None and resumen[0] == fecha]
+
+    def __compactar_lineas(self, registro: str, mes: str, lineas: list):
+        # Agrega las lineas al archivo comprimido del mes y su resumen por día, hora y tipo al resumen del mes
+        interpretar = REGISTROS[registro]
+        grupos = {} # (día, hora, tipo) -> [cantidad, centavos]
+        for linea in lineas:
+            datos = interpretar(linea)
+            if datos is None:
+                continue # Se archiva igual, pero no entra en el resumen
+            clave = (datos[2], datos[3] // 3600, datos[4] if registro == "Caja" else datos[8])
+            grupo = grupos.setdefault(clave, [0, 0])
+            grupo[0] += 1
+            grupo[1] += datos[5] if registro == "Caja" else 0
+
+        os.makedirs(self.__carpeta, exist_ok=True)
+        with gzip.open(self.ruta_archivo(registro, mes), "at", compresslevel=6, encoding="utf-8") as archivo:
+            archivo.write("".join(linea if linea.endswith("\n") else linea + "\n" for linea in lineas))
+        with open(self.ruta_resumen(registro, mes), "a", encoding="utf-8") as archivo:
+            archivo.write("".join(
+                linea_resumen(f"{mes}-{dia:02d}", hora, tipo, cantidad, centavos if registro == "Caja" else None) + "\n"
+                for (dia, hora, tipo), (cantidad, centavos) in sorted(grupos.items())
+            ))
+            archivo.flush()
+            os.fsync(archivo.fileno()) # El resumen debe estar en disco antes de borrar las lineas originales
+        return len(lineas)
+
+    def compactar_mes(self, ruta: str, registro: str, mes: str):
+        """_summary_
+            Compacta un archivo que solo tiene lineas de un mes cerrado (un archivo del libro de caja por meses)
+            y lo borra junto con sus archivos auxiliares (indice de fechas y cache de NumPy).
+        Args:
+            ruta (str): Ruta del archivo del mes.
+            registro (str): 'Caja' o 'Entradas'.
+            mes (str): Mes 'YYYY-MM' del archivo.
+        Returns:
+            int: Numero de lineas compactadas.
+        """
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            lineas = archivo.readlines()
+        compactadas = self.__compactar_lineas(registro, mes, lineas)
+        os.remove(ruta)
+        borrar_auxiliares(ruta)
+        return compactadas
+
+    def compactar_archivo(self, ruta: str, registro: str, mes_abierto: str):
+        """_summary_
+            Compacta las lineas de los meses anteriores a mes_abierto de un registro de un solo archivo
+            (Entradas.txt o Caja.txt) y reescribe el archivo solo con las demas lineas (las del mes abierto
+            y las que no tienen fecha valida). Quien escriba en el archivo debe cerrarlo antes.
+        Args:
+            ruta (str): Ruta del archivo del registro.
+            registro (str): 'Caja' o 'Entradas'.
+            mes_abierto (str): Mes 'YYYY-MM' en curso, se compactan los meses anteriores.
+        Returns:
+            dict: Mes 'YYYY-MM' -> numero de lineas compactadas.
+        """
+        if not os.path.exists(ruta):
+            return {}
+        interpretar = REGISTROS[registro]
+        por_mes = {}
+        conservadas = []
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                mes = linea[:7]
+                if interpretar(linea) is not None and mes < mes_abierto:
+                    por_mes.setdefault(mes, []).append(linea)
+                else:
+                    conservadas.append(linea)
+        if not por_mes:
+            return {}
+
+        compactadas = {mes: self.__compactar_lineas(registro, mes, lineas) for mes, lineas in sorted(por_mes.items())}
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write("".join(conservadas))
+        os.replace(temporal, ruta)
+        borrar_auxiliares(ruta)
+        return compactadas
+
+    def leer_archivo(self, registro: str, mes: str):
+        """Retorna las lineas originales de un mes compactado, leidas del archivo comprimido."""
+        ruta = self.ruta_archivo(registro, mes)
+        if not os.path.exists(ruta):
+            return []
+        with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+            return archivo.read().splitlines()
+
+
+def borrar_auxiliares(ruta: str):
+    """Borra los archivos auxiliares de un registro que se reescribió o se borró: indice de fechas y cache de NumPy."""
+    for sufijo in (".idx", ".npy", ".npy.json"):
+        if os.path.exists(ruta + sufijo):
+            os.remove(ruta + sufijo)
@@ -0,0 +1,174 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import date
+
+# ==== INDICES DE BUSQUEDA ====
+
+class IndiceNombres:
+    """_summary_
+    Clase que representa un indice ordenado de nombres de clientes para busquedas por prefijo.
+    Cada entrada es una tupla (nombre normalizado, ID del cliente) y la lista se mantiene ordenada,
+    asi todas las coincidencias de un prefijo quedan contiguas y se encuentran con busqueda binaria.
+
+    Atributos:
+        __entradas (list): Lista ordenada de tuplas (nombre, id_cliente).
+    """
+    def __init__(self):
+        self.__entradas = []
+
+    def __len__(self):
+        return len(self.__entradas)
+
+    # Métodos
+
+    def agregar(self, nombre: str, id_cliente: int):
+        """Inserta el nombre del cliente manteniendo la lista ordenada."""
+        insort(self.__entradas, (nombre, id_cliente))
+
+    def agregar_lote(self, entradas: list):
+        """Inserta varias tuplas (nombre, id_cliente) con un solo ordenamiento, en lugar de una insercion por nombre."""
+        self.__entradas.extend(entradas)
+        self.__entradas.sort()
+
+    def eliminar(self, nombre: str, id_cliente: int):
+        """_summary_
+            Retira el nombre del cliente del indice.
+        Returns:
+            bool: True si se encontro y elimino la entrada, False si no estaba en el indice.
+        """
+        posicion = bisect_left(self.__entradas, (nombre, id_cliente))
+        if posicion < len(self.__entradas) and self.__entradas[posicion] == (nombre, id_cliente):
+            del self.__entradas[posicion]
+            return True
+        return False
+
+    def __rango(self, prefijo: str):
+        # Posiciones [inicio, fin) de las entradas que empiezan por el prefijo, en O(log n)
+        inicio = bisect_left(self.__entradas, (prefijo,))
+        fin = bisect_left(self.__entradas, (prefijo + "\U0010ffff",))
+        return inicio, fin
+
+    def contar(self, prefijo: str):
+        """Retorna el numero de nombres que empiezan por el prefijo."""
+        inicio, fin = self.__rango(prefijo)
+        return fin - inicio
+
+    def buscar(self, prefijo: str, pagina: int = 0, tamano_pagina: int = 20):
+        """_summary_
+            Busca los clientes cuyo nombre empieza por el prefijo, en O(log n + k) para una pagina de k resultados.
+        Args:
+            prefijo (str): Prefijo normalizado a buscar.
+            pagina (int, optional): Numero de pagina empezando en 0. Defaults to 0.
+            tamano_pagina (int, optional): Numero de resultados por pagina. Defaults to 20.
+        Returns:
+            (list, int): Lista de tuplas (nombre, id_cliente) de la pagina y total de coincidencias.
+        """
+        inicio, fin = self.__rango(prefijo)
+        desde = min(inicio + pagina * tamano_pagina, fin)
+        hasta = min(desde + tamano_pagina, fin)
+        return self.__entradas[desde:hasta], fin - inicio
+
+
+class ColaVencimientos:
+    """_summary_
+    Clase que representa una cola de prioridad (min-heap) de las membresías vigentes ordenadas por fecha de fin.
+    Las membresías modificadas o eliminadas no se sacan del heap de inmediato, su entrada queda obsoleta y se
+    descarta cuando aparece (eliminacion perezosa). Un barrido diario solo saca las membresías que vencieron.
+
+    Atributos:
+        __heap (list): Heap de tuplas (ordinal de la fecha de fin, id_cliente).
+        __vigentes (dict): ID de Cliente -> ordinal de la fecha de fin vigente, define que entradas del heap son validas.
+        __vencidas (dict): ID de Cliente -> ordinal de la fecha de fin de las membresías que ya vencieron en un barrido.
+    """
+    def __init__(self):
+        self.__heap = []
+        self.__vigentes = {}
+        self.__vencidas = {}
+
+    def __len__(self):
+        return len(self.__vigentes)
+
+    # Métodos
+
+    def programar(self, id_cliente: int, fecha_fin: date):
+        """Agrega o actualiza la fecha de fin de la membresía del cliente en O(log n)."""
+        fin = fecha_fin.toordinal()
+        if self.__vigentes.get(id_cliente) == fin:
+            return # Ya está programada con la misma fecha
+        self.__vencidas.pop(id_cliente, None)
+        self.__vigentes[id_cliente] = fin
+        heapq.heappush(self.__heap, (fin, id_cliente))
+        self.__compactar()
+
+    def cargar(self, vigentes: list, vencidas: list = ()):
+        """_summary_
+            Reemplaza el contenido de la cola de una sola vez (al cargar el estado guardado del gimnasio),
+            con un solo heapify en O(n) en lugar de n inserciones.
+        Args:
+            vigentes (list): Lista de tuplas (id_cliente, fecha de fin) de las membresías vigentes.
+            vencidas (list, optional): Lista de tuplas (id_cliente, fecha de fin) ya vencidas en barridos anteriores. Defaults to ().
+        """
+        self.__vigentes = {id_cliente: fecha_fin.toordinal() for id_cliente, fecha_fin in vigentes}
+        self.__vencidas = {id_cliente: fecha_fin.toordinal() for id_cliente, fecha_fin in vencidas}
+        self.__heap = [(fin, id_cliente) for id_cliente, fin in self.__vigentes.items()]
+        heapq.heapify(self.__heap)
+
+    def cancelar(self, id_cliente: int):
+        """Retira la membresía del cliente, su entrada en el heap queda obsoleta."""
+        self.__vigentes.pop(id_cliente, None)
+        self.__vencidas.pop(id_cliente, None)
+        self.__compactar()
+
+    def __compactar(self):
+        # Si las entradas obsoletas superan a las validas se reconstruye el heap para no acumular memoria
+        if len(self.__heap) > 2 * len(self.__vigentes) + 64:
+            self.__heap = [(fin, id_cliente) for id_cliente, fin in self.__vigentes.items()]
+            heapq.heapify(self.__heap)
+
+    def vencen_hasta(self, fecha_limite: date):
+        """_summary_
+            Busca las membresías vigentes que vencen hasta la fecha limite (incluida), en O(k log k) para k resultados.
+            Recorre el heap desde la raiz y no baja por las ramas cuya fecha ya supera el limite.
+        Args:
+            fecha_limite (date): Ultima fecha de fin incluida.
+        Returns:
+            list: Lista de tuplas (id_cliente, fecha de fin) ordenada por fecha de fin.
+        """
+        limite = fecha_limite.toordinal()
+        resultado = []
+        pendientes = [0] if self.__heap else []
+        while pendientes:
+            posicion = pendientes.pop()
+            fin, id_cliente = self.__heap[posicion]
+            if fin > limite:
+                continue # Los hijos de esta posicion tienen fechas mayores
+            if self.__vigentes.get(id_cliente) == fin:
+                resultado.append((fin, id_cliente))
+            for hijo in (2 * posicion + 1, 2 * posicion + 2):
+                if hijo < len(self.__heap):
+                    pendientes.append(hijo)
+        resultado.sort()
+        return [(id_cliente, date.fromordinal(fin)) for fin, id_cliente in resultado]
+
+    def barrer(self, hoy: date):
+        """_summary_
+            Saca del heap las membresías que vencieron antes de hoy y las pasa a vencidas.
+            Solo toca las membresías que cambiaron de estado desde el ultimo barrido.
+        Args:
+            hoy (date): Fecha actual, las membresías con fecha de fin anterior se consideran vencidas.
+        Returns:
+            list: Lista de tuplas (id_cliente, fecha de fin) de las membresías que vencieron en este barrido.
+        """
+        hoy = hoy.toordinal()
+        vencidas = []
+        while self.__heap and self.__heap[0][0] < hoy:
+            fin, id_cliente = heapq.heappop(self.__heap)
+            if self.__vigentes.get(id_cliente) == fin:
+                del self.__vigentes[id_cliente]
+                self.__vencidas[id_cliente] = fin
+                vencidas.append((id_cliente, date.fromordinal(fin)))
+        return vencidas
+
+    def get_vencidas(self):
+        """Retorna la lista de tuplas (id_cliente, fecha de fin) de las membresías vencidas en barridos anteriores."""
+        return [(id_cliente, date.fromordinal(fin)) for id_cliente, fin in self.__vencidas.items()]
@@ -0,0 +1,505 @@
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+
+import Caja
+import Registros
+
+# ==== LECTURA EN UNA PASADA DE LOS REGISTROS ====
+# Las lineas de Caja.txt y Entradas.txt empiezan con 'YYYY-MM-DD;HH:MM:SS;', en posiciones fijas,
+# por eso la fecha y la hora se leen cortando la linea en lugar de usar split("-") o datetime.strptime.
+# Las lineas que no tienen ese formato se cuentan como malformadas y se omiten, sin detener la lectura.
+
+TAMANO_BUFFER = 1 << 20 # Lectura en bloques de 1 MiB
+
+
+def nuevas_estadisticas():
+    """Retorna el diccionario de contadores de una lectura: 'archivos', 'bytes', 'lineas', 'validas' y 'malformadas'."""
+    return {"archivos": 0, "bytes": 0, "lineas": 0, "validas": 0, "malformadas": 0}
+
+def _lista_rutas(rutas):
+    return [rutas] if isinstance(rutas, str) else list(rutas)
+
+def _fecha_hora(linea: str):
+    # (año, mes, día, segundos del día) de una linea 'YYYY-MM-DD;HH:MM:SS;...', lanza ValueError si no es valida
+    if len(linea) < 21 or linea[4] != "-" or linea[7] != "-" or linea[10] != ";" or linea[13] != ":" or linea[16] != ":" or linea[19] != ";":
+        raise ValueError("Fecha u hora fuera de posicion")
+    año = int(linea[0:4])
+    mes = int(linea[5:7])
+    dia = int(linea[8:10])
+    if not (1 <= mes <= 12 and 1 <= dia <= 31):
+        raise ValueError("Fecha fuera de rango")
+    return año, mes, dia, int(linea[11:13]) * 3600 + int(linea[14:16]) * 60 + int(linea[17:19])
+
+def interpretar_caja(linea: str):
+    """_summary_
+        Interpreta una linea de Caja.txt 'YYYY-MM-DD;HH:MM:SS;tipo;50,000.0'.
+    Returns:
+        tuple: (año, mes, día, segundos del día, tipo, centavos) o None si la linea está malformada.
+    """
+    try:
+        año, mes, dia, segundos = _fecha_hora(linea)
+        campos = linea[20:].rstrip("\r\n").split(";")
+        if len(campos) < 2 or not campos[0]:
+            return None
+        return año, mes, dia, segundos, campos[0], round(float(campos[1].replace(",", "")) * 100)
+    except ValueError:
+        return None
+
+def interpretar_entrada(linea: str):
+    """_summary_
+        Interpreta una linea de Entradas.txt 'YYYY-MM-DD;HH:MM:SS;ID;Documento;Nombre;Membresía;Tipo'.
+    Returns:
+        tuple: (año, mes, día, segundos del día, id_cliente, documento, nombre, membresía, tipo) o None si la linea está malformada.
+    """
+    try:
+        año, mes, dia, segundos = _fecha_hora(linea)
+    except ValueError:
+        return None
+    campos = linea[20:].rstrip("\r\n").split(";")
+    if len(campos) < 5:
+        return None
+    return año, mes, dia, segundos, campos[0], campos[1], campos[2], campos[3], campos[4]
+
+def interpretar_resumen(linea: str):
+    """_summary_
+        Interpreta una linea de resumen de un mes compactado 'YYYY-MM-DD;HH;tipo;cantidad[;centavos]' (ver Historico).
+    Returns:
+        tuple: (año, mes, día, hora, tipo, cantidad, centavos o 0) o None si la linea está malformada.
+    """
+    resumen = Registros.interpretar_resumen(linea)
+    if resumen is None:
+        return None
+    fecha, hora, tipo, cantidad, centavos = resumen
+    try:
+        return int(fecha[0:4]), int(fecha[5:7]), int(fecha[8:10]), hora, tipo, cantidad, centavos or 0
+    except ValueError:
+        return None
+
+def _leer(rutas, interpretar, estadisticas):
+    for ruta in _lista_rutas(rutas):
+        if not os.path.exists(ruta):
+            continue
+        lineas = malformadas = 0 # Contadores locales, se pasan a las estadisticas al terminar cada archivo
+        try:
+            with open(ruta, "r", encoding="utf-8", errors="replace", buffering=TAMANO_BUFFER) as archivo:
+                for lineas, linea in enumerate(archivo, 1):
+                    registro = interpretar(linea)
+                    if registro is None:
+                        malformadas += 1
+                    else:
+                        yield registro
+        finally:
+            if estadisticas is not None:
+                estadisticas["archivos"] += 1
+                estadisticas["bytes"] += os.path.getsize(ruta)
+                estadisticas["lineas"] += lineas
+                estadisticas["validas"] += lineas - malformadas
+                estadisticas["malformadas"] += malformadas
+
+def leer_caja(rutas, estadisticas: dict = None):
+    """_summary_
+        Recorre en una pasada los archivos de caja y entrega sus registros interpretados con interpretar_caja.
+    Args:
+        rutas (str | list): Ruta o lista de rutas de archivos de caja (los que no existen se omiten).
+        estadisticas (dict, optional): Contadores de nuevas_estadisticas() que se actualizan durante la lectura. Defaults to None.
+    Yields:
+        tuple: (año, mes, día, segundos del día, tipo, centavos).
+    """
+    return _leer(rutas, interpretar_caja, estadisticas)
+
+def leer_entradas(rutas, estadisticas: dict = None):
+    """_summary_
+        Recorre en una pasada los archivos de entradas y entrega sus registros interpretados con interpretar_entrada.
+    Args:
+        rutas (str | list): Ruta o lista de rutas de archivos de entradas (los que no existen se omiten).
+        estadisticas (dict, optional): Contadores de nuevas_estadisticas() que se actualizan durante la lectura. Defaults to None.
+    Yields:
+        tuple: (año, mes, día, segundos del día, id_cliente, documento, nombre, membresía, tipo).
+    """
+    return _leer(rutas, interpretar_entrada, estadisticas)
+
+
+# ==== RESUMENES EN UNA PASADA ====
+
+def resumen_caja_vacio(año: int, mes: int):
+    """Resumen financiero de un mes sin ingresos, con las mismas llaves que Gimnasio.resumen_financiero."""
+    return {
+        "mes": mes,
+        "año": año,
+        "total_ingresos": 0.0,
+        "ingresos_membresia": 0.0,
+        "ingresos_entrada_unica": 0.0,
+        "ingresos_otros": 0.0,
+        "cantidad_membresias": 0,
+        "cantidad_entradas": 0,
+        "cantidad_otros": 0,
+        "ingresos_por_dia": {},
+    }
+
+def _acumular_caja(registros, acumulados: dict):
+    # (año, mes) -> [total, membresia, entrada unica, otros, cantidad membresias, cantidad entradas, cantidad otros, {día: centavos}]
+    for año, mes, dia, _, tipo, centavos in registros:
+        acumulado = acumulados.get((año, mes))
+        if acumulado is None:
+            acumulado = acumulados[(año, mes)] = [0, 0, 0, 0, 0, 0, 0, {}]
+        acumulado[0] += centavos
+        if tipo in Caja.TIPOS_MEMBRESIA:
+            acumulado[1] += centavos
+            acumulado[4] += 1
+        elif tipo in Caja.TIPOS_ENTRADA_UNICA:
+            acumulado[2] += centavos
+            acumulado[5] += 1
+        elif tipo in Caja.TIPOS_OTROS:
+            acumulado[3] += centavos
+            acumulado[6] += 1
+        acumulado[7][dia] = acumulado[7].get(dia, 0) + centavos
+    return acumulados
+
+def _acumular_resumen_caja(resumenes, acumulados: dict):
+    # Igual que _acumular_caja pero cada linea de resumen suma su cantidad de ingresos
+    for año, mes, dia, _, tipo, cantidad, centavos in resumenes:
+        acumulado = acumulados.get((año, mes))
+        if acumulado is None:
+            acumulado = acumulados[(año, mes)] = [0, 0, 0, 0, 0, 0, 0, {}]
+        acumulado[0] += centavos
+        if tipo in Caja.TIPOS_MEMBRESIA:
+            acumulado[1] += centavos
+            acumulado[4] += cantidad
+        elif tipo in Caja.TIPOS_ENTRADA_UNICA:
+            acumulado[2] += centavos
+            acumulado[5] += cantidad
+        elif tipo in Caja.TIPOS_OTROS:
+            acumulado[3] += centavos
+            acumulado[6] += cantidad
+        acumulado[7][dia] = acumulado[7].get(dia, 0) + centavos
+    return acumulados
+
+def _unir_caja(acumulados: dict, parcial: dict):
+    for clave, otro in parcial.items():
+        acumulado = acumulados.get(clave)
+        if acumulado is None:
+            acumulados[clave] = otro
+            continue
+        for posicion in range(7):
+            acumulado[posicion] += otro[posicion]
+        for dia, centavos in otro[7].items():
+            acumulado[7][dia] = acumulado[7].get(dia, 0) + centavos
+    return acumulados
+
+def _resumenes_caja(acumulados: dict):
+    meses = {}
+    for (año, mes), acumulado in sorted(acumulados.items()):
+        resumen = resumen_caja_vacio(año, mes)
+        resumen["total_ingresos"] = acumulado[0] / 100
+        resumen["ingresos_membresia"] = acumulado[1] / 100
+        resumen["ingresos_entrada_unica"] = acumulado[2] / 100
+        resumen["ingresos_otros"] = acumulado[3] / 100
+        resumen["cantidad_membresias"] = acumulado[4]
+        resumen["cantidad_entradas"] = acumulado[5]
+        resumen["cantidad_otros"] = acumulado[6]
+        resumen["ingresos_por_dia"] = {dia: centavos / 100 for dia, centavos in sorted(acumulado[7].items())}
+        meses[(año, mes)] = resumen
+    return meses
+
+def _acumular_entradas(registros, meses: dict):
+    for año, mes, dia, segundos, *_ in registros:
+        datos_mes = meses.get((año, mes))
+        if datos_mes is None:
+            datos_mes = meses[(año, mes)] = {"total": 0, "por_dia": {}, "por_hora": {}}
+        datos_mes["total"] += 1
+        datos_mes["por_dia"][dia] = datos_mes["por_dia"].get(dia, 0) + 1
+        hora = f"{segundos // 3600:02d}"
+        datos_mes["por_hora"][hora] = datos_mes["por_hora"].get(hora, 0) + 1
+    return meses
+
+def _acumular_resumen_entradas(resumenes, meses: dict):
+    for año, mes, dia, hora, _, cantidad, _ in resumenes:
+        datos_mes = meses.get((año, mes))
+        if datos_mes is None:
+            datos_mes = meses[(año, mes)] = {"total": 0, "por_dia": {}, "por_hora": {}}
+        datos_mes["total"] += cantidad
+        datos_mes["por_dia"][dia] = datos_mes["por_dia"].get(dia, 0) + cantidad
+        hora = f"{hora:02d}"
+        datos_mes["por_hora"][hora] = datos_mes["por_hora"].get(hora, 0) + cantidad
+    return meses
+
+def _unir_entradas(meses: dict, parcial: dict):
+    # Los parciales se unen en el orden de los archivos, asi las horas quedan en el orden en que aparecen
+    for clave, otro in parcial.items():
+        datos_mes = meses.get(clave)
+        if datos_mes is None:
+            meses[clave] = otro
+            continue
+        datos_mes["total"] += otro["total"]
+        for grupo in ("por_dia", "por_hora"):
+            for llave, cantidad in otro[grupo].items():
+                datos_mes[grupo][llave] = datos_mes[grupo].get(llave, 0) + cantidad
+    return meses
+
+def analizar_caja(rutas, procesos: int = 1, resumenes=()):
+    """_summary_
+        Calcula en una sola lectura los meses con ingresos y el resumen financiero de cada uno.
+        Los montos se suman en centavos enteros y se convierten a pesos al final.
+    Args:
+        rutas (str | list): Ruta o lista de rutas de archivos de caja.
+        procesos (int, optional): Procesos para repartir los archivos por trozos (ver analizar_en_paralelo),
+            None para usar todos los nucleos. Defaults to 1.
+        resumenes (list, optional): Rutas de resumenes de meses compactados de la caja (ver Historico). Defaults to ().
+    Returns:
+        dict: 'meses' (tupla (año, mes) -> resumen financiero, en orden de mes) y 'estadisticas' de la lectura.
+    """
+    acumulados, estadisticas = analizar_en_paralelo("caja", rutas, procesos)
+    _acumular_resumen_caja(_leer(resumenes, interpretar_resumen, estadisticas), acumulados)
+    return {"meses": _resumenes_caja(acumulados), "estadisticas": estadisticas}
+
+def analizar_entradas(rutas, procesos: int = 1, resumenes=()):
+    """_summary_
+        Calcula en una sola lectura los meses con entradas y, para cada uno, el total, las entradas por día del mes
+        y por hora (en el orden en que aparece cada hora en el archivo).
+    Args:
+        rutas (str | list): Ruta o lista de rutas de archivos de entradas.
+        procesos (int, optional): Procesos para repartir los archivos por trozos (ver analizar_en_paralelo),
+            None para usar todos los nucleos. Defaults to 1.
+        resumenes (list, optional): Rutas de resumenes de meses compactados de entradas (ver Historico),
+            van antes que las lineas de los archivos. Defaults to ().
+    Returns:
+        dict: 'meses' (tupla (año, mes) -> {'total', 'por_dia' {día: n}, 'por_hora' {'HH': n}}, en orden de mes)
+            y 'estadisticas' de la lectura.
+    """
+    parcial, estadisticas = analizar_en_paralelo("entradas", rutas, procesos)
+    meses = _unir_entradas(_acumular_resumen_entradas(_leer(resumenes, interpretar_resumen, estadisticas), {}), parcial)
+    return {"meses": dict(sorted(meses.items())), "estadisticas": estadisticas}
+
+
+# ==== ANALISIS EN PARALELO ====
+# Los archivos se parten en trozos de bytes que empiezan y terminan en un salto de linea. Cada proceso calcula
+# los acumulados parciales de sus trozos y aqui se unen en el orden de los archivos, por eso el resultado es
+# el mismo que el de una sola lectura en serie.
+
+TAMANO_TROZO = 16 << 20 # 16 MiB por trozo, los archivos más pequeños se leen en serie
+
+ANALISIS = {
+    # tipo de archivo -> (interpretar linea, acumular registros, unir parciales)
+    "caja": (interpretar_caja, _acumular_caja, _unir_caja),
+    "entradas": (interpretar_entrada, _acumular_entradas, _unir_entradas),
+}
+
+def dividir_en_trozos(rutas, tamano_trozo: int = TAMANO_TROZO):
+    """_summary_
+        Parte los archivos en rangos de bytes de aproximadamente tamano_trozo, cortando siempre despues de un salto de linea.
+    Args:
+        rutas (str | list): Ruta o lista de rutas (las que no existen se omiten).
+        tamano_trozo (int, optional): Bytes aproximados de cada trozo. Defaults to TAMANO_TROZO.
+    Returns:
+        list: Lista de tuplas (ruta, inicio, fin) en el orden de los archivos.
+    """
+    trozos = []
+    for ruta in _lista_rutas(rutas):
+        if not os.path.exists(ruta):
+            continue
+        tamano = os.path.getsize(ruta)
+        inicio = 0
+        with open(ruta, "rb") as archivo:
+            while inicio < tamano:
+                fin = inicio + tamano_trozo
+                if fin >= tamano:
+                    fin = tamano
+                else:
+                    archivo.seek(fin)
+                    archivo.readline() # Se completa la linea donde cayó el corte
+                    fin = archivo.tell()
+                trozos.append((ruta, inicio, fin))
+                inicio = fin
+    return trozos
+
+def analizar_trozo(tipo_archivo: str, ruta: str, inicio: int, fin: int):
+    """_summary_
+        Trabajo de un proceso: acumulados parciales de las lineas de un rango de bytes de un archivo.
+    Args:
+        tipo_archivo (str): 'caja' o 'entradas'.
+        ruta (str): Ruta del archivo.
+        inicio (int): Primer byte del trozo (inicio de una linea).
+        fin (int): Byte siguiente al ultimo del trozo.
+    Returns:
+        tuple: (acumulados parciales, estadisticas del trozo sin contar el archivo).
+    """
+    interpretar, acumular, _ = ANALISIS[tipo_archivo]
+    estadisticas = nuevas_estadisticas()
+    estadisticas["bytes"] = fin - inicio
+    with open(ruta, "rb") as archivo:
+        archivo.seek(inicio)
+        # StringIO separa las lineas igual que open() en modo texto, asi las cuentas coinciden con la lectura en serie
+        lineas = list(io.StringIO(archivo.read(fin - inicio).decode("utf-8", "replace"), newline=None))
+    registros = [registro for registro in map(interpretar, lineas) if registro is not None]
+    estadisticas["lineas"] = len(lineas)
+    estadisticas["validas"] = len(registros)
+    estadisticas["malformadas"] = len(lineas) - len(registros)
+    return acumular(registros, {}), estadisticas
+
+def analizar_en_paralelo(tipo_archivo: str, rutas, procesos: int = None, tamano_trozo: int = TAMANO_TROZO):
+    """_summary_
+        Calcula los acumulados de los archivos repartiendo sus trozos en un ProcessPoolExecutor y uniendo los parciales.
+        Con un solo proceso o un solo trozo se hace una lectura en serie sin crear procesos.
+    Args:
+        tipo_archivo (str): 'caja' o 'entradas'.
+        rutas (str | list): Ruta o lista de rutas de archivos del tipo indicado.
+        procesos (int, optional): Numero maximo de procesos, None para usar todos los nucleos. Defaults to None.
+        tamano_trozo (int, optional): Bytes aproximados de cada trozo. Defaults to TAMANO_TROZO.
+    Returns:
+        tuple: (acumulados, estadisticas) iguales a los de una lectura en serie.
+    """
+    interpretar, acumular, unir = ANALISIS[tipo_archivo]
+    procesos = procesos or os.cpu_count() or 1
+    trozos = dividir_en_trozos(rutas, tamano_trozo) if procesos > 1 else []
+    if len(trozos) <= 1:
+        estadisticas = nuevas_estadisticas()
+        return acumular(_leer(rutas, interpretar, estadisticas), {}), estadisticas
+
+    estadisticas = nuevas_estadisticas()
+    estadisticas["archivos"] = sum(1 for ruta in _lista_rutas(rutas) if os.path.exists(ruta))
+    acumulados = {}
+    with ProcessPoolExecutor(max_workers=min(procesos, len(trozos))) as ejecutor:
+        parciales = ejecutor.map(analizar_trozo, *zip(*[(tipo_archivo, ruta, inicio, fin) for ruta, inicio, fin in trozos]))
+        for parcial, propias in parciales: # map entrega los resultados en el orden de los trozos
+            unir(acumulados, parcial)
+            for clave in ("bytes", "lineas", "validas", "malformadas"):
+                estadisticas[clave] += propias[clave]
+    return acumulados, estadisticas
+
+
+# ==== CARGA DE LA CAJA EN NUMPY ====
+# Cada archivo de caja se convierte una vez a un array estructurado (Caja.DTYPE_CAJA) que se guarda junto a él
+# como '<ruta>.npy', con su firma (tamaño y fecha de modificacion) en '<ruta>.npy.json'. Mientras la firma no cambie
+# el array se lee del cache sin interpretar lineas; con el libro por meses solo se vuelve a leer el mes abierto.
+
+def _firma(ruta: str):
+    estado = os.stat(ruta)
+    return [estado.st_size, estado.st_mtime_ns]
+
+def _caja_a_array(ruta: str, tipos, estadisticas: dict):
+    ordinales = {} # (año, mes, día) -> ordinal, la fecha se valida una sola vez por día
+    dias, segundos, centavos, codigos = [], [], [], []
+    for año, mes, dia, segundo, tipo, monto in leer_caja(ruta, estadisticas):
+        ordinal = ordinales.get((año, mes, dia))
+        if ordinal is None:
+            try:
+                ordinal = ordinales[(año, mes, dia)] = date(año, mes, dia).toordinal()
+            except ValueError:
+                estadisticas["validas"] -= 1 # Fecha imposible como 2025-02-30
+                estadisticas["malformadas"] += 1
+                continue
+        dias.append(ordinal)
+        segundos.append(segundo)
+        centavos.append(monto)
+        codigos.append(tipos.codigo(tipo))
+    registros = np.empty(len(dias), dtype=Caja.DTYPE_CAJA)
+    registros["dia"] = dias
+    registros["segundo"] = segundos
+    registros["centavos"] = centavos
+    registros["tipo"] = codigos
+    return registros
+
+def _resumen_a_array(ruta: str, tipos, estadisticas: dict):
+    # Cada linea de resumen (día, hora, tipo, cantidad, centavos) se expande a 'cantidad' registros del día y la hora,
+    # con los centavos repartidos entre ellos sin perder ninguno: los totales y cantidades por grupo son exactos
+    dias, horas, codigos, cantidades, centavos = [], [], [], [], []
+    for año, mes, dia, hora, tipo, cantidad, monto in _leer(ruta, interpretar_resumen, estadisticas):
+        try:
+            ordinal = date(año, mes, dia).toordinal()
+        except ValueError:
+            estadisticas["validas"] -= 1
+            estadisticas["malformadas"] += 1
+            continue
+        if cantidad > 0:
+            dias.append(ordinal)
+            horas.append(hora)
+            codigos.append(tipos.codigo(tipo))
+            cantidades.append(cantidad)
+            centavos.append(monto)
+    cantidades = np.array(cantidades, dtype=np.int64)
+    centavos = np.array(centavos, dtype=np.int64)
+    grupo = np.repeat(np.arange(len(cantidades)), cantidades)
+    posicion = np.arange(len(grupo)) - np.repeat(np.cumsum(cantidades) - cantidades, cantidades)
+    registros = np.empty(len(grupo), dtype=Caja.DTYPE_CAJA)
+    registros["dia"] = np.array(dias, dtype=np.int64)[grupo]
+    registros["segundo"] = np.array(horas, dtype=np.int64)[grupo] * 3600
+    registros["centavos"] = (centavos // np.maximum(cantidades, 1))[grupo] + (posicion < (centavos % np.maximum(cantidades, 1))[grupo])
+    registros["tipo"] = np.array(codigos, dtype=np.int64)[grupo]
+    return registros
+
+def _leer_cache(ruta: str, tipos):
+    # Array del cache con los codigos de la tabla de tipos dada, o None si no existe o la firma no coincide
+    try:
+        with open(ruta + ".npy.json", "r", encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        if datos["firma"] != _firma(ruta):
+            return None
+        registros = np.load(ruta + ".npy", allow_pickle=False)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if registros.dtype != Caja.DTYPE_CAJA:
+        return None
+    # Los codigos del cache son los de la tabla con la que se guardó, se traducen a los de la tabla actual
+    mapa = np.array([tipos.codigo(nombre) for nombre in datos["tipos"]], dtype=Caja.DTYPE_CAJA["tipo"])
+    if len(registros) and registros["tipo"].max() >= len(mapa):
+        return None
+    registros["tipo"] = mapa[registros["tipo"]]
+    return registros, datos["lineas"], datos["malformadas"]
+
+def _guardar_cache(ruta: str, firma: list, registros, tipos, lineas: int, malformadas: int):
+    temporal = ruta + ".tmp.npy"
+    np.save(temporal, registros, allow_pickle=False)
+    os.replace(temporal, ruta + ".npy")
+    with open(ruta + ".npy.json.tmp", "w", encoding="utf-8") as archivo:
+        json.dump({"firma": firma, "tipos": tipos.get_nombres(), "lineas": lineas, "malformadas": malformadas}, archivo)
+    os.replace(ruta + ".npy.json.tmp", ruta + ".npy.json")
+
+def cargar_caja_numpy(rutas, tipos, estadisticas: dict = None, resumenes=()):
+    """_summary_
+        Carga los archivos de caja de texto como un solo array estructurado de NumPy con columnas
+        'dia' (ordinal de la fecha), 'segundo' (hora), 'centavos' y 'tipo' (codigo de la tabla de tipos).
+        Cada archivo se lee del cache '<ruta>.npy' si su tamaño y fecha de modificacion no cambiaron,
+        si no se interpreta en una pasada y se vuelve a guardar el cache.
+    Args:
+        rutas (str | list): Ruta o lista de rutas de archivos de caja (los que no existen se omiten).
+        tipos (Caja.TiposCaja): Tabla de tipos con la que se codifica la columna 'tipo'.
+        estadisticas (dict, optional): Contadores de nuevas_estadisticas(), ademas 'desde_cache' con los archivos
+            que no se tuvieron que leer. Defaults to None.
+        resumenes (list, optional): Rutas de resumenes de meses compactados de la caja (ver Historico), cada grupo
+            se expande a sus ingresos con la hora en punto y los centavos del grupo repartidos. Defaults to ().
+    Returns:
+        np.ndarray: Array con dtype Caja.DTYPE_CAJA, primero los resumenes y luego los archivos en su orden.
+    """
+    if estadisticas is None:
+        estadisticas = nuevas_estadisticas()
+    estadisticas.setdefault("desde_cache", 0)
+    partes = []
+    archivos = [(ruta, _resumen_a_array) for ruta in _lista_rutas(resumenes)] + [(ruta, _caja_a_array) for ruta in _lista_rutas(rutas)]
+    for ruta, convertir in archivos:
+        if not os.path.exists(ruta):
+            continue
+        cache = _leer_cache(ruta, tipos)
+        if cache is not None:
+            registros, lineas, malformadas = cache
+            estadisticas["desde_cache"] += 1
+            estadisticas["archivos"] += 1
+            estadisticas["bytes"] += os.path.getsize(ruta)
+            estadisticas["lineas"] += lineas
+            estadisticas["validas"] += lineas - malformadas
+            estadisticas["malformadas"] += malformadas
+        else:
+            firma = _firma(ruta) # Se toma antes de leer, si el archivo crece durante la lectura el cache queda invalido
+            propias = nuevas_estadisticas()
+            registros = convertir(ruta, tipos, propias)
+            _guardar_cache(ruta, firma, registros, tipos, propias["lineas"], propias["malformadas"])
+            for clave, valor in propias.items():
+                estadisticas[clave] += valor
+        partes.append(registros)
+    if not partes:
+        return np.zeros(0, dtype=Caja.DTYPE_CAJA)
+    return np.concatenate(partes)
@@ -0,0 +1,243 @@
+import os
+from collections import deque
+from datetime import date, datetime, timedelta
+import Utils as ut
+
+# ==== OCUPACIÓN DEL GIMNASIO EN VIVO ====
+# Entradas.txt solo registra llegadas, para saber cuantas personas hay dentro habia que recorrerlo.
+# La ocupación se lleva en memoria con las entradas y salidas: un diccionario de los clientes dentro en orden
+# de llegada (los que no marcan salida vencen desde el principio al pasar el tiempo maximo) y una cola
+# monotona con los valores de ocupación que pueden ser el pico de la ventana. Cada hora cerrada se agrega
+# como una linea 'YYYY-MM-DD;HH;pico;al_cierre;entradas;salidas;vencidas' al archivo de ocupación.
+
+UNA_HORA = timedelta(hours=1)
+
+
+def linea_hora(hora: datetime, pico: int, al_cierre: int, entradas: int, salidas: int, vencidas: int):
+    """Linea del archivo de ocupación de una hora 'YYYY-MM-DD;HH;pico;al_cierre;entradas;salidas;vencidas'."""
+    return f"{hora:%Y-%m-%d};{hora:%H};{pico};{al_cierre};{entradas};{salidas};{vencidas}"
+
+def interpretar_hora(linea: str):
+    """_summary_
+        Interpreta una linea del archivo de ocupación.
+    Returns:
+        tuple: (fecha 'YYYY-MM-DD', hora, pico, al_cierre, entradas, salidas, vencidas) o None si la linea está malformada.
+    """
+    campos = linea.rstrip("\r\n").split(";")
+    if len(campos) != 7 or len(campos[0]) != 10:
+        return None
+    try:
+        return (campos[0], *map(int, campos[1:]))
+    except ValueError:
+        return None
+
+
+class OcupacionGimnasio:
+    """_summary_
+    Clase que representa la ocupación en vivo del gimnasio, alimentada por las entradas y salidas de los clientes.
+    La ocupación actual y el pico de la ventana se consultan en O(1) amortizado, sin leer el disco.
+    Los clientes que no marcan salida se dan por salidos al cumplir el tiempo maximo dentro.
+    Los momentos deben llegar en orden, uno anterior al ultimo procesado se toma como el ultimo.
+
+    Atributos:
+        __ruta (str): Ruta del archivo con la serie de ocupación por hora ('registros/Ocupacion.txt').
+        __capacidad (int): Aforo maximo del gimnasio.
+        __tiempo_maximo (timedelta): Tiempo dentro despues del cual una entrada sin salida vence.
+        __ventana (timedelta): Duración de la ventana del pico de ocupación.
+        __dentro (dict): ID de Cliente -> momento de entrada, en orden de llegada.
+        __ultimo (datetime): Ultimo momento procesado.
+        __picos (deque): Listas [fin, ocupacion] con ocupaciones decrecientes, fin es el momento del evento
+            siguiente (None para la ocupación actual). El primero es el pico de la ventana.
+        __hora (datetime): Inicio de la hora en curso, None si no hay eventos desde que se abrió o se cerró.
+        __pico_hora (int): Ocupación maxima de la hora en curso.
+        __entradas_hora (int): Entradas de la hora en curso.
+        __salidas_hora (int): Salidas de la hora en curso.
+        __vencidas_hora (int): Entradas que vencieron sin salida en la hora en curso.
+    """
+    def __init__(self, ruta: str, capacidad: int, tiempo_maximo_min: int = 180, ventana_min: int = 60):
+        self.__ruta = ruta
+        self.__capacidad = capacidad
+        self.__tiempo_maximo = timedelta(minutes=tiempo_maximo_min)
+        self.__ventana = timedelta(minutes=ventana_min)
+        self.__dentro = {}
+        self.__ultimo = None
+        self.__picos = deque()
+        self.__hora = None
+        self.__pico_hora = 0
+        self.__entradas_hora = 0
+        self.__salidas_hora = 0
+        self.__vencidas_hora = 0
+
+    # Métodos de acceso
+
+    def get_ruta(self):
+        return self.__ruta
+
+    def get_capacidad(self):
+        return self.__capacidad
+
+    def __len__(self):
+        return len(self.__dentro)
+
+    # Métodos
+
+    def __avanzar(self, momento: datetime):
+        # Lleva la ocupación hasta el momento: vence las entradas sin salida y cierra las horas terminadas
+        if momento is None:
+            momento = ut.ahora()
+        if self.__ultimo is not None and momento < self.__ultimo:
+            momento = self.__ultimo
+        while self.__dentro:
+            id_cliente, llegada = next(iter(self.__dentro.items()))
+            vence = llegada + self.__tiempo_maximo
+            if vence > momento:
+                break
+            self.__cambiar_hora(vence)
+            del self.__dentro[id_cliente]
+            self.__vencidas_hora += 1
+            self.__anotar(vence)
+        self.__cambiar_hora(momento)
+        self.__ultimo = momento
+        return momento
+
+    def __anotar(self, momento: datetime):
+        # Agrega la ocupación actual a la cola de picos, las anteriores que no la superan ya no pueden ser el pico
+        ocupacion = len(self.__dentro)
+        self.__pico_hora = max(self.__pico_hora, ocupacion)
+        if self.__picos:
+            self.__picos[-1][0] = momento # La ocupación anterior duró hasta este momento
+        while self.__picos and self.__picos[-1][1] <= ocupacion:
+            self.__picos.pop()
+        self.__picos.append([None, ocupacion])
+
+    def __cambiar_hora(self, momento: datetime):
+        # Si el momento es de otra hora, escribe la hora en curso y las horas sin eventos con gente dentro
+        if self.__hora is not None and self.__hora <= momento < self.__hora + UNA_HORA:
+            return
+        hora = momento.replace(minute=0, second=0, microsecond=0)
+        ocupacion = len(self.__dentro)
+        if self.__hora is not None:
+            lineas = [self.__linea_hora_actual()]
+            siguiente = self.__hora + UNA_HORA
+            while siguiente < hora and ocupacion:
+                lineas.append(linea_hora(siguiente, ocupacion, ocupacion, 0, 0, 0))
+                siguiente += UNA_HORA
+            self.__escribir(lineas)
+        self.__hora = hora
+        self.__pico_hora = ocupacion
+        self.__entradas_hora = self.__salidas_hora = self.__vencidas_hora = 0
+
+    def __linea_hora_actual(self):
+        return linea_hora(self.__hora, self.__pico_hora, len(self.__dentro),
+                          self.__entradas_hora, self.__salidas_hora, self.__vencidas_hora)
+
+    def __escribir(self, lineas: list):
+        carpeta = os.path.dirname(self.__ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        with open(self.__ruta, "a", encoding="utf-8") as archivo:
+            archivo.write("\n".join(lineas) + "\n")
+
+    def entrada(self, id_cliente: int, momento: datetime = None):
+        """_summary_
+            Registra la entrada de un cliente. Si ya estaba dentro solo se renueva su momento de entrada.
+        Args:
+            id_cliente (int): ID del Cliente.
+            momento (datetime, optional): Momento de la entrada. Defaults to None (ahora).
+        Returns:
+            bool: True si el cliente no estaba dentro (la ocupación sube).
+        """
+        momento = self.__avanzar(momento)
+        nuevo = self.__dentro.pop(id_cliente, None) is None # Se vuelve a insertar al final, en orden de llegada
+        self.__dentro[id_cliente] = momento
+        self.__entradas_hora += 1
+        if nuevo:
+            self.__anotar(momento)
+        return nuevo
+
+    def salida(self, id_cliente: int, momento: datetime = None):
+        """_summary_
+            Registra la salida de un cliente.
+        Args:
+            id_cliente (int): ID del Cliente.
+            momento (datetime, optional): Momento de la salida. Defaults to None (ahora).
+        Returns:
+            bool: True si el cliente estaba dentro, False si no entró o su entrada ya venció.
+        """
+        momento = self.__avanzar(momento)
+        if self.__dentro.pop(id_cliente, None) is None:
+            return False
+        self.__salidas_hora += 1
+        self.__anotar(momento)
+        return True
+
+    def ocupacion(self, momento: datetime = None):
+        """Retorna el numero de clientes dentro del gimnasio en el momento (por defecto ahora)."""
+        self.__avanzar(momento)
+        return len(self.__dentro)
+
+    def hay_cupo(self, momento: datetime = None):
+        """Retorna True si la ocupación en el momento (por defecto ahora) está por debajo de la capacidad."""
+        return self.ocupacion(momento) < self.__capacidad
+
+    def pico_ventana(self, momento: datetime = None):
+        """Retorna la ocupación maxima de la ventana que termina en el momento (por defecto ahora)."""
+        momento = self.__avanzar(momento)
+        limite = momento - self.__ventana
+        while self.__picos and self.__picos[0][0] is not None and self.__picos[0][0] <= limite:
+            self.__picos.popleft() # Dejó de estar vigente antes de la ventana
+        return self.__picos[0][1] if self.__picos else 0
+
+    def dentro(self):
+        """Retorna la lista de tuplas (id_cliente, momento de entrada) de los clientes dentro, en orden de llegada."""
+        return list(self.__dentro.items())
+
+    def serie_por_hora(self, desde: date = None, hasta: date = None):
+        """_summary_
+            Lee la serie de ocupación por hora del archivo y la completa con la hora en curso.
+            Las lineas repetidas de una misma hora (el programa se cerró y se abrió en la misma hora) se combinan.
+        Args:
+            desde (date, optional): Primera fecha incluida. Defaults to None.
+            hasta (date, optional): Ultima fecha incluida. Defaults to None.
+        Returns:
+            list: Diccionarios con 'fecha', 'hora', 'pico', 'al_cierre', 'entradas', 'salidas' y 'vencidas' en orden de hora.
+        """
+        lineas = []
+        if os.path.exists(self.__ruta):
+            with open(self.__ruta, "r", encoding="utf-8") as archivo:
+                lineas = archivo.readlines()
+        if self.__hora is not None:
+            lineas.append(self.__linea_hora_actual())
+        inicio = "" if desde is None else desde.isoformat()
+        fin = "9999-12-31" if hasta is None else hasta.isoformat()
+
+        horas = {}
+        for datos in map(interpretar_hora, lineas):
+            if datos is None or not (inicio <= datos[0] <= fin):
+                continue
+            fecha, hora, pico, al_cierre, entradas, salidas, vencidas = datos
+            if (fecha, hora) in horas:
+                anterior = horas[(fecha, hora)]
+                pico = max(pico, anterior["pico"])
+                entradas += anterior["entradas"]
+                salidas += anterior["salidas"]
+                vencidas += anterior["vencidas"]
+            horas[(fecha, hora)] = {"fecha": fecha, "hora": hora, "pico": pico, "al_cierre": al_cierre,
+                                    "entradas": entradas, "salidas": salidas, "vencidas": vencidas}
+        return [horas[clave] for clave in sorted(horas)]
+
+    def cerrar(self):
+        """Escribe la hora en curso al archivo, se llama al salir del programa. Los clientes dentro se conservan."""
+        if self.__hora is not None:
+            self.__escribir([self.__linea_hora_actual()])
+            self.__hora = None
+
+
+# Una sola OcupacionGimnasio por archivo, compartida por todos los que registran entradas y salidas
+_ocupaciones = {}
+
+def ocupacion_en_vivo(ruta: str, capacidad: int, tiempo_maximo_min: int = 180, ventana_min: int = 60):
+    """Retorna la OcupacionGimnasio compartida del archivo, creandola con los parametros dados con el primer uso."""
+    if ruta not in _ocupaciones:
+        _ocupaciones[ruta] = OcupacionGimnasio(ruta, capacidad, tiempo_maximo_min, ventana_min)
+    return _ocupaciones[ruta]
@@ -0,0 +1,435 @@
+import atexit
+import json
+import os
+import queue
+import threading
+
+# ==== ESCRITURA DE REGISTROS ====
+
+class EscritorRegistro:
+    """_summary_
+    Clase que representa un escritor persistente de un archivo de registros (por ejemplo 'registros/Caja.txt').
+    Mantiene el archivo abierto y acumula las lineas en memoria, escribiendolas al disco en grupo
+    cuando se juntan max_registros lineas, cuando pasan intervalo_ms milisegundos desde la primera pendiente,
+    o al cerrar el escritor. En modo durable cada escritura de grupo termina con os.fsync.
+    En modo binario se escriben registros de bytes tal cual, sin salto de linea (por ejemplo 'registros/Caja.bin').
+
+    Atributos:
+        __ruta (str): Ruta del archivo de registros.
+        __max_registros (int): Numero de lineas pendientes que provoca una escritura de grupo.
+        __intervalo (float): Segundos maximos que una linea puede quedar pendiente, None para no usar temporizador.
+        __durable (bool): Si es True se llama os.fsync despues de cada escritura de grupo.
+        __binario (bool): Si es True el archivo se abre en modo 'ab' y cada registro son bytes.
+        __archivo (file): Archivo abierto en modo 'a' (o 'ab'), se abre con la primera linea.
+        __pendientes (list): Lineas (o registros de bytes) aun no escritas al archivo.
+        __temporizador (threading.Timer): Temporizador de la escritura por intervalo.
+        __candado (threading.RLock): Protege las pendientes y el archivo entre el hilo principal y el temporizador.
+        __escrituras (int): Numero de escrituras de grupo realizadas.
+    """
+    def __init__(self, ruta: str, max_registros: int = 32, intervalo_ms: int = 500, durable: bool = False, binario: bool = False):
+        self.__ruta = ruta
+        self.__max_registros = max(1, max_registros)
+        self.__intervalo = intervalo_ms / 1000 if intervalo_ms else None
+        self.__durable = durable
+        self.__binario = binario
+        self.__archivo = None
+        self.__pendientes = []
+        self.__temporizador = None
+        self.__candado = threading.RLock()
+        self.__escrituras = 0
+
+    # Métodos de acceso
+
+    def get_ruta(self):
+        return self.__ruta
+
+    def get_pendientes(self):
+        return len(self.__pendientes)
+
+    def get_escrituras(self):
+        return self.__escrituras
+
+    def es_durable(self):
+        return self.__durable
+
+    # Métodos
+
+    def __abrir(self):
+        if self.__archivo is None:
+            if self.__binario:
+                self.__archivo = open(self.__ruta, "ab")
+            else:
+                self.__archivo = open(self.__ruta, "a", encoding="utf-8")
+            atexit.register(self.cerrar) # Si el programa termina sin cerrar el escritor no se pierden las pendientes
+
+    def escribir(self, linea):
+        """_summary_
+            Agrega una linea (sin salto de linea) a las pendientes y hace la escritura de grupo si se alcanzo max_registros.
+        Args:
+            linea (str | bytes): Linea a guardar en el archivo, o el registro de bytes en modo binario.
+        """
+        with self.__candado:
+            self.__abrir()
+            self.__pendientes.append(linea if self.__binario else linea + "\n")
+            if len(self.__pendientes) >= self.__max_registros:
+                self.vaciar()
+            elif self.__temporizador is None and self.__intervalo is not None:
+                self.__temporizador = threading.Timer(self.__intervalo, self.vaciar)
+                self.__temporizador.daemon = True
+                self.__temporizador.start()
+
+    def vaciar(self):
+        """_summary_
+            Escritura de grupo: escribe todas las lineas pendientes en una sola llamada y las envia al sistema operativo,
+            con os.fsync si el escritor es durable. Los lectores del archivo deben llamarlo antes de leer.
+        Returns:
+            int: Numero de lineas escritas.
+        """
+        with self.__candado:
+            if self.__temporizador is not None:
+                self.__temporizador.cancel()
+                self.__temporizador = None
+            if not self.__pendientes:
+                return 0
+            escritas = len(self.__pendientes)
+            self.__archivo.write((b"" if self.__binario else "").join(self.__pendientes))
+            self.__archivo.flush()
+            if self.__durable:
+                os.fsync(self.__archivo.fileno())
+            self.__pendientes = []
+            self.__escrituras += 1
+            return escritas
+
+    def cerrar(self):
+        """Escribe las lineas pendientes y cierra el archivo, se puede volver a escribir despues (se reabre)."""
+        with self.__candado:
+            if self.__archivo is None:
+                return
+            self.vaciar()
+            self.__archivo.close()
+            self.__archivo = None
+            atexit.unregister(self.cerrar)
+
+
+class EscritorEnCola:
+    """_summary_
+    Clase que representa un escritor de un archivo de registros con una cola en memoria y un hilo escritor en segundo plano
+    (por ejemplo 'registros/Entradas.txt'). escribir() solo pone la linea en la cola y retorna, el hilo escritor saca
+    todas las lineas que encuentre en la cola (hasta max_grupo) y las escribe en una sola llamada.
+    La cola tiene un maximo de lineas: si se llena, escribir() espera a que el hilo escritor libere espacio (contrapresion),
+    asi la memoria no crece sin limite cuando el disco es más lento que las entradas. Las lineas de escribir_lote()
+    cuentan una por una contra el maximo, el lote se pone en la cola en partes de hasta max_grupo lineas.
+    Al cerrar se escriben todas las lineas de la cola antes de terminar el hilo.
+
+    Atributos:
+        __ruta (str): Ruta del archivo de registros.
+        __max_cola (int): Maximo de lineas pendientes en la cola.
+        __max_grupo (int): Maximo de lineas por escritura de grupo.
+        __durable (bool): Si es True se llama os.fsync despues de cada escritura de grupo.
+        __cola (queue.Queue): Tuplas (texto con sus saltos de linea, numero de lineas), None indica al hilo escritor que termine.
+        __lineas_pendientes (int): Lineas en la cola que el hilo escritor aun no escribe.
+        __espacio (threading.Condition): Avisa a quien escribe cuando el hilo escritor libera lineas de la cola.
+        __hilo (threading.Thread): Hilo escritor, se inicia con la primera linea y termina al cerrar.
+        __candado (threading.Lock): Evita que se inicie o se cierre el hilo escritor mientras se agrega una linea.
+        __error (OSError): Error del hilo escritor al escribir, se lanza en la siguiente llamada de quien escribe.
+        __escrituras (int): Numero de escrituras de grupo realizadas.
+    """
+    def __init__(self, ruta: str, max_cola: int = 1024, max_grupo: int = 32, durable: bool = False):
+        self.__ruta = ruta
+        self.__max_cola = max(1, max_cola)
+        self.__max_grupo = max(1, max_grupo)
+        self.__durable = durable
+        self.__cola = queue.Queue()
+        self.__lineas_pendientes = 0
+        self.__espacio = threading.Condition()
+        self.__hilo = None
+        self.__candado = threading.Lock()
+        self.__error = None
+        self.__escrituras = 0
+
+    # Métodos de acceso
+
+    def get_ruta(self):
+        return self.__ruta
+
+    def get_pendientes(self):
+        return self.__lineas_pendientes
+
+    def get_escrituras(self):
+        return self.__escrituras
+
+    # Métodos
+
+    def __escribir_en_segundo_plano(self):
+        # Hilo escritor: espera el siguiente elemento y se lleva con él los que ya estan en la cola, hasta max_grupo lineas.
+        # El archivo se abre con el primer grupo y dentro del manejo de errores: si no se puede abrir (carpeta inexistente,
+        # permisos, disco lleno) el error queda para quien escribe y el hilo sigue vaciando la cola, se reintenta con el siguiente grupo
+        archivo = None
+        terminar = False
+        try:
+            while not terminar:
+                grupo = [self.__cola.get()]
+                cantidad = 0 if grupo[0] is None else grupo[0][1]
+                while cantidad < self.__max_grupo and grupo[-1] is not None:
+                    try:
+                        grupo.append(self.__cola.get_nowait())
+                    except queue.Empty:
+                        break
+                    cantidad += 0 if grupo[-1] is None else grupo[-1][1]
+                elementos = [elemento for elemento in grupo if elemento is not None]
+                terminar = len(elementos) < len(grupo)
+                try:
+                    if elementos:
+                        if archivo is None:
+                            archivo = open(self.__ruta, "a", encoding="utf-8")
+                        archivo.write("".join(texto for texto, _ in elementos))
+                        archivo.flush()
+                        if self.__durable:
+                            os.fsync(archivo.fileno())
+                        self.__escrituras += 1
+                except OSError as e:
+                    self.__error = e # El hilo sigue sacando lineas para no bloquear a quien escribe
+                finally:
+                    with self.__espacio:
+                        self.__lineas_pendientes -= cantidad
+                        self.__espacio.notify_all()
+                    for _ in grupo:
+                        self.__cola.task_done()
+        finally:
+            if archivo is not None:
+                archivo.close()
+
+    def __lanzar_error(self):
+        error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def __poner(self, lineas: list):
+        # Pone las lineas en la cola como un elemento, esperando a que el hilo escritor libere espacio para todas
+        self.__lanzar_error()
+        with self.__candado:
+            if self.__hilo is None:
+                self.__hilo = threading.Thread(target=self.__escribir_en_segundo_plano, name=f"Escritor {self.__ruta}", daemon=True)
+                self.__hilo.start()
+                atexit.register(self.cerrar) # Si el programa termina sin cerrar el escritor no se pierden las lineas de la cola
+            with self.__espacio:
+                while self.__lineas_pendientes and self.__lineas_pendientes + len(lineas) > self.__max_cola:
+                    self.__espacio.wait()
+                self.__lineas_pendientes += len(lineas)
+            self.__cola.put(("".join(linea + "\n" for linea in lineas), len(lineas)))
+
+    def escribir(self, linea: str):
+        """_summary_
+            Pone una linea (sin salto de linea) en la cola, esperando si la cola está llena.
+        Args:
+            linea (str): Linea a guardar en el archivo.
+        Raises:
+            OSError: Si el hilo escritor no pudo escribir un grupo anterior.
+        """
+        self.__poner([linea])
+
+    def escribir_lote(self, lineas: list):
+        """_summary_
+            Pone varias lineas (sin salto de linea) en la cola. Cada linea cuenta contra el maximo de la cola:
+            el lote entra en partes de hasta max_grupo lineas (y nunca más que el maximo de la cola),
+            esperando al hilo escritor cuando la cola está llena, como escribir().
+        Args:
+            lineas (list): Lineas a guardar en el archivo, en orden.
+        Raises:
+            OSError: Si el hilo escritor no pudo escribir un grupo anterior.
+        """
+        parte = min(self.__max_grupo, self.__max_cola)
+        for inicio in range(0, len(lineas), parte):
+            self.__poner(lineas[inicio:inicio + parte])
+
+    def vaciar(self):
+        """Espera a que el hilo escritor lleve al archivo todas las lineas de la cola, los lectores deben llamarlo antes de leer."""
+        self.__cola.join()
+        self.__lanzar_error()
+
+    def cerrar(self):
+        """Escribe las lineas de la cola, termina el hilo escritor y cierra el archivo, se puede volver a escribir despues."""
+        with self.__candado:
+            if self.__hilo is None:
+                return
+            self.__cola.put(None)
+            self.__hilo.join()
+            self.__hilo = None
+            atexit.unregister(self.cerrar)
+        self.__lanzar_error()
+
+
+# Un solo EscritorEnCola por archivo, compartido por todos los que escriben en él
+_escritores_en_cola = {}
+
+def escritor_en_cola(ruta: str, max_cola: int = 1024, max_grupo: int = 32, durable: bool = False):
+    """Retorna el EscritorEnCola compartido del archivo, creandolo con los parametros dados con el primer uso."""
+    if ruta not in _escritores_en_cola:
+        _escritores_en_cola[ruta] = EscritorEnCola(ruta, max_cola, max_grupo, durable)
+    return _escritores_en_cola[ruta]
+
+
+# ==== INDICE DE FECHAS ====
+
+class IndiceFechas:
+    """_summary_
+    Clase que representa un indice de un archivo de registros que empieza cada linea con la fecha 'YYYY-MM-DD'
+    (Caja.txt, los archivos mensuales de caja, Entradas.txt). Guarda para cada fecha los rangos de bytes [inicio, fin)
+    donde estan sus lineas, asi un reporte de un día hace seek() directo a sus lineas y lee solo esos bytes.
+    Se guarda en un archivo JSON junto al registro ('<ruta>.idx') con los bytes del registro ya indexados:
+    como los registros solo crecen al final, al usarlo solo se indexan las lineas agregadas desde entonces.
+    Si el archivo del indice no existe, está dañado o el registro es más pequeño, se reconstruye.
+
+    Atributos:
+        __ruta (str): Ruta del archivo de registros.
+        __ruta_indice (str): Ruta del archivo JSON del indice.
+        __bytes (int): Bytes del registro ya indexados.
+        __fechas (dict): Fecha 'YYYY-MM-DD' -> lista de rangos [inicio, fin) en bytes, normalmente uno solo.
+        __cargado (bool): True despues de leer el archivo del indice.
+    """
+    def __init__(self, ruta: str, ruta_indice: str = None):
+        self.__ruta = ruta
+        self.__ruta_indice = ruta_indice if ruta_indice else ruta + ".idx"
+        self.__bytes = 0
+        self.__fechas = {}
+        self.__cargado = False
+
+    # Métodos de acceso
+
+    def get_ruta(self):
+        return self.__ruta
+
+    def get_bytes(self):
+        return self.__bytes
+
+    # Métodos
+
+    def __cargar(self):
+        self.__cargado = True
+        try:
+            with open(self.__ruta_indice, "r", encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+            self.__bytes = int(datos["bytes"])
+            self.__fechas = {fecha: [list(rango) for rango in rangos] for fecha, rangos in datos["fechas"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.__bytes = 0 # Indice inexistente o dañado, se reconstruye
+            self.__fechas = {}
+
+    def actualizar(self):
+        """_summary_
+            Pone el indice al día indexando solo las lineas agregadas al registro desde la ultima vez, y lo guarda si cambió.
+        Returns:
+            int: Numero de lineas indexadas.
+        """
+        if not self.__cargado:
+            self.__cargar()
+        tamano = os.path.getsize(self.__ruta) if os.path.exists(self.__ruta) else 0
+        if tamano < self.__bytes:
+            self.__bytes = 0 # El registro fue reemplazado, se reconstruye
+            self.__fechas = {}
+        if tamano == self.__bytes:
+            return 0
+
+        indexadas = 0
+        posicion = self.__bytes
+        with open(self.__ruta, "rb") as archivo:
+            archivo.seek(posicion)
+            for linea in archivo:
+                if not linea.endswith(b"\n"):
+                    break # Linea incompleta, se indexa cuando termine de escribirse
+                fin = posicion + len(linea)
+                rangos = self.__fechas.setdefault(linea[:10].decode("utf-8", "replace"), [])
+                if rangos and rangos[-1][1] == posicion:
+                    rangos[-1][1] = fin # Las lineas de un mismo día suelen ser contiguas, se extiende el rango
+                else:
+                    rangos.append([posicion, fin])
+                posicion = fin
+                indexadas += 1
+        self.__bytes = posicion
+        self.guardar()
+        return indexadas
+
+    def reconstruir(self):
+        """Descarta el indice y lo vuelve a crear leyendo todo el registro. Retorna el numero de lineas indexadas."""
+        self.__cargado = True
+        self.__bytes = 0
+        self.__fechas = {}
+        indexadas = self.actualizar()
+        if indexadas == 0:
+            self.guardar()
+        return indexadas
+
+    def guardar(self):
+        """Guarda el indice en su archivo, reemplazandolo de forma atomica."""
+        temporal = self.__ruta_indice + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump({"bytes": self.__bytes, "fechas": self.__fechas}, archivo)
+        os.replace(temporal, self.__ruta_indice)
+
+    def fechas(self):
+        """Retorna la lista ordenada de fechas 'YYYY-MM-DD' que tienen lineas en el registro."""
+        self.actualizar()
+        return sorted(self.__fechas)
+
+    def rangos(self, fecha: str):
+        """Retorna la lista de rangos (inicio, fin) en bytes de las lineas de la fecha 'YYYY-MM-DD'."""
+        self.actualizar()
+        return [tuple(rango) for rango in self.__fechas.get(fecha, [])]
+
+    def lineas(self, fecha: str):
+        """_summary_
+            Lee solo las lineas de una fecha, con un seek() a cada uno de sus rangos.
+        Args:
+            fecha (str): Fecha 'YYYY-MM-DD'.
+        Returns:
+            list: Lineas de la fecha sin salto de linea, en el orden del registro.
+        """
+        lineas = []
+        rangos = self.rangos(fecha)
+        if not rangos:
+            return lineas
+        with open(self.__ruta, "rb") as archivo:
+            for inicio, fin in rangos:
+                archivo.seek(inicio)
+                lineas.extend(archivo.read(fin - inicio).decode("utf-8").splitlines())
+        return lineas
+
+
+# ==== LINEAS DE RESUMEN ====
+# Los meses compactados de un registro se guardan como lineas de resumen por día, hora y tipo:
+# 'YYYY-MM-DD;HH;tipo;cantidad' y, en los registros con montos (Caja), 'YYYY-MM-DD;HH;tipo;cantidad;centavos'.
+# Empiezan con la fecha como las lineas originales, asi tambien se pueden indexar con IndiceFechas.
+
+SUFIJO_RESUMEN = ".resumen.txt"
+
+def linea_resumen(fecha: str, hora: int, tipo: str, cantidad: int, centavos: int = None) -> str:
+    """Retorna la linea de resumen (sin salto de linea) de un grupo día, hora y tipo."""
+    linea = f"{fecha};{hora:02d};{tipo};{cantidad}"
+    return linea if centavos is None else f"{linea};{centavos}"
+
+def interpretar_resumen(linea: str):
+    """_summary_
+        Interpreta una linea de resumen 'YYYY-MM-DD;HH;tipo;cantidad[;centavos]'.
+    Returns:
+        tuple: (fecha 'YYYY-MM-DD', hora, tipo, cantidad, centavos o None) o None si la linea no es valida.
+    """
+    datos = linea.strip().split(";")
+    if len(datos) < 4 or len(datos[0]) != 10 or datos[0][4] != "-" or datos[0][7] != "-" or not datos[2]:
+        return None
+    try:
+        return datos[0], int(datos[1]), datos[2], int(datos[3]), int(datos[4]) if len(datos) > 4 else None
+    except ValueError:
+        return None
+
+if __name__ == "__main__":
+    # Reconstruye los indices de fechas, se ejecuta con:
+    #   python Registros.py indexar [archivos...]   (por defecto Entradas.txt y los libros de caja en registros/)
+    import glob
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "indexar":
+        rutas = sys.argv[2:] or [ruta for ruta in ["registros/Entradas.txt", "registros/Caja.txt"] if os.path.exists(ruta)] + sorted(glob.glob("registros/caja/Caja_*.txt"))
+        for ruta in rutas:
+            print(f"{ruta}: {IndiceFechas(ruta).reconstruir()} lineas indexadas")
+    else:
+        print("Uso: python Registros.py indexar [archivos...]")
@@ -1,4 +1,3 @@
-import numpy as np
 from datetime import date, timedelta, datetime
 import Utils as ut
 
@@ -14,6 +13,9 @@ class Entrenador:
         __telefono (int, optional): Número de teléfono del entrenador. Defaults to None.
         __especialidad (set): Especialidades del entrenador (Boxeo, Yoga, Aeróbicos).
     """
+    # Sin __dict__ por instancia para reducir la memoria de cada entrenador
+    __slots__ = ("__id_entrenador", "__nombre", "__telefono", "__especialidad")
+    
     def __init__(self, id_entrenador: int, nombre: str, especialidad: str, telefono: str = None):
         self.__id_entrenador = id_entrenador
         self.__nombre = nombre
@@ -49,18 +51,21 @@ class SesionEspecial:
     Atributos:
         __id_sesion (int): Identificador único de la sesión especial.
         __entrenador (Entrenador): Objeto entrenador que dirige la sesión.
-        __fecha (str): Fecha de la sesión especial.
+        __fecha (date): Fecha de la sesión especial, se entrega como str 'YYYY-MM-DD'.
         __cupos (int): Número actual de cupos ocupados.
         __maximo_cupos (int, optional): Numero maximo de cupos. Defaults to 25.
-        __inscritos (np.ndarray): Array que almacena los clientes inscritos en la sesión.
+        __inscritos (list): Lista que almacena los clientes inscritos en la sesión, crece solo al inscribir clientes.
     """
-    def __init__(self, id_sesion: int, entrenador, fecha: str, maximo_cupos: int = 25):
+    # Sin __dict__ por instancia para reducir la memoria de cada sesión
+    __slots__ = ("__id_sesion", "__entrenador", "__fecha", "__cupos", "__maximo_cupos", "__inscritos")
+    
+    def __init__(self, id_sesion: int, entrenador, fecha, maximo_cupos: int = 25):
         self.__id_sesion = id_sesion
         self.__entrenador = entrenador  # Ahora guarda el objeto Entrenador completo
-        self.__fecha = fecha
+        self.__fecha = ut.a_fecha(fecha) # Se acepta str 'YYYY-MM-DD' u Objeto date
         self.__cupos = 0
         self.__maximo_cupos = maximo_cupos
-        self.__inscritos = np.full(maximo_cupos, None, dtype=object) # Estamos guardando el objeto Cliente
+        self.__inscritos = [] # Estamos guardando el objeto Cliente, sin reservar los cupos por adelantado
     
     # Métodos de acceso y modificación
     
@@ -73,6 +78,9 @@ class SesionEspecial:
         else:
             print("No hay entrenador asignado a esta sesión.")
     
+    def tiene_entrenador(self):
+        return self.__entrenador is not None
+    
     def get_id_entrenador(self):
         """Método de compatibilidad para obtener el ID del entrenador"""
         if self.__entrenador:
@@ -81,10 +89,7 @@ class SesionEspecial:
             print("No hay entrenador asignado a esta sesión.")
     
     def get_fecha(self):
-        if isinstance(self.__fecha, str):
-            return self.__fecha
-        else:
-            return self.__fecha.strftime("%Y-%m-%d")
+        return self.__fecha.isoformat()
     
     def get_cupos(self):
         return self.__cupos
@@ -97,7 +102,7 @@ class SesionEspecial:
     
     def get_clientes_inscritos(self):
         """Devuelve una lista de clientes inscritos en la sesión"""
-        return [cliente for cliente in self.__inscritos if cliente is not None]
+        return list(self.__inscritos)
     
     def set_entrenador(self, entrenador):
         if self.__entrenador is None:
@@ -106,17 +111,9 @@ class SesionEspecial:
     
     # Metodos
     
-    def calcular_dias_restantes(self):
-        # Obtenemos el objeto date de la fecha actual
-        fecha_actual = date.today()
-        
-        # Convertir la fecha de la sesión a objeto date
-        fecha_sesion = datetime.strptime(self.__fecha, "%Y-%m-%d").date()
-        
-        # Calcular la diferencia en días
-        diferencia = (fecha_sesion - fecha_actual).days
-        
-        return diferencia
+    def calcular_dias_restantes(self, hoy: date=None):
+        # La fecha de la sesión ya es un Objeto date, solo se resta la fecha actual (o la dada)
+        return (self.__fecha - (hoy or ut.hoy())).days
     
     # Métodos para gestionar inscripciones
     def inscribir_cliente(self, cliente):
@@ -143,11 +140,16 @@ class SesionEspecial:
                 return False
         
         # Inscribir cliente
-        self.__inscritos[self.__cupos] = cliente # Guarda el objeto Cliente en la posición actual de cupos
+        self.__inscritos.append(cliente) # Guarda el objeto Cliente en la posición actual de cupos
         self.__cupos += 1 # Incrementa el contador de cupos
         print(f"Cliente {cliente.get_nombre()} inscrito exitosamente. Cupos: {self.__cupos}/{self.__maximo_cupos}")
         return True
     
+    def cargar_inscritos(self, clientes: list):
+        """Reemplaza los clientes inscritos sin usar la consola, se usa al cargar el estado guardado del gimnasio."""
+        self.__inscritos = list(clientes)
+        self.__cupos = len(self.__inscritos)
+    
     def editar_inscritos(self,id_cliente=None):  
         """_sumary_
             Cancela la inscripción de un cliente de la sesión.
@@ -180,7 +182,7 @@ class SesionEspecial:
         
         if id_cliente == 0:
             print("Cancelando todas las inscripciones...")
-            self.__inscritos = np.full(self.__maximo_cupos, None, dtype=object)
+            self.__inscritos = []
             self.__cupos = 0
             print(f"Todas las inscripciones canceladas. Cupos: {self.__cupos}/{self.__maximo_cupos}")
             return True
@@ -191,12 +193,8 @@ class SesionEspecial:
             for i in range(self.__cupos):
                 cliente = self.__inscritos[i]
                 if cliente is not None and cliente.get_id_cliente() == id_cliente:
-                    # Mover todos los elementos una posición hacia atrás
-                    for j in range(i, self.__cupos - 1):
-                        self.__inscritos[j] = self.__inscritos[j + 1]
-                    
-                    # Limpiar la última posición
-                    self.__inscritos[self.__cupos - 1] = None
+                    # Quitar el cliente, la lista mueve los siguientes una posición hacia atrás
+                    del self.__inscritos[i]
                     self.__cupos -= 1 # Decrementa el contador de cupos
                     eliminado = True
                     break # Salimos del bucle una vez encontrado el cliente
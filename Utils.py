@@ -1,9 +1,32 @@
+from datetime import date, datetime
+
 # ===== CONSTANTES DEL SISTEMA =====
 PRECIO_MEMBRESIA = 50000  # Precio mensual de la membresía
 PRECIO_ENTRADA_UNICA = 8000  # Precio de entrada por día
 
 # ===== FUNCIONES DE VALIDACIÓN =====
 
+# Validaciones sin mensajes, usadas por las operaciones que no imprimen en consola
+
+def es_numero(numero: str):
+    return numero.isdigit()
+
+def es_positivo(numero: str):
+    return numero.isdigit() and int(numero) > 0
+
+def es_texto(texto: str):
+    return texto.isalpha()
+
+def es_fecha(fecha: str):
+    # Fecha en formato YYYY-MM-DD
+    try:
+        datetime.strptime(fecha, "%Y-%m-%d")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+# Validaciones con mensajes de advertencia para la consola
+
 def is_number(numero: str, tipo = None):
     # Adveritencia
     
@@ -14,7 +37,7 @@ def is_number(numero: str, tipo = None):
     
     # Validacion
     
-    if numero.isalpha() or not numero.isdigit():
+    if not es_numero(numero):
         print(advertencia) # Imprime advertencia
         return False
     else:
@@ -30,7 +53,7 @@ def is_positve(numero: str, tipo = None):
     
     # Validacion
     
-    if numero.isalpha() or not numero.isdigit() or int(numero) <= 0:
+    if not es_positivo(numero):
         print(advertencia) # Imprime advertencia
         return False
     else:
@@ -46,7 +69,7 @@ def is_string(texto: str, tipo = None):
     
     # Validacion
     
-    if texto.isdigit() or not texto.isalpha():
+    if not es_texto(texto):
         print(advertencia) # Imprime advertencia
         return False
     else:
@@ -79,8 +102,54 @@ def yes_no(respuesta: str):
     else:
         return True
 
+# ===== RELOJ DEL SISTEMA =====
+
+# Funcion que retorna la fecha y hora actual del sistema. Los procesos por lotes y las pruebas
+# pueden fijarla con fijar_reloj para que todos los calculos usen el mismo "hoy".
+_reloj = datetime.now
+
+def ahora():
+    return _reloj()
+
+def hoy():
+    return _reloj().date()
+
+def fijar_reloj(momento=None):
+    """_summary_
+        Fija la fecha y hora que retornan ahora() y hoy().
+    Args:
+        momento (datetime | date | callable, optional): Momento fijo, o funcion sin argumentos que retorne un datetime.
+            Si es None se fija el momento actual. Defaults to None.
+    """
+    global _reloj
+    if momento is None:
+        momento = datetime.now()
+    if callable(momento):
+        _reloj = momento
+        return
+    if not isinstance(momento, datetime):
+        momento = datetime(momento.year, momento.month, momento.day)
+    _reloj = lambda: momento
+
+def restablecer_reloj():
+    # Vuelve a usar la fecha y hora real
+    global _reloj
+    _reloj = datetime.now
+
+def a_fecha(fecha):
+    # Convierte una fecha str 'YYYY-MM-DD' a Objeto date, si ya es date la retorna igual
+    if isinstance(fecha, datetime):
+        return fecha.date()
+    if isinstance(fecha, date):
+        return fecha
+    return date.fromisoformat(fecha)
+
 # ===== UTILIDADES =====
 
+def normalizar_nombre(nombre: str):
+    # Llave usada en los indices de busqueda por nombre (sin espacios extremos y en minusculas)
+    return nombre.strip().lower()
+
 def sp(i: int = None):
     if i:
         print("\n"*i)
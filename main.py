@@ -4,6 +4,7 @@ from datetime import date, timedelta, datetime
 import Utils as ut
 
 from Gimnasios import Gimnasio
+from Errores import ArchivoInvalido
 from Clientes import Cliente, Membresia
 from Sesiones import Entrenador, SesionEspecial
 
@@ -89,11 +90,12 @@ def menu_cliente(cliente):
         print("7. Registrar Entrada")
         print("8. Eliminar Cliente")
         print("9. Eliminar Membresía" , "(Sin Membresia)" if cliente.get_membresia() is None else "")
+        print("10. Registrar Salida")
         print("Enter para salir")
         opcion_cliente = input("Seleccione una opción : ")
         print(30*"=")
         ut.sp(2)
-        if opcion_cliente not in ["1", "2", "3", "4", "5", "6", "7", "8", "9", ""]:
+        if opcion_cliente not in ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", ""]:
             print("Opción fuera de rango. Por favor, ingrese una opción válida.")
             continue
         
@@ -122,7 +124,9 @@ def menu_cliente(cliente):
                 Gym.pago_ingreso_unico(cliente)
                 input("\nPresione Enter para continuar...")
             case "7":
-                cliente.registrar_entrada("General") # Pensar de que clase hacerlo
+                # Con el gimnasio lleno se avisa antes de registrar la entrada
+                if Gym.ocupacion_actual()["hay_cupo"] or ut.yes_no(input("⚠️ El gimnasio está en su capacidad máxima. ¿Registrar la entrada? (si/no): ")):
+                    cliente.registrar_entrada("General") # Pensar de que clase hacerlo
                 input("\nPresione Enter para continuar...")
             case "8":
                 if Gym.eliminar_cliente(cliente=cliente):
@@ -135,6 +139,9 @@ def menu_cliente(cliente):
             case "9":
                 Gym.eliminar_membresia(cliente)
                 input("\nPresione Enter para continuar...")
+            case "10":
+                cliente.registrar_salida()
+                input("\nPresione Enter para continuar...")
             case "":
                 print("Saliendo del menú de cliente...")
                 break
@@ -160,7 +167,7 @@ def menu_membresia(membresia, cliente=None):
                 membresia.ver_info()
                 input("\nPresione Enter para continuar...")
             case "2":
-                Gym.pagar_membresia(membresia)
+                Gym.pagar_membresia(membresia, cliente)
                 input("\nPresione Enter para continuar...")
             case "3":
                 Gym.renovar_membresia(membresia=membresia, cliente=cliente)
@@ -286,11 +293,16 @@ def menu_datos():
         print("5. Exportar Clientes")
         print("6. Cargar Clientes")
         print("7. Exportar Entrenadores")
+        print("8. Vencimientos Próximos")
+        print("9. Reconstruir Índices de Registros")
         print("10. Exportar Gimansio.JSON")
+        print("11. Comparativo de Ingresos")
+        print("12. Compactar Registros Antiguos")
+        print("13. Ocupación del Gimnasio")
         print("Enter para salir")
         opcion_datos = input("Seleccione una opción : ")
         
-        if opcion_datos not in ["1", "2", "3", "4", "5", "6", "7", "10", ""]:
+        if opcion_datos not in ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", ""]:
             print("Opción fuera de rango. Por favor, ingrese una opción válida.")
             continue
         
@@ -316,11 +328,26 @@ def menu_datos():
             case "7":
                 Gym.exportar_entrenadores()
                 input("\nPresione Enter para continuar...")
+            case "8":
+                Gym.vencimientos_proximos()
+                input("\nPresione Enter para continuar...")
+            case "9":
+                Gym.reconstruir_indices()
+                input("\nPresione Enter para continuar...")
             case "10":
                 archivo_creado = Gym.exportar_datos_json()
                 if archivo_creado:
                     print(f"Los datos se han guardado en: {archivo_creado}")
                 input("\nPresione Enter para continuar...")
+            case "11":
+                Gym.comparativo_ingresos()
+                input("\nPresione Enter para continuar...")
+            case "12":
+                Gym.compactar_historico()
+                input("\nPresione Enter para continuar...")
+            case "13":
+                Gym.mostrar_ocupacion()
+                input("\nPresione Enter para continuar...")
             case "":
                 print("Saliendo del menú de datos...")
                 break
@@ -364,7 +391,16 @@ def App():
     # Gym.crear_cliente("Ricardo", "90901234", "3278901235")
     # Gym.crear_cliente("Fernanda", "11012345", "3189012346")
     
-    Gym.cargar_clientes("clientes.txt")
+    # Si hay un estado guardado al salir se carga en una fraccion de segundo y el efectivo se pone al día con el
+    # libro de caja, si no (primera ejecucion o libro de caja modificado) se cargan los clientes de clientes.txt
+    try:
+        estado = Gym.cargar_estado()
+        print(f"✓ Estado cargado: {estado['clientes']} clientes, {estado['membresias']} membresías, "
+              f"{estado['entrenadores']} entrenadores y {estado['sesiones']} sesiones")
+        print(f"✓ Ingresos de caja posteriores: {estado['ingresos_reproducidos']}, efectivo actual: ${estado['efectivo']:,}")
+    except ArchivoInvalido as e:
+        print(f"✗ {e}")
+        Gym.cargar_clientes("clientes.txt")
     
     print("=== Todos los clientes registrados ===")
     
@@ -372,17 +408,22 @@ def App():
     Gym.visualizar_clientes()
     ut.sp(2)
     
-    menu()
-    
-    # Gym.exportar_clientes()
-    
-    # Exportación automática al finalizar (opcional)
-    exportar_datos_rapido()
+    try:
+        menu()
+        
+        # Gym.exportar_clientes()
+        
+        # Exportación automática al finalizar (opcional)
+        exportar_datos_rapido()
+    finally:
+        Gym.guardar_estado() # Punto de control para el siguiente inicio
+        Gym.cerrar() # Escribe los registros de caja pendientes antes de salir
     
     # print(Gym.get())
 
 
 if __name__ == "__main__":
+    # El efectivo dado es el fondo inicial de la primera ejecucion, despues se toma del estado guardado
     Gym = Gimnasio("Body Force","Barrio Candelilla", "3001234545", "body@force.com", 45000)
     Gym.ver_info()
     App()